@@ -0,0 +1,88 @@
+"""
+Benchmark loading sprites through the on-disk asset cache
+
+Run from the project root:
+    python benchmarks/bench_assets.py [image count]
+    
+Times the game's startup sprite loading (the profile pictures) without
+an asset cache, with an empty (cold) cache that has to decode every image
+and save its pixels, and with the cache filled (warm). Then does the same
+for generated images of random sizes, loaded at their own size and at
+half size.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import PROFILE_PICTURES
+from storage.asset_cache import AssetCache
+from ui.sprite_manager import SpriteManager
+
+RUNS = 20
+
+
+def write_images(folder, count):
+    rng = random.Random(1)
+    images = {}
+    for i in range(count):
+        size = (rng.randint(64, 256), rng.randint(64, 256))
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for _ in range(20):
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.randrange(128, 256))
+            pygame.draw.circle(surface, color, (rng.randrange(size[0]), rng.randrange(size[1])), rng.randint(4, 40))
+        images[f"sprite_{i}"] = path = os.path.join(folder, f"sprite_{i}.png")
+        pygame.image.save(surface, path)
+    return images
+
+
+def time_startup(cache_folder):
+    """Best time of the game's sprite loading, and the first run's"""
+    times = []
+    for _ in range(RUNS):
+        asset_cache = AssetCache(cache_folder) if cache_folder else None
+        sprite_manager = SpriteManager(asset_cache=asset_cache)
+        start = time.perf_counter()
+        sprite_manager.load_sprites(PROFILE_PICTURES)
+        times.append(time.perf_counter() - start)
+    return times[0], min(times)
+
+
+def time_images(images, scale, cache_folder):
+    asset_cache = AssetCache(cache_folder) if cache_folder else None
+    sprite_manager = SpriteManager(asset_cache=asset_cache)
+    start = time.perf_counter()
+    for name, path in images.items():
+        sprite_manager.load_sprite(name, path, scale)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pygame.init()
+    pygame.display.set_mode((640, 480))
+    
+    with tempfile.TemporaryDirectory() as folder:
+        _, uncached = time_startup(None)
+        cold, warm = time_startup(os.path.join(folder, "startup_cache"))
+        print("Startup sprites (profile pictures)")
+        print(f"  no asset cache  {uncached * 1000:8.2f} ms")
+        print(f"  cold cache      {cold * 1000:8.2f} ms")
+        print(f"  warm cache      {warm * 1000:8.2f} ms")
+        
+        images = write_images(folder, count)
+        for scale in (1.0, 0.5):
+            cache_folder = os.path.join(folder, f"cache_{scale}")
+            uncached = time_images(images, scale, None)
+            cold = time_images(images, scale, cache_folder)
+            warm = time_images(images, scale, cache_folder)
+            print(f"{count} images at scale {scale}")
+            print(f"  no asset cache  {uncached * 1000:8.2f} ms")
+            print(f"  cold cache      {cold * 1000:8.2f} ms")
+            print(f"  warm cache      {warm * 1000:8.2f} ms")
+    pygame.quit()
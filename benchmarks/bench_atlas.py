@@ -0,0 +1,70 @@
+"""
+Benchmark packing sprites into an atlas
+
+Run from the project root:
+    python benchmarks/bench_atlas.py [sprite count]
+    
+Writes sprite images of random sizes to a temporary folder, then loads
+them one surface each with load_sprite, and packed with load_atlas, first
+packing them and saving the layout, then again reusing the saved layout.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from ui.atlas import pack_shelves
+from ui.sprite_manager import SpriteManager
+
+
+def write_images(folder, count):
+    rng = random.Random(1)
+    images = {}
+    for i in range(count):
+        surface = pygame.Surface((rng.randint(16, 96), rng.randint(16, 96)), pygame.SRCALPHA)
+        surface.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256), 255))
+        images[f"sprite_{i}"] = path = os.path.join(folder, f"sprite_{i}.png")
+        pygame.image.save(surface, path)
+    return images
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    pygame.display.set_mode((640, 480))
+    
+    with tempfile.TemporaryDirectory() as folder:
+        images = write_images(folder, count)
+        layout_path = os.path.join(folder, "sprite_atlas.json")
+        
+        separate = SpriteManager()
+        separate_time, _ = timed(lambda: [separate.load_sprite(name, path) for name, path in images.items()])
+        
+        packed = SpriteManager()
+        packed_time, _ = timed(lambda: packed.load_atlas(images, layout_path))
+        reused = SpriteManager()
+        reused_time, _ = timed(lambda: reused.load_atlas(images, layout_path))
+        
+        sizes = {name: separate.get_sprite(name).get_size() for name in images}
+        pack_time, (_, pages) = timed(lambda: pack_shelves(sizes, (1024, 1024)))
+        used = sum(width * height for width, height in sizes.values())
+        area = sum(width * height for width, height in pages)
+        
+    print(f"{count} sprites")
+    print(f"  load_sprite each          {separate_time * 1000:8.1f} ms, {count} surfaces")
+    print(f"  load_atlas, packing       {packed_time * 1000:8.1f} ms, {len(pages)} pages "
+          f"({used / area:.0%} of their area used)")
+    print(f"  load_atlas, saved layout  {reused_time * 1000:8.1f} ms")
+    print(f"  shelf packing alone       {pack_time * 1000:8.1f} ms")
+    pygame.quit()
@@ -0,0 +1,72 @@
+"""
+Benchmark drawing a screen full of buttons
+
+Run from the project root:
+    python benchmarks/bench_buttons.py
+    
+Compares drawing with the cached state surfaces against rendering every
+button from scratch each frame, which is what Button.draw used to do.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ui.buttons import IngredientButton, ToolButton, Button
+
+BUTTON_COUNT = 500
+FRAMES = 200
+
+
+def make_buttons(rng):
+    """Lay out a grid of ingredient, tool and plain buttons"""
+    buttons = []
+    columns = 20
+    for i in range(BUTTON_COUNT):
+        x = (i % columns) * 50
+        y = (i // columns) * 28
+        kind = (IngredientButton, ToolButton, Button)[i % 3]
+        button = kind(x, y, 48, 26, f"item {i}", font_size=14)
+        if hasattr(button, "selected"):
+            button.selected = rng.random() < 0.3
+        buttons.append(button)
+    return buttons
+
+
+def draw_frames(screen, buttons, rng, cached):
+    """Draw every button each frame, moving the hover around"""
+    times = []
+    for _ in range(FRAMES):
+        hovered = rng.randrange(len(buttons))
+        for i, button in enumerate(buttons):
+            button.hovered = i == hovered
+            
+        start = time.perf_counter()
+        screen.fill((0, 0, 0))
+        for button in buttons:
+            if not cached:
+                button._surfaces.clear()
+            button.draw(screen)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return sum(times) / len(times), times[int(len(times) * 0.99)]
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    buttons = make_buttons(random.Random(BUTTON_COUNT))
+    
+    uncached_mean, uncached_p99 = draw_frames(screen, buttons, random.Random(1), cached=False)
+    cached_mean, cached_p99 = draw_frames(screen, buttons, random.Random(1), cached=True)
+    
+    print(f"{BUTTON_COUNT} buttons, {FRAMES} frames (mean / p99 per frame)")
+    print(f"  rendered every frame  {uncached_mean * 1000:8.3f} / {uncached_p99 * 1000:.3f} ms")
+    print(f"  cached state surfaces {cached_mean * 1000:8.3f} / {cached_p99 * 1000:.3f} ms")
+    print(f"  speedup               {uncached_mean / cached_mean:8.1f}x")
+    pygame.quit()
@@ -0,0 +1,84 @@
+"""
+Benchmark importing a large synthetic content pack
+
+Run from the project root:
+    python benchmarks/bench_content_packs.py [recipe count]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import PACK_RECIPES_CATALOG_FILE
+from logic.content_packs import ContentPackImporter
+from logic.kitchen import Kitchen
+from logic.recipe_logic import RecipeSystem
+from storage.save_manager import SaveManager
+
+RECIPE_COUNT = 1_000_000
+INGREDIENT_COUNT = 200
+TOOL_COUNT = 20
+INVALID_EVERY = 50  # Every nth recipe uses an ingredient the pack doesn't define
+
+
+def write_pack(path, recipe_count, rng):
+    """Write a synthetic pack one recipe at a time"""
+    ingredients = [f"pack ingredient {i}" for i in range(INGREDIENT_COUNT)]
+    tools = [f"pack tool {i}" for i in range(TOOL_COUNT)]
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{\n  "name": "Benchmark pack",\n')
+        file.write(f'  "ingredients": {json.dumps([{"name": name, "cost": 25} for name in ingredients])},\n')
+        file.write(f'  "tools": {json.dumps([{"name": name} for name in tools])},\n')
+        file.write('  "recipes": [\n')
+        for i in range(recipe_count):
+            recipe_ingredients = rng.sample(ingredients, rng.randint(2, 6))
+            if i % INVALID_EVERY == 0:
+                recipe_ingredients.append("mystery meat")
+            recipe = {
+                "name": f"Pack Recipe {i}",
+                "ingredients": recipe_ingredients,
+                "tools": rng.sample(tools, rng.randint(1, 2)),
+                "cooking_time": rng.randint(20, 120),
+                "difficulty": rng.randint(1, 5)
+            }
+            file.write(("    " if i == 0 else ",\n    ") + json.dumps(recipe))
+        file.write("\n  ]\n}\n")
+
+
+def run(path, workers):
+    """Import the pack into a fresh kitchen and recipe system"""
+    if os.path.exists(PACK_RECIPES_CATALOG_FILE):
+        os.remove(PACK_RECIPES_CATALOG_FILE)  # Left by the previous run
+    save_manager = SaveManager()  # Saves go to the temporary directory
+    importer = ContentPackImporter(
+        Kitchen(save_manager), RecipeSystem(save_manager), workers=workers, pool_min_bytes=0
+    )
+    report = importer.import_pack(path)
+    print(f"  {workers:>2} worker(s): {report.summary()}")
+    return report
+
+
+if __name__ == "__main__":
+    recipe_count = int(sys.argv[1]) if len(sys.argv) > 1 else RECIPE_COUNT
+    with tempfile.TemporaryDirectory() as directory:
+        # The game's save files are relative to the working directory
+        os.chdir(directory)
+        path = os.path.join(directory, "benchmark_pack.json")
+        
+        start = time.perf_counter()
+        write_pack(path, recipe_count, random.Random(recipe_count))
+        print(f"{recipe_count} recipe pack, {os.path.getsize(path) / 1e6:.0f} MB "
+              f"(written in {time.perf_counter() - start:.1f}s)")
+              
+        run(path, 1)
+        run(path, max(os.cpu_count() or 1, 2))
+        
+        # Later starts only open the compiled pack catalog
+        start = time.perf_counter()
+        recipe_system = RecipeSystem(SaveManager())
+        print(f"Next start: {len(recipe_system.recipes)} recipes loaded in "
+              f"{(time.perf_counter() - start) * 1000:.0f}ms")
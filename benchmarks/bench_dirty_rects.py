@@ -0,0 +1,92 @@
+"""
+Benchmark full redraws against dirty rect rendering of the game scene
+
+Run from the project root:
+    python benchmarks/bench_dirty_rects.py
+    
+Times rendering plus updating the display for a few seconds of play with
+customers waiting, the clock running and the mouse moving over buttons.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, MAX_CUSTOMERS
+from player import Player
+from logic.customer import CustomerSystem, Customer
+from scenes.game_loop import GameScene
+from storage.save_manager import SaveManager
+
+FRAMES = 600
+
+
+class Clock:
+    """Stand-in for the day clock the game scene shows"""
+    
+    def __init__(self):
+        self.day = 1
+        self.minutes = 8 * 60
+        
+    def get_formatted_time(self):
+        hours, minutes = divmod(int(self.minutes), 60)
+        return f"{(hours - 1) % 12 + 1}:{minutes:02d} {'AM' if hours < 12 else 'PM'}"
+        
+    def get_day_progress(self):
+        return (self.minutes - 8 * 60) / (8 * 60)
+
+
+def make_scene():
+    save_manager = SaveManager()  # Never flushed, so nothing is written
+    customer_system = CustomerSystem(None)  # Customers are added by hand
+    for i in range(MAX_CUSTOMERS):
+        customer_system.customers.append(Customer(f"Customer {i}", 60 + i * 20, "Adobo", 100))
+    scene = GameScene(Player(save_manager), customer_system, game_instance=Clock())
+    scene.show_quote = False
+    return scene
+
+
+def run(screen, dirty):
+    scene = make_scene()
+    rng = random.Random(1)
+    times = []
+    for frame in range(FRAMES):
+        # Customers lose patience and the clock moves every frame
+        for customer in scene.customer_system.customers:
+            customer.patience -= 1 / 60
+        scene.game_instance.minutes += 0.5
+        if frame % 10 == 0:
+            x = rng.randrange(SCREEN_WIDTH)
+            for button in (scene.cooking_button, scene.upgrade_button, scene.menu_button):
+                button.is_hovered((x, button.rect.centery))
+                
+        start = time.perf_counter()
+        if dirty:
+            rects = scene.render_dirty(screen, full=frame == 0)
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+        else:
+            scene.render(screen)
+            pygame.display.flip()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return sum(times) / len(times), times[int(len(times) * 0.99)]
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    full_mean, full_p99 = run(screen, dirty=False)
+    dirty_mean, dirty_p99 = run(screen, dirty=True)
+    
+    print(f"Game scene, {FRAMES} frames (mean / p99 per frame)")
+    print(f"  full redraw + flip    {full_mean * 1000:8.3f} / {full_p99 * 1000:.3f} ms")
+    print(f"  dirty rects + update  {dirty_mean * 1000:8.3f} / {dirty_p99 * 1000:.3f} ms")
+    pygame.quit()
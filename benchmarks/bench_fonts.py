@@ -0,0 +1,86 @@
+"""
+Benchmark font loading at startup and during the pause menu animation
+
+Run from the project root:
+    python benchmarks/bench_fonts.py
+    
+"Uncached" clears the font registry before every scene and every frame,
+which is what creating fonts with pygame.font.SysFont directly cost.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_WARMUP_SIZES, PAUSE_TITLE_FONT_SIZES
+from scenes.menu import MainMenu
+from scenes.game_loop import GameScene
+from scenes.about_scene import AboutScene
+from ui.animation_manager import Animation
+from ui.fonts import clear_fonts, warm_up, get_font_stats
+
+SCENE_BUILDS = 20
+PAUSE_FRAMES = 30  # Frames in one pass of the pause animation
+PASSES = 10
+
+
+def build_scenes(cached):
+    """Build a few scenes the way Game.__init__ does"""
+    start = time.perf_counter()
+    for _ in range(SCENE_BUILDS):
+        for build in (MainMenu, lambda: GameScene(None, None), AboutScene):
+            if not cached:
+                clear_fonts()
+            build()
+    return (time.perf_counter() - start) / SCENE_BUILDS
+
+
+def pause_frames(scene, screen, cached):
+    """Render the pause menu through its opening animation"""
+    animation = Animation(1.0)
+    scene.animation_manager.add_animation("pause_menu", animation)
+    times = []
+    for _ in range(PASSES):
+        for frame in range(PAUSE_FRAMES):
+            animation.elapsed = frame / (PAUSE_FRAMES - 1)
+            if not cached:
+                clear_fonts()
+            start = time.perf_counter()
+            scene._render_pause_menu(screen)
+            times.append(time.perf_counter() - start)
+    times.sort()
+    return sum(times) / len(times), times[int(len(times) * 0.99)]
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    uncached_build = build_scenes(cached=False)
+    clear_fonts()
+    start = time.perf_counter()
+    warm_up(FONT_WARMUP_SIZES)
+    warm_up(PAUSE_TITLE_FONT_SIZES)
+    warm_up_time = time.perf_counter() - start
+    warm_up_count = get_font_stats()["fonts"]
+    cached_build = build_scenes(cached=True)
+    
+    scene = GameScene(None, None)
+    uncached_mean, uncached_p99 = pause_frames(scene, screen, cached=False)
+    warm_up(FONT_WARMUP_SIZES)
+    warm_up(PAUSE_TITLE_FONT_SIZES)
+    cached_mean, cached_p99 = pause_frames(scene, screen, cached=True)
+    
+    print(f"Warming up {warm_up_count} fonts: "
+          f"{warm_up_time * 1000:.1f} ms")
+    print("Building menu, game and about scenes")
+    print(f"  uncached  {uncached_build * 1000:8.2f} ms")
+    print(f"  registry  {cached_build * 1000:8.2f} ms")
+    print("Pause menu frame (mean / p99)")
+    print(f"  uncached  {uncached_mean * 1000:8.3f} / {uncached_p99 * 1000:.3f} ms")
+    print(f"  registry  {cached_mean * 1000:8.3f} / {cached_p99 * 1000:.3f} ms")
+    print(f"Registry: {get_font_stats()}")
+    pygame.quit()
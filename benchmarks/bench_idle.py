@@ -0,0 +1,64 @@
+"""
+Benchmark CPU use while the game sits on a static screen
+
+Run from the project root:
+    python benchmarks/bench_idle.py [seconds]
+    
+Runs the real game loop on the main menu with no input, with and without
+idle throttling, and reports the CPU time it used. The game runs in a
+temporary copy of data/, so no saves in the project are touched.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+import pygame
+import main
+from ui.fonts import clear_fonts
+
+SECONDS = 5
+
+
+def run(seconds, throttling):
+    """Run the game untouched on the menu, then quit"""
+    main.IDLE_THROTTLING = throttling
+    game = main.Game()
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), loops=1)
+    
+    flips = [0]
+    flip = pygame.display.flip
+    def counting_flip():
+        flips[0] += 1
+        flip()
+    pygame.display.flip = counting_flip
+    
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        game.run()
+    except SystemExit:
+        pass
+    finally:
+        pygame.display.flip = flip
+        clear_fonts()  # They belong to the pygame instance run() shut down
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return cpu / wall, flips[0]
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else SECONDS
+    with tempfile.TemporaryDirectory() as directory:
+        shutil.copytree(os.path.join(ROOT, "data"), os.path.join(directory, "data"))
+        os.chdir(directory)
+        
+        busy_cpu, busy_frames = run(seconds, throttling=False)
+        idle_cpu, idle_frames = run(seconds, throttling=True)
+        
+    print(f"Main menu, {seconds:g} s without input (CPU use / frames drawn)")
+    print(f"  every frame          {busy_cpu * 100:6.1f}% / {busy_frames}")
+    print(f"  idle throttling      {idle_cpu * 100:6.1f}% / {idle_frames}")
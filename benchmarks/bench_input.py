@@ -0,0 +1,87 @@
+"""
+Benchmark routing mouse input to buttons
+
+Run from the project root:
+    python benchmarks/bench_input.py
+    
+Compares polling every button for hover and clicks each frame with the
+InputDispatcher, which only checks the buttons in the grid cell under the
+mouse, for screens with more and more buttons.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ui.buttons import Button
+from ui.input_dispatcher import InputDispatcher
+
+FRAMES = 2000
+EVENTS_PER_FRAME = 3  # Motion events, and a click now and then
+
+
+def make_buttons(count):
+    """Lay out buttons in a grid filling the screen"""
+    columns = max(1, int((count * SCREEN_WIDTH / SCREEN_HEIGHT) ** 0.5))
+    rows = -(-count // columns)
+    width, height = SCREEN_WIDTH // columns, SCREEN_HEIGHT // rows
+    return [
+        Button((i % columns) * width, (i // columns) * height, width - 2, height - 2, f"{i}")
+        for i in range(count)
+    ]
+
+
+def make_frames():
+    rng = random.Random(1)
+    frames = []
+    for frame in range(FRAMES):
+        pos = (rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT))
+        events = [pygame.event.Event(pygame.MOUSEMOTION, pos=pos) for _ in range(EVENTS_PER_FRAME)]
+        if frame % 10 == 0:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+        frames.append((pos, events))
+    return frames
+
+
+def run_polling(buttons, frames):
+    start = time.perf_counter()
+    clicks = 0
+    for mouse_pos, events in frames:
+        for button in buttons:
+            button.is_hovered(mouse_pos)
+        for event in events:
+            for button in buttons:
+                if button.is_clicked(mouse_pos, event):
+                    clicks += 1
+    return (time.perf_counter() - start) / len(frames), clicks
+
+
+def run_dispatcher(buttons, frames):
+    start = time.perf_counter()
+    dispatcher = InputDispatcher(buttons)
+    clicks = 0
+    for mouse_pos, events in frames:
+        dispatcher.update_hover(mouse_pos)
+        for event in events:
+            if dispatcher.get_clicked(event) is not None:
+                clicks += 1
+    return (time.perf_counter() - start) / len(frames), clicks
+
+
+if __name__ == "__main__":
+    pygame.init()
+    frames = make_frames()
+    
+    print(f"Mouse input, {FRAMES} frames (time per frame)")
+    for count in (9, 100, 1000, 10000):
+        buttons = make_buttons(count)
+        polling, polling_clicks = run_polling(buttons, frames)
+        dispatched, dispatched_clicks = run_dispatcher(buttons, frames)
+        assert polling_clicks == dispatched_clicks
+        print(f"  {count:>5} buttons  polling {polling * 1e6:9.1f} us   dispatcher {dispatched * 1e6:6.1f} us")
+    pygame.quit()
@@ -0,0 +1,89 @@
+"""
+Benchmark loading sprites behind the loading screen
+
+Run from the project root:
+    python benchmarks/bench_loading.py [image count]
+    
+Writes sprite images of random sizes to a temporary folder and loads
+them, first blocking the way startup used to (nothing can be drawn until
+they are all loaded), then with an AssetLoader decoding them on worker
+threads while the loading screen is drawn every frame. Reports
+when the first frame could be shown, the longest frame while loading, and
+when the sprites were ready.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import FONT_WARMUP_SIZES
+from scenes.loading_screen import LoadingScreen
+from storage.asset_cache import AssetCache
+from ui.asset_loader import AssetLoader
+from ui.fonts import warm_up
+from ui.sprite_manager import SpriteManager
+
+
+def write_images(folder, count):
+    rng = random.Random(1)
+    images = {}
+    for i in range(count):
+        size = (rng.randint(64, 256), rng.randint(64, 256))
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for _ in range(20):
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.randrange(128, 256))
+            pygame.draw.circle(surface, color, (rng.randrange(size[0]), rng.randrange(size[1])), rng.randint(4, 40))
+        images[f"sprite_{i}"] = path = os.path.join(folder, f"sprite_{i}.png")
+        pygame.image.save(surface, path)
+    return images
+
+
+def blocking(screen, images, asset_cache):
+    start = time.perf_counter()
+    SpriteManager(asset_cache=asset_cache).load_sprites(images)
+    loaded = time.perf_counter() - start
+    return loaded, loaded, loaded
+
+
+def background(screen, images, asset_cache):
+    start = time.perf_counter()
+    loader = AssetLoader(asset_cache)
+    loader.load(images)
+    loading_screen = LoadingScreen([loader])
+    loading_screen.render(screen)
+    first_frame = time.perf_counter() - start
+    
+    longest = 0.0
+    done = False
+    while not done:
+        frame_start = time.perf_counter()
+        done = loader.update()
+        loading_screen.render(screen)
+        longest = max(longest, time.perf_counter() - frame_start)
+    SpriteManager(asset_cache=asset_cache).load_sprites(images, loader.surfaces)
+    return first_frame, longest, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    screen = pygame.display.set_mode((1024, 768))
+    warm_up(FONT_WARMUP_SIZES)
+    
+    with tempfile.TemporaryDirectory() as folder:
+        images = write_images(folder, count)
+        asset_cache = AssetCache(os.path.join(folder, "cache"))
+        asset_cache.build([(path, 1.0) for path in images.values()])
+        
+        print(f"{count} images          first frame   longest frame   sprites ready")
+        for cache_name, cache in (("no cache", None), ("warm cache", asset_cache)):
+            for mode, function in (("blocking", blocking), ("background", background)):
+                first_frame, longest, loaded = function(screen, images, cache)
+                print(f"  {mode:10} {cache_name:10} {first_frame * 1000:8.1f} ms   {longest * 1000:8.1f} ms     "
+                      f"{loaded * 1000:8.1f} ms")
+    pygame.quit()
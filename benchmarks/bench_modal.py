@@ -0,0 +1,59 @@
+"""
+Benchmark frames with the pause menu open
+
+Run from the project root:
+    python benchmarks/bench_modal.py
+    
+Compares the frozen backdrop with the old way of drawing a modal:
+rendering the whole game scene every frame, then dimming it with a newly
+allocated full-screen SRCALPHA surface.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from scenes.game_loop import GameScene
+from benchmarks.bench_dirty_rects import make_scene
+
+FRAMES = 600
+
+
+def render_old(scene, screen):
+    """The scene and an allocated overlay every frame, as before"""
+    scene._render_scene(screen)
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, int(180 * scene._get_pause_progress())))
+    screen.blit(overlay, (0, 0))
+    scene._render_pause_menu(screen)
+
+
+def run(screen, render):
+    scene = make_scene()
+    scene.paused = scene.pause_menu_active = True
+    scene.animation_manager.get_animation("pause_menu").reset()
+    times = []
+    for _ in range(FRAMES):
+        scene.update(1 / 60)
+        start = time.perf_counter()
+        render(scene, screen)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return sum(times) / len(times), times[int(len(times) * 0.99)]
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    old_mean, old_p99 = run(screen, render_old)
+    new_mean, new_p99 = run(screen, GameScene.render)
+    
+    print(f"Pause menu open, {FRAMES} frames (mean / p99 per frame)")
+    print(f"  scene + overlay every frame  {old_mean * 1000:8.3f} / {old_p99 * 1000:.3f} ms")
+    print(f"  frozen backdrop              {new_mean * 1000:8.3f} / {new_p99 * 1000:.3f} ms")
+    pygame.quit()
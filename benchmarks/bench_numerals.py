@@ -0,0 +1,61 @@
+"""
+Benchmark drawing HUD counters whose value changes every frame
+
+Run from the project root:
+    python benchmarks/bench_numerals.py
+    
+Draws the coins, XP and clock text through render_text (a text cache
+miss and a font render for every new value) and through render_counter
+(new values put together from the glyph atlas), with the values changing
+every frame and every half second.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK
+from ui.text import TextRenderer
+
+FRAMES = 5000
+
+
+def get_hud_texts(frame):
+    """The counters as they would read on a frame"""
+    minutes = frame % 720
+    hours = 8 + minutes // 60
+    return [
+        (f"Coins: {1000 + frame}", "medium", 100, 210),
+        (f"XP: {frame % 500}/500", "small", 20, 280),
+        (f"{hours if hours <= 12 else hours - 12}:{minutes % 60:02d} {'AM' if hours < 12 else 'PM'}", "medium", 874, 100)
+    ]
+
+
+def run(screen, method, frames_per_value):
+    renderer = TextRenderer()
+    render = getattr(renderer, method)
+    times = []
+    for frame in range(FRAMES):
+        texts = get_hud_texts(frame // frames_per_value)
+        start = time.perf_counter()
+        for text, size, x, y in texts:
+            render(screen, text, size, BLACK, x, y)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return sum(times) / len(times), times[int(len(times) * 0.99)], renderer.get_cache_stats()
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    for frames_per_value in (1, 30):
+        print(f"Three HUD counters, a new value every {frames_per_value} frames, {FRAMES} frames (mean / p99 per frame)")
+        for label, method in (("render_text   ", "render_text"), ("render_counter", "render_counter")):
+            mean, p99, stats = run(screen, method, frames_per_value)
+            print(f"  {label}  {mean * 1e6:8.1f} / {p99 * 1e6:.1f} us  "
+                  f"text cache misses {stats['misses']}, entries {stats['entries']}")
+    pygame.quit()
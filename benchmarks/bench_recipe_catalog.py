@@ -0,0 +1,98 @@
+"""
+Benchmark opening a large recipe catalog from JSON versus the compiled file
+
+Run from the project root:
+    python benchmarks/bench_recipe_catalog.py
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.recipe_index import RecipeIndex
+from logic.recipe_logic import Recipe
+from storage.recipe_catalog import (
+    open_catalog, CompiledCatalog, CatalogRecipes, CatalogNames, CatalogIds
+)
+
+CATALOG_SIZE = 100_000
+LOOKUPS = 1000
+INGREDIENT_COUNT = 120
+TOOL_COUNT = 12
+
+
+def write_catalog(path, rng):
+    """Write a synthetic recipes.json and return its recipe names"""
+    ingredients = [f"ingredient {i}" for i in range(INGREDIENT_COUNT)]
+    tools = [f"tool {i}" for i in range(TOOL_COUNT)]
+    recipes = []
+    for i in range(CATALOG_SIZE):
+        recipes.append({
+            "name": f"Recipe {i}",
+            "ingredients": rng.sample(ingredients, rng.randint(1, 6)),
+            "tools": rng.sample(tools, rng.randint(1, 2)),
+            "cooking_time": 60,
+            "difficulty": 2,
+            "discovered": i % 1000 == 0
+        })
+    with open(path, "w") as file:
+        json.dump({"recipes": recipes}, file, indent=2)
+    return [recipe["name"] for recipe in recipes]
+
+
+def load_json(path):
+    """What RecipeSystem did before the catalog: parse and build everything"""
+    with open(path, "r") as file:
+        recipes_data = json.load(file).get("recipes", [])
+    recipes = {}
+    for recipe_data in recipes_data:
+        recipe = Recipe.from_dict(recipe_data)
+        recipes[recipe.name] = recipe
+    index = RecipeIndex()
+    index.add_many((recipe.name, recipe.ingredients, recipe.tools) for recipe in recipes.values())
+    return recipes
+
+
+def load_compiled(path):
+    """What RecipeSystem does with an up-to-date compiled catalog"""
+    catalog = CompiledCatalog(path)
+    recipes = CatalogRecipes(catalog, Recipe.from_dict)
+    index = RecipeIndex()
+    index.load(CatalogNames(catalog), CatalogIds(catalog), *catalog.masks())
+    return recipes
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rng = random.Random(CATALOG_SIZE)
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, "recipes.json")
+        compiled_path = os.path.join(directory, "recipes.catalog")
+        names = write_catalog(source_path, rng)
+        lookups = rng.sample(names, LOOKUPS)
+        
+        _, json_time = timed(load_json, source_path)
+        catalog, compile_time = timed(open_catalog, source_path, compiled_path)
+        catalog.close()
+        recipes, open_time = timed(load_compiled, compiled_path)
+        
+        start = time.perf_counter()
+        for name in lookups:
+            recipes.get(name)
+        lookup_time = (time.perf_counter() - start) / LOOKUPS
+        
+        print(f"{CATALOG_SIZE} recipes ({os.path.getsize(source_path) / 1e6:.1f} MB JSON, "
+              f"{os.path.getsize(compiled_path) / 1e6:.1f} MB compiled)")
+        print(f"  json.load + build everything  {json_time * 1000:8.1f} ms")
+        print(f"  compile (first start)         {compile_time * 1000:8.1f} ms")
+        print(f"  open compiled catalog         {open_time * 1000:8.1f} ms")
+        print(f"  first lookup of a recipe      {lookup_time * 1e6:8.1f} us")
@@ -0,0 +1,78 @@
+"""
+Benchmark the indexed recipe matcher against the old linear scan
+
+Run from the project root:
+    python benchmarks/bench_recipe_matcher.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.recipe_index import RecipeIndex
+
+CATALOG_SIZES = [10_000, 100_000]
+LOOKUPS = 200
+INGREDIENT_COUNT = 120
+TOOL_COUNT = 12
+
+
+def build_catalog(size, rng):
+    """Build a synthetic catalog of (name, ingredients, tools) tuples"""
+    ingredients = [f"ingredient {i}" for i in range(INGREDIENT_COUNT)]
+    tools = [f"tool {i}" for i in range(TOOL_COUNT)]
+    catalog = []
+    for i in range(size):
+        catalog.append((
+            f"Recipe {i}",
+            rng.sample(ingredients, rng.randint(1, 6)),
+            rng.sample(tools, rng.randint(1, 2))
+        ))
+    return catalog, ingredients, tools
+
+
+def linear_match(catalog, ingredients, tools):
+    """The matching loop RecipeSystem used before the index"""
+    for name, recipe_ingredients, recipe_tools in catalog:
+        if all(ing in ingredients for ing in recipe_ingredients):
+            if all(tool in tools for tool in recipe_tools):
+                return name
+    return None
+
+
+def run(size):
+    rng = random.Random(size)
+    catalog, ingredients, tools = build_catalog(size, rng)
+    selections = [
+        (rng.sample(ingredients, rng.randint(3, 8)), rng.sample(tools, rng.randint(1, 3)))
+        for _ in range(LOOKUPS)
+    ]
+    
+    start = time.perf_counter()
+    index = RecipeIndex()
+    index.add_many(catalog)
+    build_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for selected_ingredients, selected_tools in selections:
+        linear_match(catalog, selected_ingredients, selected_tools)
+    linear_time = (time.perf_counter() - start) / LOOKUPS
+    
+    start = time.perf_counter()
+    matched = 0
+    for selected_ingredients, selected_tools in selections:
+        if index.match(selected_ingredients, selected_tools) is not None:
+            matched += 1
+    index_time = (time.perf_counter() - start) / LOOKUPS
+    
+    print(f"{size:>7} recipes | index build {build_time * 1000:8.1f} ms | "
+          f"linear scan {linear_time * 1000:8.3f} ms/lookup | "
+          f"index {index_time * 1000:6.3f} ms/lookup | "
+          f"{matched}/{LOOKUPS} selections matched")
+
+
+if __name__ == "__main__":
+    for catalog_size in CATALOG_SIZES:
+        run(catalog_size)
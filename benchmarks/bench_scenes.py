@@ -0,0 +1,78 @@
+"""
+Benchmark building scenes on first use and freeing them while inactive
+
+Run from the project root:
+    python benchmarks/bench_scenes.py
+    
+Starts the game, then shows each scene for a frame, and reports how long
+each took to build, the surface memory it held while shown and what it
+still holds after the next scene is entered. Also times a visit to the
+cooking scene, which used to build a new RecipeCreator every time. The game
+runs in a temporary copy of data/, so no saves in the project are touched.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+import pygame
+import main
+from scenes.recipe_creator import RecipeCreator
+from scenes.registry import get_surface_bytes
+
+SCENES = ["menu", "game", "cooking", "upgrade", "recipe_book", "profile", "game_over", "about"]
+VISITS = 200
+
+
+def visit(game, name):
+    game._change_scene(name, {})
+    game._render_scene()
+    return get_surface_bytes(game.scenes[name], game.scenes.shared)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        shutil.copytree(os.path.join(ROOT, "data"), os.path.join(directory, "data"))
+        os.symlink(os.path.join(ROOT, "assets"), os.path.join(directory, "assets"))
+        os.chdir(directory)
+        
+        start = time.perf_counter()
+        game = main.Game()
+        startup = time.perf_counter() - start
+        built_at_start = [name for name, _ in game.scenes.items()]
+        
+        # Each scene's memory once left is measured from inside the next
+        shown = {}
+        left = {}
+        previous = None
+        for name in SCENES + SCENES[:1]:
+            shown.setdefault(name, visit(game, name))
+            if previous is not None:
+                left[previous] = get_surface_bytes(game.scenes[previous], game.scenes.shared)
+            previous = name
+        stats = game.get_scene_stats()
+        
+        start = time.perf_counter()
+        for _ in range(VISITS):
+            RecipeCreator(game.recipe_system, game.kitchen)
+        rebuild = (time.perf_counter() - start) / VISITS
+        start = time.perf_counter()
+        for _ in range(VISITS):
+            game.scenes.enter("cooking")
+        enter = (time.perf_counter() - start) / VISITS
+        
+    print(f"Game() {startup * 1000:.1f} ms, scenes built at startup: {', '.join(built_at_start)}")
+    print("scene         build      shown     after leaving")
+    for name in SCENES:
+        scene = stats[name]
+        print(f"  {name:11} {scene['build_time'] * 1000:6.2f} ms {shown[name] / 1024:8.0f} KB {left[name] / 1024:8.0f} KB")
+    total_build = sum(stats[name]["build_time"] for name in SCENES)
+    print(f"  all eight   {total_build * 1000:6.2f} ms {sum(shown.values()) / 1024:8.0f} KB "
+          f"{sum(left.values()) / 1024:8.0f} KB")
+    print(f"Visit to the cooking scene: new RecipeCreator {rebuild * 1000:.3f} ms, on_enter {enter * 1000:.3f} ms")
+    pygame.quit()
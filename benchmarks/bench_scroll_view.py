@@ -0,0 +1,109 @@
+"""
+Benchmark scrolling the cooking station with thousands of ingredients
+
+Run from the project root:
+    python benchmarks/bench_scroll_view.py [ingredient count]
+    
+Compares the ScrollView, which only visits the rows in view, with the old
+way: a button per ingredient made up front, and every button visited for
+hover, hit-testing and drawing each frame.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ui.buttons import IngredientButton
+from scenes.recipe_creator import RecipeCreator
+
+INGREDIENT_COUNT = 10_000
+FRAMES = 600
+
+
+class Kitchen:
+    """Stand-in for a kitchen with every ingredient unlocked"""
+    
+    def __init__(self, count):
+        self.ingredients = [f"Ingredient {i}" for i in range(count)]
+        
+    def get_unlocked_ingredients(self):
+        return list(self.ingredients)
+        
+    def get_unlocked_tools(self):
+        return ["Kawali", "Kaldero"]
+
+
+def frame_old(buttons, scroll_offset, mouse_pos, screen):
+    """Hover, hit-test and draw every button, as before"""
+    scroll_adjusted_pos = (mouse_pos[0], mouse_pos[1] + scroll_offset)
+    for button in buttons:
+        if 150 <= button.rect.y - scroll_offset <= SCREEN_HEIGHT - 200:
+            button.is_hovered(scroll_adjusted_pos)
+    for button in buttons:
+        if 150 <= button.rect.y - scroll_offset <= SCREEN_HEIGHT - 200:
+            button.rect.collidepoint(scroll_adjusted_pos)
+            
+    scroll_area = pygame.Rect(0, 150, SCREEN_WIDTH, SCREEN_HEIGHT - 300)
+    for button in buttons:
+        button_rect = button.rect.copy()
+        button_rect.y -= scroll_offset
+        if scroll_area.colliderect(button_rect):
+            original_rect = button.rect
+            button.rect = button_rect
+            button.draw(screen)
+            button.rect = original_rect
+
+
+def run_old(screen, count):
+    start = time.perf_counter()
+    buttons = [
+        IngredientButton(50 + (i % 3) * 110, 150 + (i // 3) * 50, 100, 40, f"Ingredient {i}")
+        for i in range(count)
+    ]
+    setup = time.perf_counter() - start
+    
+    times = []
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        frame_old(buttons, frame * 20, (170, 300), screen)
+        times.append(time.perf_counter() - start)
+    return setup, times
+
+
+def run_new(screen, count):
+    start = time.perf_counter()
+    scene = RecipeCreator(None, Kitchen(count))
+    setup = time.perf_counter() - start
+    
+    wheel = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1)
+    times = []
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        scene.scroll_view.handle_event(wheel)
+        scene.scroll_view.update_hover((170, 300))
+        scene.scroll_view.get_item_at((170, 300))
+        scene.scroll_view.draw(screen, scene.ingredient_grid)
+        times.append(time.perf_counter() - start)
+    return setup, times
+
+
+def report(label, setup, times):
+    times.sort()
+    mean = sum(times) / len(times)
+    p99 = times[int(len(times) * 0.99)]
+    print(f"  {label:<14} setup {setup * 1000:8.2f} ms   frame {mean * 1000:7.3f} / {p99 * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else INGREDIENT_COUNT
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    print(f"{count} ingredients, {FRAMES} frames scrolling (mean / p99 per frame)")
+    report("every button", *run_old(screen, count))
+    report("scroll view", *run_new(screen, count))
+    pygame.quit()
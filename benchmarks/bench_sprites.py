@@ -0,0 +1,70 @@
+"""
+Benchmark scaled sprites from the SpriteManager cache
+
+Run from the project root:
+    python benchmarks/bench_sprites.py
+    
+Times the profile editor's four 130x130 pictures and the game scene's
+60x60 profile picture scaled with pygame.transform.scale every frame, as
+before, against get_scaled_sprite. Then asks for many unknown sprites
+under a small budget, to show the cache staying within it.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ui.sprite_manager import SpriteManager
+
+FRAMES = 1000
+PICTURES = ["default_profile", "chef1", "chef2", "chef3"]
+
+
+def load(sprite_manager):
+    for name in PICTURES:
+        sprite_manager.load_sprite(name, f"assets/sprites/{name}.png")
+
+
+def draw_scaled_every_frame(screen, sprite_manager):
+    for i, name in enumerate(PICTURES):
+        screen.blit(pygame.transform.scale(sprite_manager.get_sprite(name), (130, 130)), (i * 150, 300))
+    screen.blit(pygame.transform.scale(sprite_manager.get_sprite("chef1"), (60, 60)), (20, 170))
+
+
+def draw_cached(screen, sprite_manager):
+    for i, name in enumerate(PICTURES):
+        screen.blit(sprite_manager.get_scaled_sprite(name, 130, 130), (i * 150, 300))
+    screen.blit(sprite_manager.get_scaled_sprite("chef1", 60, 60), (20, 170))
+
+
+def run(screen, draw):
+    sprite_manager = SpriteManager()
+    load(sprite_manager)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw(screen, sprite_manager)
+    return (time.perf_counter() - start) / FRAMES, sprite_manager.get_cache_stats()
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    old, _ = run(screen, draw_scaled_every_frame)
+    new, stats = run(screen, draw_cached)
+    print(f"Five profile pictures, {FRAMES} frames (time per frame)")
+    print(f"  scaled every frame   {old * 1e6:8.1f} us")
+    print(f"  get_scaled_sprite    {new * 1e6:8.1f} us  (hit rate {stats['hit_rate']:.1%})")
+    
+    sprite_manager = SpriteManager(budget=1024 * 1024)
+    for i in range(1000):
+        sprite_manager.get_scaled_sprite(f"unknown_{i}", 96, 96, smooth=True)
+    stats = sprite_manager.get_cache_stats()
+    print("1000 unknown sprites scaled to 96x96 under a 1 MB budget")
+    print(f"  cached {stats['entries']} surfaces, {stats['bytes'] / 1024:.0f} KB; "
+          f"evicted {stats['evictions']} surfaces, {stats['evicted_bytes'] / 1024:.0f} KB")
+    pygame.quit()
@@ -0,0 +1,71 @@
+"""
+Benchmark drawing wrapped text every frame
+
+Run from the project root:
+    python benchmarks/bench_text_layout.py
+    
+Compares measuring and breaking a paragraph into lines on every frame, as
+render_wrapped_text used to, with render_text_block, which reuses the line
+breaks worked out the first time. Both draw the lines from the same
+rendered text cache.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ui.text import TextRenderer
+
+FRAMES = 2000
+TEXT = (
+    "Cooking is not difficult. Everyone has taste, even if they don't realize "
+    "it. Even if you're not a great chef, there's nothing to stop you "
+    "understanding the difference between what tastes good and what doesn't."
+)
+
+
+def render_wrapped_old(renderer, screen, text, size, color, x, y, max_width):
+    """Measure the text word by word and draw it, as before"""
+    font = renderer.fonts[size]
+    lines = []
+    current_line = ""
+    for word in text.split(' '):
+        test_line = current_line + word + " "
+        if font.size(test_line)[0] <= max_width:
+            current_line = test_line
+        else:
+            lines.append(current_line)
+            current_line = word + " "
+    if current_line:
+        lines.append(current_line)
+    for i, line in enumerate(lines):
+        renderer.render_text(screen, line, size, color, x, y + i * font.get_height(), "center")
+
+
+def render_wrapped_new(renderer, screen, text, size, color, x, y, max_width):
+    renderer.render_text_block(screen, text, size, color, x, y, max_width, align="center")
+
+
+def run(screen, render):
+    renderer = TextRenderer()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        render(renderer, screen, TEXT, "medium", (255, 255, 255), SCREEN_WIDTH // 2, 300, 560)
+    return (time.perf_counter() - start) / FRAMES
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    old = run(screen, render_wrapped_old)
+    new = run(screen, render_wrapped_new)
+    
+    print(f"Wrapped paragraph, {FRAMES} frames (time per frame)")
+    print(f"  wrapped every frame   {old * 1e6:8.1f} us")
+    print(f"  cached line breaks    {new * 1e6:8.1f} us")
+    pygame.quit()
@@ -0,0 +1,31 @@
+"""
+Asset build step: decode the game's sprite images into the asset cache
+
+Run from the project root after adding or changing images:
+    python build_assets.py
+    
+The game fills the cache itself the first time it loads each image, so
+this only saves the first start the decoding, and clears out the cached
+pixels of images that changed or were removed.
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+from config import PROFILE_PICTURES, ASSET_CACHE_DIR
+from storage.asset_cache import AssetCache
+
+
+if __name__ == "__main__":
+    pygame.init()
+    
+    cache = AssetCache(ASSET_CACHE_DIR)
+    images = [(path, 1.0) for path in PROFILE_PICTURES.values()]
+    built = cache.build(images)
+    stats = cache.get_cache_stats()
+    print(f"{built} of {len(images)} images cached in {ASSET_CACHE_DIR} "
+          f"({stats['misses']} decoded, {stats['hits']} already cached, {stats['load_time'] * 1000:.1f} ms)")
+    pygame.quit()
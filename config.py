@@ -6,7 +6,20 @@ Configuration settings for Kusina ni Jai
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+BACKGROUND_FPS = 5  # Frame rate while the window is unfocused or minimized
+IDLE_THROTTLING = True  # Sleep until input arrives while a scene has nothing moving
+IDLE_WAIT_MS = 1000  # Longest sleep before checking the scene again
 TITLE = "Kusina ni Jai"
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by each TextRenderer
+TEXT_LAYOUT_CACHE_SIZE = 128  # Wrapped texts whose line breaks are kept
+COUNTER_CACHE_SIZE = 16  # Composed counter surfaces (coins, XP, clock) kept by each TextRenderer
+SPRITE_CACHE_BUDGET = 16 * 1024 * 1024  # Bytes of sprites and scaled sprites kept by the SpriteManager
+SPRITE_ATLAS_PAGE_SIZE = 1024  # Width and height of the pages sprites are packed onto
+ASSET_LOADER_WORKERS = 4  # Threads decoding sprite images behind the loading screen
+ASSET_CONVERT_BUDGET_MS = 4  # Milliseconds per loading screen frame spent converting decoded images
+FONT_WARMUP_SIZES = [14, 24, 32, 48, 64]  # Font sizes loaded before the first frame
+PAUSE_TITLE_FONT_SIZES = range(32, 65)  # Sizes the pause menu title animates through
+DIRTY_RECT_RENDERING = False  # Redraw and update only changed screen areas (for low-power devices)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -40,6 +53,12 @@ XP_TO_LEVEL = 100
 XP_LEVEL_MULTIPLIER = 1.5
 DEFAULT_USERNAME = "Chef"
 DEFAULT_PROFILE_PIC = "assets/sprites/default_profile.png"
+PROFILE_PICTURES = {  # Sprite name -> image
+    "default_profile": "assets/sprites/default_profile.png",
+    "chef1": "assets/sprites/chef1.png",
+    "chef2": "assets/sprites/chef2.png",
+    "chef3": "assets/sprites/chef3.png"
+}
 MAX_CONSECUTIVE_LOST_CUSTOMERS = 5
 
 # Customer settings
@@ -54,6 +73,20 @@ RECIPES_FILE = "data/recipes.json"
 INGREDIENTS_FILE = "data/ingredients.json"
 SAVE_FILE = "data/save.json"
 PROFILE_FILE = "data/profile.json"
+GAME_STATE_FILE = "data/game_state.json"
+RECIPES_JOURNAL_FILE = "data/recipes.journal"  # Discoveries since recipes.json was written
+RECIPES_CATALOG_FILE = "data/recipes.catalog"  # Compiled from recipes.json on load
+CONTENT_PACKS_DIR = "data/packs"  # Community recipe packs (*.json) imported on start
+CONTENT_PACKS_STATE_FILE = "data/content_packs.json"  # Packs already imported, and their items
+PACK_RECIPES_CATALOG_FILE = "data/pack_recipes.catalog"  # Recipes imported from content packs
+ASSET_CACHE_DIR = "data/asset_cache"  # Decoded sprite pixels, keyed by image hash and size (see build_assets.py)
+
+# Save settings
+SAVE_FLUSH_INTERVAL = 0.0  # Seconds between save flushes (0 = once per frame)
+SAVE_BACKEND = "json"  # "json" for the loose files above, "sqlite" for one database
+SAVE_DB_FILE = "data/save.db"
+RECIPES_JOURNAL_MAX_BYTES = 64 * 1024  # Fold the journal into recipes.json past this size
+CONTENT_PACK_POOL_MIN_BYTES = 8 * 1024 * 1024  # Validate smaller packs without a process pool
 
 # Default game assets
 DEFAULT_INGREDIENTS = ["rice", "egg", "tomato", "onion", "garlic"]
@@ -1,4 +1,5 @@
 import pygame
+from ui.fonts import get_font
 
 class CookingInterface:
     def __init__(self, recipe_system):
@@ -132,8 +133,8 @@ class CookingInterface:
         screen.fill((245, 245, 220))  # Beige background for cooking area
         
         # Draw title
-        font_large = pygame.font.SysFont(None, 48)
-        font = pygame.font.SysFont(None, 24)
+        font_large = get_font(48)
+        font = get_font(24)
         
         title = font_large.render("Cooking Station", True, (0, 0, 0))
         screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 50))
@@ -1,4 +1,5 @@
 import pygame
+from ui.fonts import get_font
 import random
 from collections import deque
 
@@ -123,7 +124,7 @@ class CustomerSystem:
         customer_area = pygame.Rect(0, 0, screen.get_width(), customer_area_height)
         pygame.draw.rect(screen, (200, 220, 240), customer_area)
         
-        font = pygame.font.SysFont(None, 24)
+        font = get_font(24)
         
         # Draw customer slots
         slot_width = screen.get_width() // self.max_customers
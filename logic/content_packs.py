@@ -0,0 +1,479 @@
+"""
+Importer for community content packs of recipes, ingredients and tools
+"""
+import gc
+import glob
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from config import CONTENT_PACKS_DIR, CONTENT_PACKS_STATE_FILE, CONTENT_PACK_POOL_MIN_BYTES
+from storage.json_stream import iter_members
+from storage.recipe_catalog import MAX_REQUIREMENTS, MAX_NAME_BYTES
+from storage.save_manager import write_json
+
+BATCH_SIZE = 5000  # Recipes handed to a worker at a time
+
+# Ingredients and tools recipes may use, set in each pool worker
+_known_ingredients = frozenset()
+_known_tools = frozenset()
+
+def _clean_names(values):
+    """Normalize a list of ingredient or tool names, or None if it is invalid"""
+    if not isinstance(values, list) or not values:
+        return None
+    names = []
+    for value in values:
+        if not isinstance(value, str) or not value.strip():
+            return None
+        names.append(value.strip().lower())
+    return list(dict.fromkeys(names))
+    
+def validate_recipes(batch_text, known_ingredients, known_tools):
+    """Decode, validate and normalize a batch of pack recipes
+    
+    Names are trimmed, ingredient and tool names are lowercased and
+    de-duplicated, missing timings get the defaults used for new recipes,
+    and difficulty is clamped to 1-5. Recipes that use an ingredient or tool
+    the kitchen doesn't know are rejected, as are recipes too large for the
+    recipe catalog to store.
+    
+    Args:
+        batch_text: Comma-separated JSON recipe objects
+        known_ingredients: Set of ingredient names recipes may use
+        known_tools: Set of tool names recipes may use
+        
+    Returns:
+        tuple: (list of (name, ingredients, tools, cooking_time, difficulty)
+            tuples, dict of rejection reason -> count)
+    """
+    recipes = []
+    rejected = {}
+    
+    for data in json.loads(f"[{batch_text}]"):
+        reason = None
+        if not isinstance(data, dict):
+            reason = "not an object"
+        else:
+            name = data.get("name")
+            ingredients = _clean_names(data.get("ingredients"))
+            tools = _clean_names(data.get("tools"))
+            cooking_time = data.get("cooking_time", 60)
+            difficulty = data.get("difficulty", 2)
+            
+            if not isinstance(name, str) or not name.strip():
+                reason = "missing name"
+            elif len(name.strip().encode("utf-8")) > MAX_NAME_BYTES:
+                reason = "name too long"
+            elif ingredients is None or tools is None:
+                reason = "invalid ingredients or tools"
+            elif len(ingredients) > MAX_REQUIREMENTS or len(tools) > MAX_REQUIREMENTS:
+                reason = "too many ingredients or tools"
+            elif not all(ingredient in known_ingredients for ingredient in ingredients):
+                reason = "unknown ingredient"
+            elif not all(tool in known_tools for tool in tools):
+                reason = "unknown tool"
+            elif not isinstance(cooking_time, (int, float)) or isinstance(cooking_time, bool) or cooking_time <= 0:
+                reason = "invalid cooking time"
+            elif not isinstance(difficulty, int) or isinstance(difficulty, bool):
+                reason = "invalid difficulty"
+                
+        if reason:
+            rejected[reason] = rejected.get(reason, 0) + 1
+            continue
+            
+        recipes.append((name.strip(), ingredients, tools, cooking_time, min(max(difficulty, 1), 5)))
+        
+    return recipes, rejected
+    
+def _init_worker(known_ingredients, known_tools):
+    global _known_ingredients, _known_tools
+    _known_ingredients = known_ingredients
+    _known_tools = known_tools
+    
+def _validate_in_worker(batch_text):
+    return validate_recipes(batch_text, _known_ingredients, _known_tools)
+    
+def _clean_item(data, default_cost):
+    """Normalize a pack ingredient or tool, or None if it is invalid"""
+    if not isinstance(data, dict) or not isinstance(data.get("name"), str) or not data["name"].strip():
+        return None
+    cost = data.get("cost", default_cost)
+    if not isinstance(cost, int) or isinstance(cost, bool) or cost < 0:
+        return None
+    return data["name"].strip().lower(), {
+        "cost": cost,
+        "unlocked": bool(data.get("unlocked", False)),
+        "category": str(data.get("category", "pack"))
+    }
+    
+def _batches(texts, batch_size):
+    batch = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) >= batch_size:
+            yield ",".join(batch)
+            batch = []
+    if batch:
+        yield ",".join(batch)
+
+
+class PackReport:
+    """What happened while importing one content pack"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)  # Bytes
+        self.recipes = []  # Recipe dictionaries accepted, until they are added
+        self.recipes_read = 0
+        self.recipes_added = 0
+        self.items_added = 0  # New ingredients and tools
+        self.rejected = {}  # Reason -> count
+        self.workers = 0  # Pool processes used (0 = validated in-process)
+        self.pool_dropped = False  # The pool was tried and was slower than in-process
+        self.seconds = 0.0
+        self.error = None
+        
+    @property
+    def recipes_per_second(self):
+        return self.recipes_read / self.seconds if self.seconds else 0.0
+        
+    @property
+    def megabytes_per_second(self):
+        return self.size / 1e6 / self.seconds if self.seconds else 0.0
+        
+    def summary(self):
+        """One line describing the import and its throughput"""
+        if self.error:
+            return f"{os.path.basename(self.path)}: failed ({self.error})"
+        rejected = sum(self.rejected.values())
+        workers = "pool slower, no" if self.pool_dropped else self.workers or "no"
+        return (
+            f"{os.path.basename(self.path)}: {self.recipes_added}/{self.recipes_read} recipes added, "
+            f"{rejected} rejected, {self.items_added} new items in {self.seconds:.2f}s "
+            f"({self.recipes_per_second:,.0f} recipes/s, {self.megabytes_per_second:.1f} MB/s, "
+            f"{workers} workers)"
+        )
+
+
+class ContentPackImporter:
+    """Streams content packs into the kitchen and recipe system
+    
+    A pack is a JSON object with optional "ingredients", "tools" and
+    "recipes" arrays. Ingredients and tools use the ingredients.json format
+    and are added to the kitchen first (locked unless they say otherwise),
+    so packs must list them before their recipes. Recipes use the
+    recipes.json format.
+    
+    The file is parsed incrementally and its recipes validated in batches.
+    The first batch is validated in-process and timed. Large packs then try
+    a process pool, which is handed raw JSON text with only a bounded number
+    of batches in flight, and keep it only if it validates faster than the
+    first batch did; otherwise the rest of the pack is validated in-process
+    too. Everything accepted is added to the recipe system's content pack
+    catalog in one go at the end.
+    """
+    
+    def __init__(self, kitchen, recipe_system, workers=None, pool_min_bytes=CONTENT_PACK_POOL_MIN_BYTES):
+        self.kitchen = kitchen
+        self.recipe_system = recipe_system
+        self.workers = workers or os.cpu_count() or 1
+        self.pool_min_bytes = pool_min_bytes  # Smaller packs are validated in-process
+        self.items = {"ingredients": {}, "tools": {}}  # Pack items read so far
+        
+    def import_pack(self, path, progress=None):
+        """Import one content pack
+        
+        Args:
+            path: Path of the pack file
+            progress: Callback taking a status and the fraction done (optional)
+            
+        Returns:
+            PackReport: Counts and throughput of the import
+        """
+        return self.import_packs([path], progress)[0]
+        
+    def import_packs(self, paths, progress=None):
+        """Import content packs, adding their recipes to the recipe system together
+        
+        Args:
+            paths: Paths of the pack files
+            progress: Callback taking a status and the fraction done (optional)
+            
+        Returns:
+            list: PackReport for each pack
+        """
+        progress = progress or (lambda status, fraction: None)
+        
+        # The recipes read hold no reference cycles, but with garbage
+        # collection on, every full collection walks all of them while
+        # holding the GIL, stalling the loading screen for up to a second
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            return self._import_packs(paths, progress)
+        finally:
+            if collecting:
+                gc.enable()
+                
+    def _import_packs(self, paths, progress):
+        total_bytes = sum(os.path.getsize(path) for path in paths) or 1
+        done_bytes = 0
+        reports = []
+        for path in paths:
+            def read_progress(position, path=path, done_bytes=done_bytes):
+                # Reading the packs is most of the work; compiling the rest
+                fraction = (done_bytes + position) / total_bytes
+                progress(f"Importing {os.path.basename(path)}", fraction * 0.9)
+                
+            read_progress(0)
+            report = self.read_pack(path, read_progress)
+            reports.append(report)
+            done_bytes += report.size
+            
+        progress("Compiling pack recipes", 0.9)
+        start = time.perf_counter()
+        try:
+            added = self.recipe_system.add_pack_recipes(
+                data for report in reports for data in report.recipes
+            )
+        except Exception as e:
+            for report in reports:
+                report.error = report.error or f"adding recipes: {e}"
+            added = []
+        seconds = time.perf_counter() - start
+        
+        # Credit each recipe added to the first pack that has it
+        added_names = {data["name"] for data in added}
+        for report in reports:
+            for data in report.recipes:
+                if data["name"] in added_names:
+                    added_names.discard(data["name"])
+                    report.recipes_added += 1
+            report.recipes = []
+            report.seconds += seconds * report.size / total_bytes
+        progress("Compiling pack recipes", 1.0)
+        return reports
+        
+    def read_pack(self, path, progress=None):
+        """Read and validate one content pack, adding its items to the kitchen
+        
+        The accepted recipes are left in the report for import_packs to add.
+        
+        Args:
+            path: Path of the pack file
+            progress: Callback taking the bytes read so far (optional)
+            
+        Returns:
+            PackReport: Counts and throughput of the read
+        """
+        report = PackReport(path)
+        start = time.perf_counter()
+        pool = None
+        pending = deque()
+        known = []  # Ingredient and tool sets, taken when the recipes start
+        in_process = [0, 0.0]  # Recipes validated in-process, seconds taken
+        trial = None  # [start time, recipes] while the pool is being tried
+        pool_tried = False
+        
+        def collect(result):
+            accepted, rejected = result
+            report.recipes.extend(
+                {
+                    "name": name,
+                    "ingredients": ingredients,
+                    "tools": tools,
+                    "cooking_time": cooking_time,
+                    "difficulty": difficulty,
+                    "discovered": False
+                }
+                for name, ingredients, tools, cooking_time, difficulty in accepted
+            )
+            for reason, count in rejected.items():
+                report.rejected[reason] = report.rejected.get(reason, 0) + count
+            return len(accepted) + sum(rejected.values())
+            
+        def recipe_texts(members):
+            for key, value in members:
+                if key == "recipes":
+                    if not known:
+                        known.extend((frozenset(self.kitchen.ingredients), frozenset(self.kitchen.tools)))
+                    report.recipes_read += 1
+                    yield value
+                elif key in ("ingredients", "tools"):
+                    report.items_added += self._add_items(key, value, report)
+                    
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                members = iter_members(file, raw_arrays=("recipes",))
+                
+                # Ingredients and tools listed before the recipes are added
+                # first, so the recipes can be checked against them
+                texts = recipe_texts(members)
+                batch_start = time.perf_counter()
+                for batch_text in _batches(texts, BATCH_SIZE):
+                    if (not pool_tried and in_process[0]
+                            and self.workers > 1 and report.size >= self.pool_min_bytes):
+                        pool_tried = True
+                        report.workers = self.workers
+                        # Spawned rather than forked: this runs on a loader thread
+                        # while other threads run, and a forked child could be
+                        # left holding a lock one of them had taken
+                        pool = multiprocessing.get_context("spawn").Pool(self.workers, _init_worker, tuple(known))
+                        trial = [time.perf_counter(), 0]
+                        
+                    if pool is None:
+                        # Timed from the end of the previous batch, so
+                        # reading the pack counts as it does for the pool
+                        in_process[0] += collect(validate_recipes(batch_text, *known))
+                        in_process[1] += time.perf_counter() - batch_start
+                    else:
+                        # Keep a couple of batches per worker queued, no more
+                        pending.append(pool.apply_async(_validate_in_worker, (batch_text,)))
+                        while len(pending) >= self.workers * 2:
+                            validated = collect(pending.popleft().get())
+                            if trial is not None:
+                                trial[1] += validated
+                                
+                        # Once the pool has had a fair run, drop it if it is
+                        # no faster than validating in-process
+                        if trial is not None and trial[1] >= BATCH_SIZE * self.workers * 2:
+                            pool_rate = trial[1] / (time.perf_counter() - trial[0])
+                            trial = None
+                            if pool_rate <= in_process[0] / in_process[1]:
+                                while pending:
+                                    collect(pending.popleft().get())
+                                pool.terminate()
+                                pool.join()
+                                pool = None
+                                report.workers = 0
+                                report.pool_dropped = True
+                                
+                    if progress:
+                        progress(file.buffer.tell())
+                    batch_start = time.perf_counter()
+                    
+                while pending:
+                    collect(pending.popleft().get())
+        except Exception as e:
+            report.error = str(e)
+            report.recipes = []
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+                
+        report.seconds = time.perf_counter() - start
+        return report
+        
+    def _add_items(self, kind, items, report):
+        """Add a pack's ingredients or tools to the kitchen
+        
+        They are also kept in self.items, so they can be added again to a
+        kitchen that has been reset.
+        
+        Returns:
+            int: Number of new items
+        """
+        if not isinstance(items, list):
+            report.rejected[f"invalid {kind}"] = report.rejected.get(f"invalid {kind}", 0) + 1
+            return 0
+            
+        default_cost = 50 if kind == "ingredients" else 100
+        cleaned = {}
+        for data in items:
+            item = _clean_item(data, default_cost)
+            if item is None:
+                report.rejected[f"invalid {kind}"] = report.rejected.get(f"invalid {kind}", 0) + 1
+                continue
+            cleaned.setdefault(*item)
+            
+        for name, data in cleaned.items():
+            self.items[kind].setdefault(name, data)
+        if kind == "ingredients":
+            return self.kitchen.add_items(ingredients=cleaned)
+        return self.kitchen.add_items(tools=cleaned)
+
+
+def _load_state(store):
+    """Load the record of imported packs and their items
+    
+    Records saved before the items were kept hold only the packs, and are
+    treated as if nothing had been imported.
+    
+    Returns:
+        dict: {"packs": file name -> fingerprint, "ingredients": ..., "tools": ...}
+    """
+    state = None
+    if store:
+        state = store.load_section("content_packs")
+    elif os.path.exists(CONTENT_PACKS_STATE_FILE):
+        try:
+            with open(CONTENT_PACKS_STATE_FILE, "r") as file:
+                state = json.load(file)
+        except Exception as e:
+            print(f"Error loading content pack state: {e}")
+            
+    if not isinstance(state, dict) or not isinstance(state.get("packs"), dict):
+        state = {"packs": {}}
+    state.setdefault("ingredients", {})
+    state.setdefault("tools", {})
+    return state
+    
+def import_content_packs(kitchen, recipe_system, save_manager=None, directory=CONTENT_PACKS_DIR, progress=None):
+    """Import every pack in the packs directory that hasn't been imported yet
+    
+    A pack is imported again if its file changes. Packs are matched by file
+    name, size and modification time. Every pack is imported again if the
+    recipe system has lost its content pack catalog. The items of packs
+    imported before are added to the kitchen each time, so a kitchen that
+    was reset for a new game gets them back without reading the packs.
+    
+    Args:
+        kitchen: Kitchen to add ingredients and tools to
+        recipe_system: RecipeSystem to add recipes to
+        save_manager: SaveManager used to record which packs were imported (optional)
+        directory: Folder holding the pack files
+        progress: Callback taking a status and the fraction done (optional)
+        
+    Returns:
+        list: PackReport for each pack imported
+    """
+    paths = sorted(glob.glob(os.path.join(directory, "*.json")))
+    if not paths:
+        return []
+        
+    store = save_manager.store if save_manager else None
+    state = _load_state(store)
+    if recipe_system.pack_catalog is None:
+        state["packs"] = {}
+    kitchen.add_items(ingredients=state["ingredients"], tools=state["tools"])
+    
+    new_paths = []
+    fingerprints = {}
+    for path in paths:
+        stat = os.stat(path)
+        name = os.path.basename(path)
+        fingerprints[name] = [stat.st_size, stat.st_mtime_ns]
+        if state["packs"].get(name) != fingerprints[name]:
+            new_paths.append(path)
+    if not new_paths:
+        return []
+        
+    importer = ContentPackImporter(kitchen, recipe_system)
+    reports = importer.import_packs(new_paths, progress)
+    for report in reports:
+        print(f"Content pack {report.summary()}")
+        if report.error is None:
+            name = os.path.basename(report.path)
+            state["packs"][name] = fingerprints[name]
+    for kind in ("ingredients", "tools"):
+        for name, data in importer.items[kind].items():
+            state[kind].setdefault(name, data)
+            
+    if store:
+        store.save_section("content_packs", state)
+    else:
+        write_json(CONTENT_PACKS_STATE_FILE, state, save_manager)
+    return reports
@@ -18,6 +18,7 @@ class Customer:
         self.max_patience = patience
         self.patience = patience  # Patience in seconds
         self.order = order  # Name of the dish they want
+        self.order_key = order.casefold()  # Case-insensitive key for matching dishes
         self.reward = reward  # Coins rewarded for completing the order
         self.served = False
         self.timer_start = pygame.time.get_ticks()
@@ -44,7 +45,7 @@ class Customer:
             bool: True if the dish matches the order
         """
         # Case-insensitive comparison
-        if dish_name.lower() == self.order.lower():
+        if dish_name.casefold() == self.order_key:
             self.served = True
             return True
         return False
@@ -123,14 +124,10 @@ class CustomerSystem:
             order = self._generate_custom_order()
             
         # Set reward based on recipe difficulty or randomness for custom orders
-        recipe_found = False
-        for recipe in self.recipe_system.recipes.values():
-            if recipe.name.lower() == order.lower():
-                reward = recipe.difficulty * 20 + random.randint(5, 15)
-                recipe_found = True
-                break
-                
-        if not recipe_found:
+        recipe = self.recipe_system.find_recipe(order)
+        if recipe is not None:
+            reward = recipe.difficulty * 20 + random.randint(5, 15)
+        else:
             # Custom orders pay more
             reward = random.randint(40, 80)
             
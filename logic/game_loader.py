@@ -0,0 +1,79 @@
+"""
+Background loading of the saved game while the loading screen shows
+"""
+import threading
+import time
+
+class GameLoader:
+    """Runs the loading of the saved game on a worker thread
+    
+    Opening the save store, compiling recipe catalogs and importing content
+    packs don't touch the display, so they run on a worker while the main
+    thread keeps drawing the loading screen. The work reports how far it
+    has got through a progress callback, which the loading screen reads.
+    Nothing else may use what it is loading until is_done() is True.
+    """
+    
+    def __init__(self, function):
+        """Set up loading, which begins with start()
+        
+        Args:
+            function: Function doing the loading, called on the worker with
+                a progress(status, fraction) callback
+        """
+        self.status = "Loading"
+        self.fraction = 0.0
+        self.error = None
+        self.start_time = None
+        self.load_time = None  # Seconds until loading finished
+        self.thread = threading.Thread(target=self._run, args=(function,), name="game-loader", daemon=True)
+        
+    def start(self):
+        """Start loading on the worker thread"""
+        self.start_time = time.perf_counter()
+        self.thread.start()
+        
+    def _run(self, function):
+        try:
+            function(self._progress)
+        except BaseException as e:
+            self.error = e  # Raised again on the main thread by wait()
+        finally:
+            self.load_time = time.perf_counter() - self.start_time
+            
+    def _progress(self, status, fraction):
+        """Record how far loading is, called from the worker"""
+        self.status = status
+        self.fraction = min(max(fraction, 0.0), 1.0)
+        
+    def wait(self):
+        """Block until loading has finished, raising anything it raised"""
+        self.thread.join()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+            
+    def is_done(self):
+        """Check whether loading has finished
+        
+        Returns:
+            bool: True once the worker is done
+        """
+        return self.start_time is not None and not self.thread.is_alive()
+        
+    def get_progress(self):
+        """Get how far loading is
+        
+        Returns:
+            tuple: (fraction done, 1)
+        """
+        return (1.0 if self.is_done() else self.fraction), 1
+        
+    def get_status(self):
+        """Get what is being loaded, for the loading screen
+        
+        Returns:
+            str: Description and percentage done
+        """
+        done, total = self.get_progress()
+        return f"{self.status} {int(done * 100)}%"
@@ -4,17 +4,26 @@ Kitchen logic for managing ingredients, tools, and cooking
 import json
 import os
 from config import INGREDIENTS_FILE, DEFAULT_INGREDIENTS, DEFAULT_TOOLS
+from storage.save_manager import write_json, delete_save_file
 
 class Kitchen:
-    def __init__(self):
+    def __init__(self, save_manager=None):
+        self.save_manager = save_manager
+        self.store = save_manager.store if save_manager else None  # SqliteStore (optional)
         self.ingredients = {}
         self.tools = {}
         self.load_ingredients_and_tools()
         
     def load_ingredients_and_tools(self):
-        """Load ingredients and tools from file"""
+        """Load ingredients and tools from the save store or file"""
         try:
-            if os.path.exists(INGREDIENTS_FILE):
+            if self.store:
+                items = self.store.load_kitchen()
+                if items:
+                    self.ingredients, self.tools = items
+                else:
+                    self._create_defaults()
+            elif os.path.exists(INGREDIENTS_FILE):
                 with open(INGREDIENTS_FILE, "r") as file:
                     data = json.load(file)
                     
@@ -80,13 +89,15 @@ class Kitchen:
                 "category": "advanced"
             }
             
-        self.save_ingredients_and_tools()
+        self.request_save()
             
     def save_ingredients_and_tools(self):
         """Save ingredients and tools to file"""
         try:
-            os.makedirs(os.path.dirname(INGREDIENTS_FILE), exist_ok=True)
-            
+            if self.store:
+                self.store.save_kitchen(self.ingredients, self.tools)
+                return
+                
             ingredients_list = []
             for name, data in self.ingredients.items():
                 ingredients_list.append({
@@ -110,11 +121,40 @@ class Kitchen:
                 "tools": tools_list
             }
             
-            with open(INGREDIENTS_FILE, "w") as file:
-                json.dump(data, file, indent=2)
+            write_json(INGREDIENTS_FILE, data, self.save_manager)
         except Exception as e:
             print(f"Error saving ingredients and tools: {e}")
             
+    def request_save(self):
+        """Save ingredients and tools, deferring to the save manager if there is one"""
+        if self.save_manager:
+            self.save_manager.mark_dirty("kitchen", self.save_ingredients_and_tools)
+        else:
+            self.save_ingredients_and_tools()
+            
+    def add_items(self, ingredients=None, tools=None):
+        """Add ingredients and tools the kitchen doesn't have yet
+        
+        Items that already exist keep their cost and unlocked state.
+        
+        Args:
+            ingredients: Ingredient name -> {"cost", "unlocked", "category"} (optional)
+            tools: Tool name -> {"cost", "unlocked", "category"} (optional)
+            
+        Returns:
+            int: Number of items added
+        """
+        added = 0
+        for items, new_items in ((self.ingredients, ingredients), (self.tools, tools)):
+            for name, data in (new_items or {}).items():
+                if name not in items:
+                    items[name] = dict(data)
+                    added += 1
+                    
+        if added:
+            self.request_save()
+        return added
+        
     def get_unlocked_ingredients(self):
         """Get list of unlocked ingredients"""
         return [name for name, data in self.ingredients.items() if data["unlocked"]]
@@ -143,7 +183,10 @@ class Kitchen:
         if ingredient_name in self.ingredients and not self.ingredients[ingredient_name]["unlocked"]:
             cost = self.ingredients[ingredient_name]["cost"]
             self.ingredients[ingredient_name]["unlocked"] = True
-            self.save_ingredients_and_tools()
+            if self.store:
+                self.store.set_item_unlocked("ingredient", ingredient_name)
+            else:
+                self.request_save()
             return True, cost
         return False, 0
         
@@ -159,18 +202,23 @@ class Kitchen:
         if tool_name in self.tools and not self.tools[tool_name]["unlocked"]:
             cost = self.tools[tool_name]["cost"]
             self.tools[tool_name]["unlocked"] = True
-            self.save_ingredients_and_tools()
+            if self.store:
+                self.store.set_item_unlocked("tool", tool_name)
+            else:
+                self.request_save()
             return True, cost
         return False, 0
         
     def reset(self):
         """Reset kitchen to default state"""
-        # Delete the ingredients file if it exists
-        if os.path.exists(INGREDIENTS_FILE):
-            try:
-                os.remove(INGREDIENTS_FILE)
-            except Exception as e:
-                print(f"Error deleting ingredients file: {e}")
+        # Delete the saved ingredients and tools
+        try:
+            if self.store:
+                self.store.clear_kitchen()
+            else:
+                delete_save_file(INGREDIENTS_FILE, self.save_manager)
+        except Exception as e:
+            print(f"Error deleting ingredients file: {e}")
                 
         # Recreate defaults
         self._create_defaults()
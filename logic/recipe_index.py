@@ -0,0 +1,200 @@
+"""
+Inverted index for matching ingredient and tool selections against recipes
+"""
+
+class RecipeIndex:
+    """Bitset index from ingredients and tools to the recipes that need them
+    
+    Every indexed recipe gets an integer ID, and each ingredient or tool maps
+    to a bitset (a Python int) with one bit set per recipe that requires it.
+    A selection matches a recipe when the recipe needs nothing outside the
+    selection, so matching ORs together the bitsets of the unselected items
+    and keeps whatever is left. The cost depends on the size of the
+    ingredient/tool vocabulary, not on the number of recipes.
+    """
+    
+    def __init__(self):
+        self.names = []  # Recipe ID -> recipe name (None once removed)
+        self.ids = {}  # Recipe name -> recipe ID
+        self.ingredient_masks = {}  # Ingredient -> bitset of recipe IDs
+        self.tool_masks = {}  # Tool -> bitset of recipe IDs
+        self.size_masks = {}  # Number of requirements -> bitset of recipe IDs
+        self.sizes = []  # Requirement counts, most specific first
+        self.live_mask = 0  # Bitset of all indexed recipe IDs
+        
+    def __len__(self):
+        return len(self.ids)
+        
+    def __contains__(self, name):
+        return name in self.ids
+        
+    def add(self, name, ingredients, tools):
+        """Index a recipe, replacing any previous entry with the same name
+        
+        Args:
+            name: Name of the recipe
+            ingredients: Ingredients the recipe requires
+            tools: Tools the recipe requires
+        """
+        if name in self.ids:
+            self.remove(name)
+            
+        recipe_id = len(self.names)
+        bit = 1 << recipe_id
+        self.names.append(name)
+        self.ids[name] = recipe_id
+        self.live_mask |= bit
+        
+        ingredients = set(ingredients)
+        tools = set(tools)
+        
+        for ingredient in ingredients:
+            self.ingredient_masks[ingredient] = self.ingredient_masks.get(ingredient, 0) | bit
+            
+        for tool in tools:
+            self.tool_masks[tool] = self.tool_masks.get(tool, 0) | bit
+            
+        size = len(ingredients) + len(tools)
+        if size not in self.size_masks:
+            self.size_masks[size] = 0
+            self.sizes = sorted(self.size_masks, reverse=True)
+        self.size_masks[size] |= bit
+        
+    def add_many(self, recipes):
+        """Index many recipes at once
+        
+        Builds each bitset in a bytearray and converts it once, which avoids
+        reallocating a large int for every recipe when loading a catalog.
+        
+        Args:
+            recipes: Iterable of (name, ingredients, tools) tuples
+        """
+        pending = {}  # (kind, key) -> list of new recipe IDs
+        
+        for name, ingredients, tools in recipes:
+            if name in self.ids:
+                self.remove(name)
+                
+            recipe_id = len(self.names)
+            self.names.append(name)
+            self.ids[name] = recipe_id
+            
+            ingredients = set(ingredients)
+            tools = set(tools)
+            for ingredient in ingredients:
+                pending.setdefault(("ingredient", ingredient), []).append(recipe_id)
+            for tool in tools:
+                pending.setdefault(("tool", tool), []).append(recipe_id)
+            pending.setdefault(("size", len(ingredients) + len(tools)), []).append(recipe_id)
+            
+        if not pending:
+            return
+            
+        size_in_bytes = (len(self.names) + 7) // 8
+        masks_by_kind = {
+            "ingredient": self.ingredient_masks,
+            "tool": self.tool_masks,
+            "size": self.size_masks
+        }
+        
+        for (kind, key), recipe_ids in pending.items():
+            bits = bytearray(size_in_bytes)
+            for recipe_id in recipe_ids:
+                bits[recipe_id >> 3] |= 1 << (recipe_id & 7)
+            mask = int.from_bytes(bits, "little")
+            masks = masks_by_kind[kind]
+            masks[key] = masks.get(key, 0) | mask
+            if kind == "size":
+                self.live_mask |= mask
+                
+        self.sizes = sorted(self.size_masks, reverse=True)
+        
+    def load(self, names, ids, ingredient_masks, tool_masks, size_masks):
+        """Replace the index contents with prebuilt bitsets
+        
+        Used to load the bitsets stored in a compiled recipe catalog instead
+        of indexing every recipe again.
+        
+        Args:
+            names: Sequence of recipe names by ID that supports append
+            ids: Mapping of recipe names to IDs
+            ingredient_masks: Ingredient -> bitset of recipe IDs
+            tool_masks: Tool -> bitset of recipe IDs
+            size_masks: Number of requirements -> bitset of recipe IDs
+        """
+        self.names = names
+        self.ids = ids
+        self.ingredient_masks = ingredient_masks
+        self.tool_masks = tool_masks
+        self.size_masks = size_masks
+        self.sizes = sorted(size_masks, reverse=True)
+        self.live_mask = 0
+        for mask in size_masks.values():
+            self.live_mask |= mask
+            
+    def remove(self, name):
+        """Remove a recipe from the index
+        
+        Args:
+            name: Name of the recipe
+            
+        Returns:
+            bool: True if the recipe was indexed
+        """
+        recipe_id = self.ids.pop(name, None)
+        if recipe_id is None:
+            return False
+            
+        keep = ~(1 << recipe_id)
+        self.names[recipe_id] = None
+        self.live_mask &= keep
+        
+        for masks in (self.ingredient_masks, self.tool_masks, self.size_masks):
+            for key, mask in masks.items():
+                masks[key] = mask & keep
+                
+        return True
+        
+    def clear(self):
+        """Remove every recipe from the index"""
+        self.__init__()
+        
+    def match(self, ingredients, tools):
+        """Find the most specific recipe that can be made from a selection
+        
+        A recipe fits when every ingredient and tool it requires is selected.
+        When several recipes fit, the one with the most requirements wins, and
+        ties go to the recipe that was indexed first.
+        
+        Args:
+            ingredients: Selected ingredients
+            tools: Selected tools
+            
+        Returns:
+            str or None: Name of the matching recipe
+        """
+        ingredients = set(ingredients)
+        tools = set(tools)
+        
+        # Any recipe that needs something outside the selection is ruled out
+        excluded = 0
+        for ingredient, mask in self.ingredient_masks.items():
+            if ingredient not in ingredients:
+                excluded |= mask
+                
+        for tool, mask in self.tool_masks.items():
+            if tool not in tools:
+                excluded |= mask
+                
+        candidates = self.live_mask & ~excluded
+        if not candidates:
+            return None
+            
+        for size in self.sizes:
+            hits = candidates & self.size_masks[size]
+            if hits:
+                # Lowest set bit is the earliest indexed recipe of this size
+                lowest = hits & -hits
+                return self.names[lowest.bit_length() - 1]
+                
+        return None
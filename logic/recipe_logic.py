@@ -4,7 +4,29 @@ Recipe system for managing and validating recipes
 import json
 import os
 import random
-from config import RECIPES_FILE
+from config import (
+    RECIPES_FILE, RECIPES_JOURNAL_FILE, RECIPES_JOURNAL_MAX_BYTES, RECIPES_CATALOG_FILE,
+    PACK_RECIPES_CATALOG_FILE
+)
+from logic.recipe_index import RecipeIndex
+from storage.journal import Journal
+from storage.recipe_catalog import (
+    compile_catalog, fits_record, open_catalog, CompiledCatalog, ChainedCatalog,
+    CatalogRecipes, CatalogNames, CatalogIds
+)
+from storage.save_manager import write_json_array, delete_save_file
+
+def recipe_signature(ingredients, tools):
+    """Get the canonical signature of an ingredient and tool combination
+    
+    Two combinations share a signature when they use the same ingredients
+    and tools, regardless of order or repeats.
+    
+    Returns:
+        tuple: (frozenset of ingredients, frozenset of tools)
+    """
+    return frozenset(ingredients), frozenset(tools)
+
 
 class Recipe:
     def __init__(self, name, ingredients, tools, cooking_time, difficulty):
@@ -14,12 +36,13 @@ class Recipe:
         self.cooking_time = cooking_time  # Time in seconds
         self.difficulty = difficulty  # 1-5 scale
         self.discovered = False
+        self.signature = recipe_signature(ingredients, tools)
         
     def to_dict(self):
         return {
             "name": self.name,
-            "ingredients": self.ingredients,
-            "tools": self.tools,
+            "ingredients": list(self.ingredients),
+            "tools": list(self.tools),
             "cooking_time": self.cooking_time,
             "difficulty": self.difficulty,
             "discovered": self.discovered
@@ -39,19 +62,54 @@ class Recipe:
 
 
 class RecipeSystem:
-    def __init__(self):
+    def __init__(self, save_manager=None):
+        self.save_manager = save_manager
+        self.store = save_manager.store if save_manager else None  # SqliteStore (optional)
+        # Without a store, single recipe changes are appended here instead
+        # of rewriting recipes.json
+        self.journal = None
+        if not self.store:
+            self.journal = Journal(RECIPES_JOURNAL_FILE, RECIPES_JOURNAL_MAX_BYTES, save_manager)
+        self.catalog = None  # Catalog of recipes.json and/or the content pack recipes
+        self.pack_catalog = None  # CompiledCatalog of the content pack recipes
+        self.saved_count = 0  # Leading catalog positions that hold recipes.json's recipes
         self.recipes = {}
+        self.signatures = {}  # Signature -> recipe name, for recipes not in the catalog
+        self.names = {}  # Case-folded name -> recipe name, for recipes not in the catalog
+        self.index = RecipeIndex()
         self.load_recipes()
         
     def load_recipes(self):
-        """Load recipes from the recipes.json file"""
+        """Load recipes from the save store, or recipes.json plus its journal
+        
+        recipes.json and the recipes imported from content packs are read
+        through compiled catalogs where possible, so recipes are only built
+        once something asks for them.
+        """
         try:
-            if os.path.exists(RECIPES_FILE):
-                with open(RECIPES_FILE, "r") as file:
-                    data = json.load(file)
-                    for recipe_data in data.get("recipes", []):
-                        recipe = Recipe.from_dict(recipe_data)
-                        self.recipes[recipe.name] = recipe
+            recipes_data = None
+            saved_catalog = None
+            if self.store:
+                recipes_data = self.store.load_recipes() or None
+            elif os.path.exists(RECIPES_FILE):
+                saved_catalog = self._open_catalog()
+                if saved_catalog is None:
+                    with open(RECIPES_FILE, "r") as file:
+                        recipes_data = json.load(file).get("recipes", [])
+                        
+            pack_catalog = self._open_pack_catalog()
+            if saved_catalog or pack_catalog:
+                self._load_catalog(saved_catalog, pack_catalog, recipes_data)
+            elif recipes_data is not None:
+                for recipe_data in recipes_data:
+                    recipe = Recipe.from_dict(recipe_data)
+                    self.recipes[recipe.name] = recipe
+                    
+                self._replay_journal()
+                
+                # Older saves can hold the same combination under several names
+                if self._rebuild_index():
+                    self.request_save()
             else:
                 # Create default recipes if file doesn't exist
                 self._create_default_recipes()
@@ -59,6 +117,108 @@ class RecipeSystem:
             print(f"Error loading recipes: {e}")
             self._create_default_recipes()
                 
+    def _open_catalog(self):
+        """Open the compiled catalog of recipes.json
+        
+        The catalog is compiled again whenever recipes.json has changed.
+        
+        Returns:
+            CompiledCatalog or None if it could not be compiled
+        """
+        try:
+            return open_catalog(RECIPES_FILE, RECIPES_CATALOG_FILE)
+        except Exception as e:
+            print(f"Error compiling recipe catalog: {e}")
+            return None
+            
+    def _open_pack_catalog(self):
+        """Open the catalog of recipes imported from content packs
+        
+        Returns:
+            CompiledCatalog or None if no packs have been imported
+        """
+        if not os.path.exists(PACK_RECIPES_CATALOG_FILE):
+            return None
+        try:
+            catalog = CompiledCatalog(PACK_RECIPES_CATALOG_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Error opening content pack recipes: {e}")
+            return None
+        if not catalog.valid:
+            catalog.close()
+            return None  # The packs are imported again
+        return catalog
+        
+    def _load_catalog(self, saved_catalog, pack_catalog, recipes_data):
+        """Load recipes through the compiled catalogs
+        
+        Lookups and the recipe index read the catalogs directly, and only
+        recipes that are used get built. Saved recipes that are not in a
+        catalog, and the journal, are laid on top.
+        
+        Args:
+            saved_catalog: CompiledCatalog of recipes.json, or None
+            pack_catalog: CompiledCatalog of the content pack recipes, or None
+            recipes_data: Saved recipe dictionaries not in a catalog, or None
+        """
+        if saved_catalog and pack_catalog:
+            catalog = ChainedCatalog(saved_catalog, pack_catalog)
+        else:
+            catalog = saved_catalog or pack_catalog
+        self.catalog = catalog
+        self.pack_catalog = pack_catalog
+        self.saved_count = len(saved_catalog) if saved_catalog else 0
+        self.recipes = CatalogRecipes(catalog, Recipe.from_dict)
+        self.index.load(CatalogNames(catalog), CatalogIds(catalog), *catalog.masks())
+        
+        if saved_catalog is None and recipes_data is None:
+            self._create_default_recipes()
+            return
+            
+        for recipe_data in recipes_data or ():
+            recipe = Recipe.from_dict(recipe_data)
+            self.recipes[recipe.name] = recipe
+            self._index_saved(recipe)
+        for recipe in self._replay_journal():
+            self._index_saved(recipe)
+            
+        # Duplicates were dropped while compiling; drop them from the file too
+        if saved_catalog and saved_catalog.duplicates:
+            self.request_save()
+            
+    def _index_saved(self, recipe):
+        """Index a recipe laid on top of the catalog, unless the catalog has it"""
+        if recipe.name not in self.index:
+            self.signatures[recipe.signature] = recipe.name
+            self.names[recipe.name.casefold()] = recipe.name
+            self.index.add(recipe.name, recipe.ingredients, recipe.tools)
+            
+    def _close_catalog(self):
+        """Close the catalogs and forget every loaded recipe"""
+        if self.catalog:
+            self.catalog.close()
+        self.catalog = None
+        self.pack_catalog = None
+        self.saved_count = 0
+        self.recipes = {}
+        self.signatures = {}
+        self.names = {}
+        self.index.clear()
+        
+    def _replay_journal(self):
+        """Apply changes made since recipes.json was last written
+        
+        Returns:
+            list: Recipes read from the journal
+        """
+        replayed = []
+        if self.journal:
+            for recipe_data in self.journal.read():
+                recipe = Recipe.from_dict(recipe_data)
+                self.recipes[recipe.name] = recipe
+                replayed.append(recipe)
+        return replayed
+        
     def _create_default_recipes(self):
         """Create default recipes if no file exists"""
         default_recipes = [
@@ -71,57 +231,252 @@ class RecipeSystem:
         for recipe in default_recipes:
             recipe.discovered = True
             self.recipes[recipe.name] = recipe
-            
-        self.save_recipes()
+            if self.catalog:
+                self._index_saved(recipe)
+                
+        if not self.catalog:
+            self._rebuild_index()
+        self.request_save()
             
     def save_recipes(self):
-        """Save all recipes to the recipes.json file"""
+        """Save all recipes to the recipes.json file
+        
+        This also folds the journal into the file, after which the journal
+        starts out empty again. Recipes still only in the catalog are copied
+        from it as they are written, on the writer thread, without being
+        built. Content pack recipes are left to the pack catalog unless they
+        have been discovered.
+        """
         try:
-            os.makedirs(os.path.dirname(RECIPES_FILE), exist_ok=True)
+            records = self._saved_records()
+            if self.store:
+                self.store.save_recipes(records)
+                return
+                
+            self.journal.rotate()
+            write_json_array(RECIPES_FILE, "recipes", records, self.save_manager)
+            self.journal.drop_rotated()
+        except Exception as e:
+            print(f"Error saving recipes: {e}")
+            
+    def _saved_records(self):
+        """Get the recipes to save, as dictionaries
+        
+        Returns:
+            iterable: Recipe dictionaries, safe to read on the writer thread
+        """
+        if self.catalog:
+            return self.recipes.records(self.saved_count)
+        return [recipe.to_dict() for recipe in self.recipes.values()]
+        
+    def request_save(self):
+        """Save recipes, deferring to the save manager if there is one"""
+        if self.save_manager:
+            self.save_manager.mark_dirty("recipes", self.save_recipes)
+        else:
+            self.save_recipes()
             
-            recipes_data = {
-                "recipes": [recipe.to_dict() for recipe in self.recipes.values()]
-            }
+    def _save_recipe(self, recipe):
+        """Persist a single added or changed recipe
+        
+        The save store updates just that recipe's row, on the save manager's
+        writer thread. Otherwise the recipe is appended to the journal, and
+        recipes.json is only rewritten once the journal grows past its size
+        limit.
+        """
+        if self.store:
+            data = recipe.to_dict()
+            self.save_manager.call(f"recipe {recipe.name}", lambda: self.store.upsert_recipe(data))
+            return
             
-            with open(RECIPES_FILE, "w") as file:
-                json.dump(recipes_data, file, indent=2)
+        try:
+            self.journal.append(recipe.to_dict())
         except Exception as e:
-            print(f"Error saving recipes: {e}")
+            print(f"Error writing recipe journal: {e}")
+            self.request_save()
+            return
+            
+        if self.journal.needs_compaction():
+            self.request_save()
             
     def get_recipe(self, name):
         """Get a recipe by name"""
         return self.recipes.get(name)
     
+    def find_recipe(self, name):
+        """Get a recipe by name, ignoring case
+        
+        Returns:
+            Recipe or None if no recipe has that name
+        """
+        recipe_name = self._find_name(name.casefold())
+        return self.recipes[recipe_name] if recipe_name is not None else None
+    
+    def find_by_signature(self, ingredients, tools):
+        """Get the recipe that uses exactly these ingredients and tools
+        
+        Returns:
+            Recipe or None if no recipe uses that combination
+        """
+        recipe_name = self._find_signature(ingredients, tools)
+        return self.recipes[recipe_name] if recipe_name is not None else None
+    
+    def _find_name(self, folded_name):
+        """Get a recipe's name from its case-folded form, or None"""
+        recipe_name = self.names.get(folded_name)
+        if recipe_name is None and self.catalog:
+            recipe_name = self.catalog.find_folded_name(folded_name)
+        return recipe_name
+    
+    def _find_signature(self, ingredients, tools, signature=None):
+        """Get the name of the recipe using exactly these ingredients and tools, or None"""
+        if signature is None:
+            signature = recipe_signature(ingredients, tools)
+        recipe_name = self.signatures.get(signature)
+        if recipe_name is None and self.catalog:
+            recipe_name = self.catalog.find_signature(ingredients, tools)
+            # The journal may have replaced the catalog's version of the recipe
+            if recipe_name is not None and self.recipes[recipe_name].signature != signature:
+                recipe_name = None
+        return recipe_name
+    
     def get_all_recipes(self):
         """Get all recipes"""
         return list(self.recipes.values())
     
     def get_discovered_recipes(self):
         """Get all discovered recipes"""
+        if self.catalog:
+            return self.recipes.discovered()
         return [recipe for recipe in self.recipes.values() if recipe.discovered]
     
     def add_recipe(self, recipe):
         """Add a new recipe"""
+        previous = self.recipes.get(recipe.name)
+        if previous is not None and self.signatures.get(previous.signature) == previous.name:
+            del self.signatures[previous.signature]
+            
         self.recipes[recipe.name] = recipe
-        self.save_recipes()
+        self.signatures[recipe.signature] = recipe.name
+        self.names[recipe.name.casefold()] = recipe.name
+        self.index.add(recipe.name, recipe.ingredients, recipe.tools)
+        self._save_recipe(recipe)
+        
+    def add_pack_recipes(self, recipes_data):
+        """Add the recipes of content packs
+        
+        Recipes whose name or combination of ingredients and tools is
+        already known are skipped, as are any too large for the catalog
+        format. The rest are compiled into the content
+        pack catalog along with the pack recipes added before, and the
+        recipes are loaded again on top of it. Pack recipes are never
+        written to recipes.json or the save store unless they are
+        discovered.
+        
+        Args:
+            recipes_data: Iterable of recipe dictionaries
+            
+        Returns:
+            list: Recipe dictionaries added
+        """
+        # Make sure everything changed so far is saved, since it is loaded
+        # again below
+        if self.save_manager:
+            self.save_manager.sync()
+            
+        names = set()
+        signatures = set()
+        
+        def is_new(data):
+            folded_name = data["name"].casefold()
+            # Same as recipe_signature, as a string, which is far quicker to
+            # free than a million pairs of frozensets
+            signature = "\0".join(sorted(set(data["ingredients"]))) + "\0\0" + "\0".join(sorted(set(data["tools"])))
+            if folded_name in names or signature in signatures:
+                return False
+            names.add(folded_name)
+            signatures.add(signature)
+            return True
+            
+        # Saved recipes come first, then the pack recipes added before.
+        # Reading every name once is much cheaper than a catalog lookup per
+        # pack recipe
+        for data in self._saved_records():
+            is_new(data)
+        pack_records = []
+        if self.pack_catalog:
+            for recipe_id in self.catalog.ids():
+                if recipe_id >= self.saved_count:
+                    data = self.catalog.record(recipe_id)
+                    if is_new(data):
+                        pack_records.append(data)
+        added = [data for data in recipes_data if fits_record(data) and is_new(data)]
+        if not added and self.pack_catalog:
+            return []
+            
+        self._close_catalog()
+        left_out = compile_catalog(pack_records + added, PACK_RECIPES_CATALOG_FILE)
+        self.load_recipes()
+        if left_out:
+            # Their ingredients or tools didn't fit in the vocabulary
+            print(f"Left out {len(left_out)} pack recipes the recipe catalog can't hold")
+            left_out = {id(data) for data in left_out}
+            added = [data for data in added if id(data) not in left_out]
+        return added
+        
+    def _rebuild_index(self):
+        """Rebuild the lookup indexes from the loaded recipes
+        
+        Recipes that repeat an earlier recipe's combination are dropped, and
+        their discovered flag is folded into the recipe that is kept.
+        
+        Returns:
+            bool: True if any duplicate recipes were dropped
+        """
+        self.signatures = {}
+        self.names = {}
+        duplicates = []
+        
+        for recipe in self.recipes.values():
+            original_name = self.signatures.get(recipe.signature)
+            if original_name is not None:
+                self.recipes[original_name].discovered |= recipe.discovered
+                duplicates.append(recipe.name)
+                continue
+            self.signatures[recipe.signature] = recipe.name
+            self.names[recipe.name.casefold()] = recipe.name
+            
+        for name in duplicates:
+            del self.recipes[name]
+            
+        self.index.clear()
+        self.index.add_many(
+            (recipe.name, recipe.ingredients, recipe.tools) for recipe in self.recipes.values()
+        )
+        return bool(duplicates)
         
     def validate_recipe_creation(self, ingredients, tools):
         """Check if the combination of ingredients and tools can create a valid recipe
         
+        The most specific known recipe whose ingredients and tools are all
+        part of the selection wins.
+        
         Returns:
             tuple: (recipe_name, is_valid)
         """
-        # First check if this matches an existing recipe
-        for recipe_name, recipe in self.recipes.items():
-            # Check if all required ingredients are used
-            if all(ing in ingredients for ing in recipe.ingredients):
-                # Check if all required tools are used
-                if all(tool in tools for tool in recipe.tools):
-                    # Mark as discovered if it wasn't before
-                    if not recipe.discovered:
-                        recipe.discovered = True
-                        self.save_recipes()
-                    return recipe_name, True
+        # An exact combination is a single lookup; otherwise find the most
+        # specific recipe contained in the selection
+        recipe_name = self._find_signature(ingredients, tools)
+        if recipe_name is None:
+            recipe_name = self.index.match(ingredients, tools)
+            
+        if recipe_name is not None:
+            recipe = self.recipes[recipe_name]
+            # Mark as discovered if it wasn't before
+            if not recipe.discovered:
+                recipe.discovered = True
+                self._save_recipe(recipe)
+            return recipe_name, True
         
         # If no existing recipe matches, check if this could be a valid new recipe
         if len(ingredients) >= 2 and len(tools) >= 1:
@@ -144,12 +499,20 @@ class RecipeSystem:
         return None, False
     
     def _generate_recipe_name(self, ingredients):
-        """Generate a recipe name based on ingredients"""
+        """Generate a unique recipe name based on ingredients"""
         if len(ingredients) <= 2:
-            return " and ".join(ingredients).title()
+            base_name = " and ".join(ingredients).title()
         else:
             main_ingredients = ingredients[:2]
-            return f"{' and '.join(main_ingredients).title()} Mix"
+            base_name = f"{' and '.join(main_ingredients).title()} Mix"
+            
+        # Number the name if another combination already uses it
+        name = base_name
+        number = 2
+        while self._find_name(name.casefold()) is not None:
+            name = f"{base_name} {number}"
+            number += 1
+        return name
             
     def get_random_recipe(self, discovered_only=True):
         """Get a random recipe
@@ -172,14 +535,21 @@ class RecipeSystem:
     def reset(self):
         """Reset recipe system to default state"""
         # Delete the recipes file if it exists
-        if os.path.exists(RECIPES_FILE):
-            try:
-                os.remove(RECIPES_FILE)
-            except Exception as e:
-                print(f"Error deleting recipes file: {e}")
+        try:
+            if self.store:
+                # Let queued recipe updates land first, so none of them
+                # brings a recipe back
+                self.save_manager.wait_for_writer()
+                self.store.clear_recipes()
+            else:
+                delete_save_file(RECIPES_FILE, self.save_manager)
+                self.journal.clear()
+        except Exception as e:
+            print(f"Error deleting recipes file: {e}")
                 
-        # Clear recipes dictionary
-        self.recipes = {}
-        
-        # Recreate default recipes
-        self._create_default_recipes()
+        # Clear recipes, once a queued save has finished reading the
+        # catalog, then load the default recipes over the content pack ones
+        if self.save_manager:
+            self.save_manager.wait_for_writer()
+        self._close_catalog()
+        self.load_recipes()
@@ -5,15 +5,23 @@ import pygame
 import sys
 import os
 import json
+import time
 
 # Make sure we can import from the project root
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, PASTEL_COLORS
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, PASTEL_COLORS, GAME_STATE_FILE,
+    SAVE_BACKEND, SAVE_DB_FILE, FONT_WARMUP_SIZES, PAUSE_TITLE_FONT_SIZES,
+    DIRTY_RECT_RENDERING, BACKGROUND_FPS, IDLE_THROTTLING, IDLE_WAIT_MS,
+    PROFILE_PICTURES, ASSET_CACHE_DIR
+)
 from player import Player
 from logic.recipe_logic import RecipeSystem
 from logic.customer import CustomerSystem
 from logic.kitchen import Kitchen
+from logic.content_packs import import_content_packs
+from logic.game_loader import GameLoader
 from scenes.menu import MainMenu
 from scenes.game_loop import GameScene
 from scenes.recipe_creator import RecipeCreator
@@ -22,12 +30,24 @@ from scenes.recipe_book import RecipeBook
 from scenes.profile_editor import ProfileEditor
 from scenes.game_over import GameOver
 from scenes.about_scene import AboutScene
+from scenes.loading_screen import LoadingScreen
+from scenes.registry import SceneRegistry
 from ui.sprite_manager import SpriteManager
+from ui.asset_loader import AssetLoader
+from ui.fonts import warm_up, queue_warm_up, warm_up_step, get_font_stats
+from ui.input_dispatcher import filter_events, coalesce_motion
+from storage.save_manager import SaveManager, write_json
+from storage.json_writer import JsonWriter
+from storage.sqlite_store import SqliteStore
+from storage.asset_cache import AssetCache
 
 class Game:
     def __init__(self):
-        # Initialize pygame
+        # Initialize pygame, keeping event types the game doesn't read out
+        # of the queue
         pygame.init()
+        filter_events()
+        start = time.perf_counter()
         
         # Get the user's screen resolution
         info = pygame.display.Info()
@@ -40,13 +60,61 @@ class Game:
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
         self.running = True
+        self.full_redraw = True  # Next frame redraws the whole screen (dirty rect mode)
+        self.window_focused = True
+        self.window_minimized = False
         
-        # Initialize sprite manager
-        self.sprite_manager = SpriteManager()
+        # Start decoding sprites on worker threads, reading them from the
+        # decoded pixels in the asset cache
+        self.asset_cache = AssetCache(ASSET_CACHE_DIR)
+        self.sprite_manager = SpriteManager(asset_cache=self.asset_cache)
         self._load_sprites()
         
-        # Initialize game components
-        self._initialize_game_components()
+        # Load the fonts every scene uses before building them, and queue
+        # the pause menu title sizes to load while the menu is showing
+        warm_up(FONT_WARMUP_SIZES)
+        queue_warm_up(PAUSE_TITLE_FONT_SIZES)
+        self.fonts_pending = True
+        
+        # Scenes are built the first time they're shown. The sprite manager
+        # is shared, so it isn't counted in any scene's memory
+        self.scenes = SceneRegistry(shared=(self.sprite_manager,))
+        
+        # The saves and game components load on a worker thread, and the
+        # loading screen shows how far they and the sprites are
+        self.game_loader = GameLoader(self._load_game)
+        self.game_load_time = None
+        loaders = [self.asset_loader, self.game_loader]
+        self.scenes.register("loading", lambda: LoadingScreen(loaders))
+        
+        # Show the loading screen before loading the rest of the game
+        self.current_scene = "loading"
+        self.scenes.enter("loading").render(self.screen)
+        pygame.display.flip()
+        self.first_frame_time = time.perf_counter() - start
+        self.game_loader.start()
+        
+    def _load_game(self, progress):
+        """Open the saves and load the game components, on the game loader's thread
+        
+        Args:
+            progress: Callback taking a status and the fraction done
+        """
+        # Optionally keep every save in one SQLite database, importing the
+        # old JSON files the first time
+        progress("Opening saves", 0.0)
+        store = None
+        if SAVE_BACKEND == "sqlite":
+            store = SqliteStore(SAVE_DB_FILE)
+            store.import_json_files()
+            
+        # Coalesces saves so each file is written at most once per frame,
+        # and writes them on a background thread
+        self.save_manager = SaveManager(writer=JsonWriter(), store=store)
+        
+        # Load game components; their scenes are registered once loading
+        # is done, on the main thread
+        self._load_game_components(progress)
         
         # Game day system
         self.day = 1
@@ -56,9 +124,6 @@ class Game:
         self.day_length = self.day_end - self.day_start  # 8 hours
         self.current_quote = self._get_daily_quote()
         
-        # Start with the menu scene
-        self.current_scene = "menu"
-        
     def save_game_state(self):
         """Save the current game state"""
         try:
@@ -69,9 +134,11 @@ class Game:
                 "current_quote": self.current_quote
             }
             
-            # Save to file
-            with open("data/game_state.json", "w") as file:
-                json.dump(game_state, file, indent=2)
+            # Save to the store or file
+            if self.save_manager.store:
+                self.save_manager.store.save_section("game_state", game_state)
+            else:
+                write_json(GAME_STATE_FILE, game_state, self.save_manager)
                 
             # Also save customer system state
             if hasattr(self, 'customer_system'):
@@ -83,25 +150,54 @@ class Game:
     def load_game_state(self):
         """Load the game state if it exists"""
         try:
-            if os.path.exists("data/game_state.json"):
-                with open("data/game_state.json", "r") as file:
+            game_state = None
+            if self.save_manager.store:
+                game_state = self.save_manager.store.load_section("game_state")
+            elif os.path.exists(GAME_STATE_FILE):
+                with open(GAME_STATE_FILE, "r") as file:
                     game_state = json.load(file)
-                    self.day = game_state.get("day", 1)
-                    self.day_time = game_state.get("day_time", 8.0)
-                    self.current_quote = game_state.get("current_quote", self._get_daily_quote())
                     
-                    # Update customer system
-                    if hasattr(self, 'customer_system'):
-                        self.customer_system.day_count = self.day
-                        self.customer_system.difficulty_multiplier = 1.0 + (self.day - 1) * 0.1
+            if game_state:
+                self.day = game_state.get("day", 1)
+                self.day_time = game_state.get("day_time", 8.0)
+                self.current_quote = game_state.get("current_quote", self._get_daily_quote())
+                
+                # Update customer system
+                if hasattr(self, 'customer_system'):
+                    self.customer_system.day_count = self.day
+                    self.customer_system.difficulty_multiplier = 1.0 + (self.day - 1) * 0.1
         except Exception as e:
             print(f"Error loading game state: {e}")
             
     def _initialize_game_components(self):
         """Initialize or reinitialize game components"""
-        self.player = Player()
-        self.recipe_system = RecipeSystem()
-        self.kitchen = Kitchen()
+        self._load_game_components()
+        self._register_scenes()
+        
+    def _load_game_components(self, progress=None):
+        """Load the game components and the saved game state
+        
+        Args:
+            progress: Callback taking a status and the fraction done (optional)
+        """
+        progress = progress or (lambda status, fraction: None)
+        
+        # Write out anything the previous components left pending, and wait
+        # for it so the new components load what was saved
+        self.save_manager.sync()
+        
+        progress("Loading recipes", 0.1)
+        self.player = Player(self.save_manager)
+        self.recipe_system = RecipeSystem(self.save_manager)
+        self.kitchen = Kitchen(self.save_manager)
+        
+        # Only new or changed packs are read; the rest of the loading bar
+        # follows the import
+        progress("Importing content packs", 0.5)
+        import_content_packs(
+            self.kitchen, self.recipe_system, self.save_manager,
+            progress=lambda status, fraction: progress(status, 0.5 + fraction * 0.5)
+        )
         self.customer_system = CustomerSystem(self.recipe_system)
         
         # Reset day system
@@ -109,31 +205,73 @@ class Game:
         self.day_time = 8.0
         self.current_quote = self._get_daily_quote()
         
-        # Initialize scenes
-        self.scenes = {
-            "menu": MainMenu(),
-            "game": GameScene(self.player, self.customer_system, self.sprite_manager, self),
-            "cooking": RecipeCreator(self.recipe_system, self.kitchen),
-            "upgrade": UpgradeScene(self.player, self.kitchen),
-            "recipe_book": RecipeBook(self.recipe_system),
-            "profile": ProfileEditor(self.player, self.sprite_manager),
-            "game_over": GameOver(self.player),
-            "about": AboutScene()
-        }
-        
         # Load game state if not a new game
         self.load_game_state()
         
+    def _register_scenes(self):
+        """Register the scenes, dropping those built for the previous components
+        
+        Each is built with the new components when first shown.
+        """
+        scenes = self.scenes
+        scenes.register("menu", lambda: MainMenu(self.save_manager))
+        scenes.register("game", lambda: GameScene(self.player, self.customer_system, self.sprite_manager, self))
+        scenes.register("cooking", lambda: RecipeCreator(self.recipe_system, self.kitchen))
+        scenes.register("upgrade", lambda: UpgradeScene(self.player, self.kitchen))
+        scenes.register("recipe_book", lambda: RecipeBook(self.recipe_system))
+        scenes.register("profile", lambda: ProfileEditor(self.player, self.sprite_manager))
+        scenes.register("game_over", lambda: GameOver(self.player))
+        scenes.register("about", AboutScene)
+        
+    def _finish_loading_game(self):
+        """Register the scenes once the saved game is loaded
+        
+        Waits for the game loader if it is still working, so it can be
+        called before the loading screen is done.
+        """
+        if self.game_loader is None:
+            return
+        self.game_loader.wait()
+        self.game_load_time = self.game_loader.load_time
+        self.game_loader = None
+        self._register_scenes()
+        
+    def _update_loading(self):
+        """Convert a frame's worth of sprites and check on the saved game
+        
+        Returns:
+            bool: True once the sprites and the saved game are loaded
+        """
+        sprites_loaded = self.asset_loader is None or self.asset_loader.update()
+        if self.game_loader is not None and self.game_loader.is_done():
+            self._finish_loading_game()
+        return sprites_loaded and self.game_loader is None
+        
     def _load_sprites(self):
-        """Load all game sprites"""
+        """Start loading all game sprites in the background"""
+        self.asset_load_start = time.perf_counter()
+        self.asset_load_time = None
+        self.asset_loader = AssetLoader(self.asset_cache)
+        
         # Load profile pictures
-        self.sprite_manager.load_sprite("default_profile", "assets/sprites/default_profile.png")
-        self.sprite_manager.load_sprite("chef1", "assets/sprites/chef1.png")
-        self.sprite_manager.load_sprite("chef2", "assets/sprites/chef2.png")
-        self.sprite_manager.load_sprite("chef3", "assets/sprites/chef3.png")
+        self.asset_loader.load(PROFILE_PICTURES)
         
         # You can add more sprite loading here
         
+    def _finish_loading_sprites(self):
+        """Hand the sprites loaded in the background to the sprite manager
+        
+        Waits for any still loading, so it can be called before the loading
+        screen is done.
+        """
+        if self.asset_loader is None:
+            return
+        self.asset_loader.wait()
+        self.sprite_manager.load_sprites(PROFILE_PICTURES, self.asset_loader.surfaces)
+        self.asset_load_time = time.perf_counter() - self.asset_load_start
+        self.asset_loader.release()
+        self.asset_loader = None
+        
     def _get_daily_quote(self):
         """Get a quote for the current day
         
@@ -209,23 +347,95 @@ class Game:
             
         return f"{hours}:{minutes:02d} {am_pm}"
         
+    def get_text_cache_stats(self):
+        """Get the text surface cache counters of each scene
+        
+        Returns:
+            dict: Scene name -> TextRenderer cache stats
+        """
+        return {
+            name: scene.text_renderer.get_cache_stats()
+            for name, scene in self.scenes.items()
+            if hasattr(scene, "text_renderer")
+        }
+        
+    def get_font_stats(self):
+        """Get the shared font registry counters
+        
+        Returns:
+            dict: Fonts loaded, registry hits and time spent loading fonts
+        """
+        return get_font_stats()
+        
+    def get_sprite_cache_stats(self):
+        """Get the sprite cache counters
+        
+        Returns:
+            dict: Hits, misses, cached bytes against the budget and evictions
+        """
+        return self.sprite_manager.get_cache_stats()
+        
+    def get_asset_stats(self):
+        """Get how long startup took to show a frame and load the sprites, and the asset cache counters
+        
+        Returns:
+            dict: Seconds until the loading screen showed, seconds until the
+                sprites and the saved game were loaded (None while loading),
+                images read from the asset cache and images decoded
+        """
+        stats = self.asset_cache.get_cache_stats()
+        stats["first_frame_time"] = self.first_frame_time
+        stats["startup_time"] = self.asset_load_time
+        stats["game_load_time"] = self.game_load_time
+        return stats
+        
+    def get_scene_stats(self):
+        """Get how long each scene took to build and the surface memory it holds
+        
+        Returns:
+            dict: Scene name -> SceneRegistry stats
+        """
+        return self.scenes.get_stats()
+        
     def run(self):
         """Main game loop"""
         while self.running:
-            # Calculate delta time
-            dt = self.clock.tick(FPS) / 1000.0
+            # Calculate delta time, running slower while the window is in
+            # the background
+            dt = self.clock.tick(self._get_frame_rate()) / 1000.0
             
-            # Handle events
+            # Handle events, sleeping until the next one if nothing on
+            # screen would change without it
+            idle = self._can_idle()
             events = pygame.event.get()
+            if idle and not events:
+                events = self._wait_for_events()
+            events = coalesce_motion(events)
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                     
+                # Track whether the window is in the background
+                if event.type == pygame.WINDOWFOCUSLOST:
+                    self.window_focused = False
+                elif event.type == pygame.WINDOWFOCUSGAINED:
+                    self.window_focused = True
+                elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                    self.window_minimized = True
+                elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+                    self.window_minimized = False
+                    self.full_redraw = True
+                    
                 # Handle window resize
                 if event.type == pygame.VIDEORESIZE:
                     if not self.fullscreen:
                         self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
                         self.sprite_manager.update_screen_size(event.w, event.h)
+                        self.full_redraw = True
+                        
+                # The window's contents were lost and have to be redrawn
+                if event.type == pygame.VIDEOEXPOSE:
+                    self.full_redraw = True
                         
                 # Handle fullscreen toggle
                 if event.type == pygame.KEYDOWN:
@@ -241,7 +451,14 @@ class Game:
                         else:
                             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
                             self.sprite_manager.update_screen_size(SCREEN_WIDTH, SCREEN_HEIGHT)
+                        self.full_redraw = True
                     
+            # Convert the sprites decoded in the background a few at a
+            # time, then leave the loading screen for the menu once the
+            # saved game has loaded too
+            if self.current_scene == "loading" and self._update_loading():
+                self._change_scene("menu")
+                
             # Handle scene-specific events
             next_scene, data = self._handle_scene_events(events)
             if next_scene:
@@ -254,16 +471,75 @@ class Game:
                 if next_scene:
                     self._change_scene(next_scene, {})
             
-            # Render current scene
-            self._render_scene()
-            
-            # Update display
-            pygame.display.flip()
-            
-        # Clean up
+            # Render current scene, and update only the areas that changed
+            # if the scene could tell. A static scene is only drawn again
+            # after input, and nothing is drawn while minimized
+            if not self.window_minimized and (events or not idle or self.full_redraw):
+                dirty_rects = self._render_scene()
+                if dirty_rects is None:
+                    pygame.display.flip()
+                elif dirty_rects:
+                    pygame.display.update(dirty_rects)
+                    
+            # Load a queued font while the menu leaves the frame idle
+            if self.current_scene == "menu":
+                self.fonts_pending = warm_up_step()
+                
+            # Write any saves requested this frame (nothing is saved while
+            # the saved game is loading)
+            if self.game_loader is None:
+                self.save_manager.update(dt)
+                
+        # Clean up, finishing loading if the game was closed during it and
+        # waiting for the writer thread to finish every save. The recipe
+        # journal is kept for the next start, so recipes.json and its
+        # compiled catalog stay as they are
+        self._finish_loading_game()
+        self.save_manager.close()
         pygame.quit()
         sys.exit()
         
+    def _get_frame_rate(self):
+        """Get the frame rate cap, lower while the window is in the background"""
+        if self.window_focused and not self.window_minimized:
+            return FPS
+        return BACKGROUND_FPS
+        
+    def _can_idle(self):
+        """Check whether the loop can sleep until the next event
+        
+        Scenes tell whether they change without input through is_animating().
+        Scenes without it are always drawn. Pending saves and queued fonts
+        keep the loop running until they're done.
+        
+        Returns:
+            bool: True if nothing would change before the next event
+        """
+        if self.game_loader is not None:
+            return False  # The loading screen is drawn until loading is done
+        if not IDLE_THROTTLING or self.full_redraw or self.save_manager.is_dirty():
+            return False
+        if self.current_scene == "menu" and self.fonts_pending:
+            return False
+            
+        scene = self.scenes[self.current_scene]
+        return hasattr(scene, "is_animating") and not scene.is_animating()
+        
+    def _wait_for_events(self):
+        """Sleep until an event arrives, or IDLE_WAIT_MS passes
+        
+        Returns:
+            list: Events that arrived, empty if the wait timed out
+        """
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        
+        # Time spent asleep didn't pass in the game
+        self.clock.tick()
+        
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+        
     def _handle_scene_events(self, events):
         """Handle events for the current scene
         
@@ -307,11 +583,22 @@ class Game:
         return None
             
     def _render_scene(self):
-        """Render the current scene"""
+        """Render the current scene
+        
+        Returns:
+            list or None: Screen areas that changed, or None if the whole
+                screen has to be updated
+        """
         scene = self.scenes[self.current_scene]
+        full_redraw = self.full_redraw
+        self.full_redraw = False
         
+        if DIRTY_RECT_RENDERING and hasattr(scene, "render_dirty"):
+            return scene.render_dirty(self.screen, full=full_redraw)
+            
         if hasattr(scene, "render"):
             scene.render(self.screen)
+        return None
             
     def _change_scene(self, scene_name, data=None):
         """Change to a different scene
@@ -320,7 +607,15 @@ class Game:
             scene_name: Name of the scene to change to
             data: Optional data to pass to the scene
         """
+        # Scenes draw the sprites and the game components, so they have to
+        # be loaded first
+        self._finish_loading_sprites()
+        self._finish_loading_game()
+        
         if scene_name in self.scenes:
+            # Persist pending changes before leaving the current scene
+            self.save_manager.flush()
+            
             # Check for new game request
             if scene_name == "game" and data and data.get("new_game", False):
                 # Reset kitchen to default state
@@ -339,10 +634,13 @@ class Game:
             if scene_name == "cooking":
                 # Advance time when cooking (30 minutes)
                 self.advance_time(0.5)
-                # Refresh the cooking interface with the latest ingredients
-                self.scenes["cooking"] = RecipeCreator(self.recipe_system, self.kitchen)
                 
+            # Leave the current scene for the new one, which frees the
+            # surfaces of the one left. The cooking scene refreshes its
+            # ingredients when entered
+            self.scenes.enter(scene_name)
             self.current_scene = scene_name
+            self.full_redraw = True
             
             # Handle special scene transitions
             if scene_name == "game" and data and "cooked_dish" in data:
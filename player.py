@@ -6,11 +6,14 @@ import os
 from config import (
     STARTING_COINS, STARTING_LEVEL, STARTING_XP, XP_TO_LEVEL, 
     XP_LEVEL_MULTIPLIER, DEFAULT_USERNAME, DEFAULT_PROFILE_PIC,
-    PROFILE_FILE
+    PROFILE_FILE, SAVE_FILE
 )
+from storage.save_manager import write_json
 
 class Player:
-    def __init__(self):
+    def __init__(self, save_manager=None):
+        self.save_manager = save_manager
+        self.store = save_manager.store if save_manager else None  # SqliteStore (optional)
         self.coins = STARTING_COINS
         self.level = STARTING_LEVEL
         self.experience = STARTING_XP
@@ -22,17 +25,17 @@ class Player:
         self.load_player_data()
         
     def load_player_data(self):
-        """Load player data from save file if it exists"""
-        save_path = "data/save.json"
+        """Load player data from the save store or save file if it exists"""
+        if self.store:
+            self._apply_player_data(self.store.load_section("player"))
+            self._apply_profile_data(self.store.load_section("profile"))
+            return
+            
+        save_path = SAVE_FILE
         if os.path.exists(save_path):
             try:
                 with open(save_path, "r") as file:
-                    data = json.load(file)
-                    self.coins = data.get("coins", STARTING_COINS)
-                    self.level = data.get("level", STARTING_LEVEL)
-                    self.experience = data.get("experience", STARTING_XP)
-                    self.experience_to_next_level = data.get("experience_to_next_level", XP_TO_LEVEL)
-                    self.consecutive_lost_customers = data.get("consecutive_lost_customers", 0)
+                    self._apply_player_data(json.load(file))
             except Exception as e:
                 print(f"Error loading player data: {e}")
                 
@@ -40,22 +43,34 @@ class Player:
         if os.path.exists(PROFILE_FILE):
             try:
                 with open(PROFILE_FILE, "r") as file:
-                    data = json.load(file)
-                    self.username = data.get("username", DEFAULT_USERNAME)
-                    self.profile_pic = data.get("profile_pic", DEFAULT_PROFILE_PIC)
-                    
-                    # Load color as a list and convert to tuple
-                    color_list = data.get("color", [0, 255, 0])
-                    self.color = tuple(color_list)
+                    self._apply_profile_data(json.load(file))
             except Exception as e:
                 print(f"Error loading profile data: {e}")
                 
+    def _apply_player_data(self, data):
+        """Copy saved progression values onto the player"""
+        if not data:
+            return
+        self.coins = data.get("coins", STARTING_COINS)
+        self.level = data.get("level", STARTING_LEVEL)
+        self.experience = data.get("experience", STARTING_XP)
+        self.experience_to_next_level = data.get("experience_to_next_level", XP_TO_LEVEL)
+        self.consecutive_lost_customers = data.get("consecutive_lost_customers", 0)
+        
+    def _apply_profile_data(self, data):
+        """Copy saved profile values onto the player"""
+        if not data:
+            return
+        self.username = data.get("username", DEFAULT_USERNAME)
+        self.profile_pic = data.get("profile_pic", DEFAULT_PROFILE_PIC)
+        
+        # Load color as a list and convert to tuple
+        color_list = data.get("color", [0, 255, 0])
+        self.color = tuple(color_list)
+                
     def save_player_data(self):
         """Save player data to file"""
-        save_path = "data/save.json"
         try:
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            
             data = {
                 "coins": self.coins,
                 "level": self.level,
@@ -64,26 +79,42 @@ class Player:
                 "consecutive_lost_customers": self.consecutive_lost_customers
             }
             
-            with open(save_path, "w") as file:
-                json.dump(data, file, indent=2)
+            if self.store:
+                self.store.save_section("player", data)
+            else:
+                write_json(SAVE_FILE, data, self.save_manager)
         except Exception as e:
             print(f"Error saving player data: {e}")
             
     def save_profile_data(self):
         """Save profile data to file"""
         try:
-            os.makedirs(os.path.dirname(PROFILE_FILE), exist_ok=True)
-            
             data = {
                 "username": self.username,
                 "profile_pic": self.profile_pic,
                 "color": list(self.color)  # Convert tuple to list for JSON serialization
             }
             
-            with open(PROFILE_FILE, "w") as file:
-                json.dump(data, file, indent=2)
+            if self.store:
+                self.store.save_section("profile", data)
+            else:
+                write_json(PROFILE_FILE, data, self.save_manager)
         except Exception as e:
             print(f"Error saving profile data: {e}")
+            
+    def request_save(self):
+        """Save player data, deferring to the save manager if there is one"""
+        if self.save_manager:
+            self.save_manager.mark_dirty("player", self.save_player_data)
+        else:
+            self.save_player_data()
+            
+    def request_profile_save(self):
+        """Save profile data, deferring to the save manager if there is one"""
+        if self.save_manager:
+            self.save_manager.mark_dirty("profile", self.save_profile_data)
+        else:
+            self.save_profile_data()
         
     def add_coins(self, amount):
         """Add coins to player
@@ -92,7 +123,7 @@ class Player:
             amount: Amount of coins to add
         """
         self.coins += amount
-        self.save_player_data()
+        self.request_save()
         
     def spend_coins(self, amount):
         """Spend coins if player has enough
@@ -105,7 +136,7 @@ class Player:
         """
         if self.coins >= amount:
             self.coins -= amount
-            self.save_player_data()
+            self.request_save()
             return True
         return False
         
@@ -122,10 +153,10 @@ class Player:
         
         if self.experience >= self.experience_to_next_level:
             self.level_up()
-            self.save_player_data()
+            self.request_save()
             return True
             
-        self.save_player_data()
+        self.request_save()
         return False
         
     def level_up(self):
@@ -141,7 +172,7 @@ class Player:
             username: New username
         """
         self.username = username
-        self.save_profile_data()
+        self.request_profile_save()
         
     def update_profile_pic(self, profile_pic):
         """Update player profile picture
@@ -150,7 +181,7 @@ class Player:
             profile_pic: Path to new profile picture
         """
         self.profile_pic = profile_pic
-        self.save_profile_data()
+        self.request_profile_save()
         
     def update_color(self, color):
         """Update player color theme
@@ -159,7 +190,7 @@ class Player:
             color: RGB color tuple
         """
         self.color = color
-        self.save_profile_data()
+        self.request_profile_save()
         
     def add_lost_customer(self):
         """Add a lost customer to the counter
@@ -168,10 +199,10 @@ class Player:
             bool: True if player has lost too many customers
         """
         self.consecutive_lost_customers += 1
-        self.save_player_data()
+        self.request_save()
         return self.consecutive_lost_customers
         
     def reset_lost_customers(self):
         """Reset the lost customer counter"""
         self.consecutive_lost_customers = 0
-        self.save_player_data()
+        self.request_save()
@@ -3,13 +3,17 @@ About scene
 """
 import pygame
 from ui.buttons import Button
+from ui.input_dispatcher import InputDispatcher
 from ui.text import TextRenderer
+from ui.layers import StaticLayers
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, BEIGE
 
 class AboutScene:
     def __init__(self):
         self.text_renderer = TextRenderer()
         self.back_button = Button(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 70, 100, 40, "Back")
+        self.input = InputDispatcher([self.back_button])
+        self.background = StaticLayers(self._render_background)
         
     def handle_events(self, events):
         """Handle events for the about scene
@@ -21,10 +25,10 @@ class AboutScene:
             str or None: Next scene name if transitioning, None otherwise
         """
         mouse_pos = pygame.mouse.get_pos()
-        self.back_button.is_hovered(mouse_pos)
+        self.input.update_hover(mouse_pos)
         
         for event in events:
-            if self.back_button.is_clicked(mouse_pos, event):
+            if self.input.get_clicked(event) is self.back_button:
                 return "menu"
                 
         return None
@@ -37,9 +41,34 @@ class AboutScene:
         """
         pass
         
+    def is_animating(self):
+        """Check whether the about scene changes without input
+        
+        Returns:
+            bool: Always False, nothing here moves on its own
+        """
+        return False
+        
+    def on_exit(self):
+        """Free the about page's background and text while it isn't shown"""
+        self.background.invalidate()
+        self.text_renderer.clear_cache()
+        
     def render(self, screen):
         """Render the about scene
         
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Everything but the back button is static
+        self.background.draw(screen)
+        
+        # Draw back button
+        self.back_button.draw(screen)
+        
+    def _render_background(self, screen):
+        """Render the title and about text
+        
         Args:
             screen: Pygame surface to render on
         """
@@ -69,32 +98,30 @@ class AboutScene:
         )
         
         # Draw game description
-        about_text = [
-            "Kusina ni Jai is a cooking simulation game where you play as a chef",
-            "serving customers with both known and custom Filipino recipes.",
-            "",
-            "This game was created as a project to showcase Filipino cuisine",
-            "and provide a fun, educational experience about cooking.",
-            "",
-            "The game features traditional Filipino dishes like Adobo, Sinigang,",
-            "Lumpia, and many more, along with their key ingredients.",
-            "",
+        about_text = (
+            "Kusina ni Jai is a cooking simulation game where you play as a chef\n"
+            "serving customers with both known and custom Filipino recipes.\n"
+            "\n"
+            "This game was created as a project to showcase Filipino cuisine\n"
+            "and provide a fun, educational experience about cooking.\n"
+            "\n"
+            "The game features traditional Filipino dishes like Adobo, Sinigang,\n"
+            "Lumpia, and many more, along with their key ingredients.\n"
+            "\n"
             "I hope you enjoy playing this game as much as I enjoyed creating it!"
-        ]
-        
-        y_pos = 180
-        for line in about_text:
-            self.text_renderer.render_text(
-                screen,
-                line,
-                "small",
-                BLACK,
-                SCREEN_WIDTH // 2,
-                y_pos,
-                "center"
-            )
-            y_pos += 30
-            
+        )
+        
+        y_pos = self.text_renderer.render_text_block(
+            screen,
+            about_text,
+            "small",
+            BLACK,
+            SCREEN_WIDTH // 2,
+            180,
+            line_height=30,
+            align="center"
+        )
+        
         # Draw inspiration section
         self.text_renderer.render_text(
             screen,
@@ -106,26 +133,21 @@ class AboutScene:
             "center"
         )
         
-        inspiration_text = [
-            "This game was inspired by my love for Filipino food and cooking games.",
-            "I wanted to create something that celebrates our culinary heritage",
-            "while also being fun and engaging for players of all backgrounds.",
-            "",
+        inspiration_text = (
+            "This game was inspired by my love for Filipino food and cooking games.\n"
+            "I wanted to create something that celebrates our culinary heritage\n"
+            "while also being fun and engaging for players of all backgrounds.\n"
+            "\n"
             "Special thanks to my family for their support and recipe suggestions!"
-        ]
-        
-        y_pos += 60
-        for line in inspiration_text:
-            self.text_renderer.render_text(
-                screen,
-                line,
-                "small",
-                BLACK,
-                SCREEN_WIDTH // 2,
-                y_pos,
-                "center"
-            )
-            y_pos += 30
+        )
         
-        # Draw back button
-        self.back_button.draw(screen)
+        self.text_renderer.render_text_block(
+            screen,
+            inspiration_text,
+            "small",
+            BLACK,
+            SCREEN_WIDTH // 2,
+            y_pos + 60,
+            line_height=30,
+            align="center"
+        )
@@ -3,7 +3,12 @@ Main game loop scene
 """
 import pygame
 from ui.buttons import Button
+from ui.input_dispatcher import InputDispatcher
 from ui.text import TextRenderer
+from ui.fonts import get_font
+from ui.dirty_regions import DirtyRegions
+from ui.layers import StaticLayers
+from ui.modal import ModalBackdrop, dim
 from ui.animation_manager import AnimationManager, EasingAnimation
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, GREEN, BLUE, LIGHT_GRAY,
@@ -17,6 +22,8 @@ class GameScene:
         self.sprite_manager = sprite_manager
         self.game_instance = game_instance  # Reference to the main game for day/time
         self.text_renderer = TextRenderer()
+        self.background = StaticLayers(self._render_background)
+        self.backdrop = ModalBackdrop()  # The scene under the pause menu or daily quote
         
         # Animation manager
         self.animation_manager = AnimationManager()
@@ -45,6 +52,14 @@ class GameScene:
         self.pause_menu_button = Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2, 200, 50, "Main Menu")
         self.pause_exit_button = Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 60, 200, 50, "Exit Game")
         
+        # Route the mouse to the buttons of the game screen, or of the
+        # pause menu while it is open
+        self.game_input = InputDispatcher([
+            self.cooking_button, self.upgrade_button, self.recipe_book_button,
+            self.profile_button, self.save_button, self.menu_button, self.pause_button
+        ])
+        self.pause_input = InputDispatcher([self.resume_button, self.pause_menu_button, self.pause_exit_button])
+        
         # Customer animations
         self.customer_animations = {}
         
@@ -52,6 +67,10 @@ class GameScene:
         self.show_quote = True
         self.quote_timer = 5.0  # Show quote for 5 seconds
         
+        # What each part of the screen showed last frame (dirty rect mode)
+        self.dirty_regions = DirtyRegions()
+        self.full_redraw_pending = False  # An overlay covered the last frame
+        
     def _setup_animations(self):
         """Set up animations"""
         # Button hover animations
@@ -107,61 +126,58 @@ class GameScene:
         
         # If pause menu is active, only handle pause menu events
         if self.pause_menu_active:
-            self.resume_button.is_hovered(mouse_pos)
-            self.pause_menu_button.is_hovered(mouse_pos)
-            self.pause_exit_button.is_hovered(mouse_pos)
+            self.pause_input.update_hover(mouse_pos)
             
             for event in events:
-                if self.resume_button.is_clicked(mouse_pos, event):
+                clicked = self.pause_input.get_clicked(event)
+                if clicked is self.resume_button:
                     self.pause_menu_active = False
                     self.paused = False
                     return None
                     
-                if self.pause_menu_button.is_clicked(mouse_pos, event):
+                if clicked is self.pause_menu_button:
                     self.pause_menu_active = False
                     self.paused = False
                     return "menu"
                     
-                if self.pause_exit_button.is_clicked(mouse_pos, event):
-                    pygame.quit()
-                    import sys
-                    sys.exit()
+                if clicked is self.pause_exit_button:
+                    # Let the main loop shut down so pending saves are written
+                    pygame.event.post(pygame.event.Event(pygame.QUIT))
+                    return None
                     
             return None
         
         # Regular game events
-        self.cooking_button.is_hovered(mouse_pos)
-        self.upgrade_button.is_hovered(mouse_pos)
-        self.recipe_book_button.is_hovered(mouse_pos)
-        self.profile_button.is_hovered(mouse_pos)
-        self.save_button.is_hovered(mouse_pos)
-        self.menu_button.is_hovered(mouse_pos)
-        self.pause_button.is_hovered(mouse_pos)
+        self.game_input.update_hover(mouse_pos)
         
         for event in events:
-            if self.cooking_button.is_clicked(mouse_pos, event):
+            clicked = self.game_input.get_clicked(event)
+            if clicked is None:
+                continue
+                
+            if clicked is self.cooking_button:
                 return "cooking"
                 
-            if self.upgrade_button.is_clicked(mouse_pos, event):
+            if clicked is self.upgrade_button:
                 return "upgrade"
                 
-            if self.recipe_book_button.is_clicked(mouse_pos, event):
+            if clicked is self.recipe_book_button:
                 return "recipe_book"
                 
-            if self.profile_button.is_clicked(mouse_pos, event):
+            if clicked is self.profile_button:
                 return "profile"
                 
-            if self.save_button.is_clicked(mouse_pos, event):
+            if clicked is self.save_button:
                 self.player.save_player_data()
                 # Save game state
                 if self.game_instance:
                     self.game_instance.save_game_state()
                 self.show_message("Game saved!", 2.0)
                 
-            if self.menu_button.is_clicked(mouse_pos, event):
+            if clicked is self.menu_button:
                 return "menu"
                 
-            if self.pause_button.is_clicked(mouse_pos, event):
+            if clicked is self.pause_button:
                 self.paused = True
                 self.pause_menu_active = True
                 # Reset and start pause menu animation
@@ -237,6 +253,36 @@ class GameScene:
             
         return events, None
         
+    def is_animating(self):
+        """Check whether the game scene changes without input
+        
+        Customers lose patience every frame while the game runs. Paused, the
+        scene only moves while the daily quote counts down or the pause menu,
+        a message or customer entrances animate. The quote animation loops
+        forever but is only drawn with the quote, so it doesn't count.
+        
+        Returns:
+            bool: True if the next frame may differ from this one
+        """
+        if self.show_quote:
+            return True
+        if not self.paused:
+            return True
+        names = ["pause_menu"]
+        if self.message_timer > 0:
+            names.append("message_fade")
+        names.extend(f"customer_{customer_id}" for customer_id in self.customer_animations)
+        return self.animation_manager.is_running(names)
+        
+    def on_exit(self):
+        """Free the cached background and text while another scene is shown
+        
+        The customers, day and any open pause menu are kept as they are.
+        """
+        self.background.invalidate()
+        self.backdrop.release()
+        self.text_renderer.clear_cache()
+        
     def show_message(self, message, duration=2.0):
         """Show a temporary message
         
@@ -258,8 +304,35 @@ class GameScene:
         Args:
             screen: Pygame surface to render on
         """
-        # Clear screen
-        screen.fill(LIGHT_GRAY)
+        # Nothing changes under the pause menu or daily quote, so the scene
+        # is drawn once when they open and reused until they close
+        if self.pause_menu_active:
+            self.backdrop.draw(
+                screen, self._render_scene, int(180 * self._get_pause_progress()), self._get_backdrop_key()
+            )
+            self._render_pause_menu(screen)
+            
+            # Render daily quote if active
+            if self._is_quote_visible():
+                dim(screen, int(180 * self._get_quote_opacity()))
+                self._render_daily_quote(screen)
+        elif self._is_quote_visible():
+            self.backdrop.draw(
+                screen, self._render_scene, int(180 * self._get_quote_opacity()), self._get_backdrop_key()
+            )
+            self._render_daily_quote(screen)
+        else:
+            self.backdrop.release()
+            self._render_scene(screen)
+            
+    def _render_scene(self, screen):
+        """Render everything but the pause menu and daily quote
+        
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Background, customer slots and clock labels never change
+        self.background.draw(screen)
         
         # Render customers at the top
         self._render_customers(screen)
@@ -282,19 +355,8 @@ class GameScene:
         
         # Render message if active
         if self.message:
-            # Get message fade animation progress
-            message_anim = self.animation_manager.get_animation("message_fade")
-            opacity = 1.0
-            if message_anim:
-                # Fade in for the first half of the message duration
-                if self.message_timer > 0:
-                    time_ratio = min(1.0, (2.0 - self.message_timer) / 2.0)
-                    opacity = message_anim.get_progress() if time_ratio < 0.5 else 1.0
-                else:
-                    opacity = 0.0
-            
             # Apply opacity to text color
-            text_color = (0, 0, 0, int(255 * opacity))
+            text_color = (0, 0, 0, int(255 * self._get_message_opacity()))
             
             self.text_renderer.render_text(
                 screen,
@@ -306,13 +368,183 @@ class GameScene:
                 "center"
             )
             
-        # Render pause menu if active
-        if self.pause_menu_active:
-            self._render_pause_menu(screen)
+    def render_dirty(self, screen, full=False):
+        """Render only the parts of the scene that changed since last frame
+        
+        The scene is rendered once, clipped to the area around everything
+        that changed, so unchanged parts cost no drawing. The whole scene is
+        redrawn when asked to, and while the pause menu or daily quote
+        covers the screen.
+        
+        Args:
+            screen: Pygame surface to render on
+            full: Redraw everything, e.g. after a scene change or resize
             
-        # Render daily quote if active
-        if self.show_quote and self.game_instance and hasattr(self.game_instance, 'current_quote'):
-            self._render_daily_quote(screen)
+        Returns:
+            list or None: Screen areas that changed, or None if the whole
+                screen was redrawn
+        """
+        self._mark_dirty_regions()
+        rects = self.dirty_regions.collect()
+        
+        overlay = self.pause_menu_active or self._is_quote_visible()
+        if full or overlay or self.full_redraw_pending:
+            # The frame after an overlay closes has to be redrawn whole too
+            self.full_redraw_pending = overlay
+            self.render(screen)
+            return None
+            
+        screen_rect = screen.get_rect()
+        rects = [rect.clip(screen_rect) for rect in rects]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        if rects:
+            screen.set_clip(rects[0].unionall(rects[1:]))
+            self.render(screen)
+            screen.set_clip(None)
+        return rects
+        
+    def _mark_dirty_regions(self):
+        """Describe what each changing part of the scene shows this frame"""
+        regions = self.dirty_regions
+        
+        # Customers: the icon, name and order, and the patience bar, which
+        # is redrawn only when its fill moves by a pixel
+        slot_width = SCREEN_WIDTH // self.customer_system.customers.maxlen
+        for i, customer in enumerate(self.customer_system.customers):
+            icon_size = 20 + int(10 * self._get_customer_progress(customer))
+            regions.mark(
+                f"customer_{i}",
+                pygame.Rect(i * slot_width, 0, slot_width, 110).unionall([
+                    self.text_renderer.get_text_rect(
+                        customer.name, "small", i * slot_width + slot_width // 2, 70, "center"
+                    ),
+                    self.text_renderer.get_text_rect(
+                        f"Order: {customer.order}", "small", i * slot_width + 10, 100
+                    )
+                ]),
+                (id(customer), customer.name, customer.order, icon_size)
+            )
+            
+            patience_pct = customer.get_patience_percentage()
+            bar_width = slot_width - 20
+            regions.mark(
+                f"patience_{i}",
+                (i * slot_width + 10, 120, bar_width, 10),
+                (int(bar_width * patience_pct), patience_pct > 0.6, patience_pct > 0.3)
+            )
+            
+        # Player info
+        player = self.player
+        regions.mark(
+            "player",
+            pygame.Rect(17, 167, 66, 66).unionall([
+                self.text_renderer.get_text_rect(player.username, "medium", 100, 180),
+                self.text_renderer.get_counter_rect(f"Coins: {player.coins}", "medium", 100, 210),
+                self.text_renderer.get_counter_rect(f"Level: {player.level}", "medium", 20, 250),
+                self.text_renderer.get_counter_rect(
+                    f"XP: {player.experience}/{player.experience_to_next_level}", "small", 20, 280
+                ),
+                pygame.Rect(20, 300, 200, 10)
+            ]),
+            (getattr(player, "color", None), player.profile_pic, player.username, player.coins,
+             player.level, player.experience, player.experience_to_next_level)
+        )
+        
+        # Day, time and the day progress bar
+        if self.game_instance:
+            day_text = f"Day {self.game_instance.day}"
+            time_text = self.game_instance.get_formatted_time()
+            regions.mark(
+                "day",
+                self.text_renderer.get_counter_rect(day_text, "medium", SCREEN_WIDTH - 150, 70, "center"),
+                day_text
+            )
+            regions.mark(
+                "time",
+                self.text_renderer.get_counter_rect(time_text, "medium", SCREEN_WIDTH - 150, 100, "center"),
+                time_text
+            )
+            regions.mark(
+                "day_progress",
+                (SCREEN_WIDTH - 250, 130, 200, 10),
+                int(200 * self.game_instance.get_day_progress())
+            )
+            
+        # Buttons change when hovered
+        for name in ("cooking_button", "upgrade_button", "recipe_book_button", "profile_button",
+                     "save_button", "menu_button", "pause_button"):
+            button = getattr(self, name)
+            regions.mark(name, button.get_draw_rect(), button.get_render_key())
+            
+        # Message
+        if self.message:
+            opacity = int(255 * self._get_message_opacity())
+            regions.mark(
+                "message",
+                self.text_renderer.get_text_rect(self.message, "medium", SCREEN_WIDTH // 2, 500, "center"),
+                (self.message, opacity)
+            )
+            
+    def _get_message_opacity(self):
+        """Get the opacity of the message, which fades in when shown"""
+        message_anim = self.animation_manager.get_animation("message_fade")
+        opacity = 1.0
+        if message_anim:
+            # Fade in for the first half of the message duration
+            if self.message_timer > 0:
+                time_ratio = min(1.0, (2.0 - self.message_timer) / 2.0)
+                opacity = message_anim.get_progress() if time_ratio < 0.5 else 1.0
+            else:
+                opacity = 0.0
+        return opacity
+        
+    def _is_quote_visible(self):
+        return self.show_quote and self.game_instance and hasattr(self.game_instance, 'current_quote')
+            
+    def _render_background(self, screen):
+        """Render the background, the empty customer slots and the clock labels
+        
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Clear screen
+        screen.fill(LIGHT_GRAY)
+        
+        # Customer area background
+        customer_area_height = 150
+        pygame.draw.rect(screen, (200, 220, 240), (0, 0, SCREEN_WIDTH, customer_area_height))
+        
+        # Draw customer slots
+        slot_width = SCREEN_WIDTH // self.customer_system.customers.maxlen
+        for i in range(self.customer_system.customers.maxlen):
+            slot_rect = pygame.Rect(i * slot_width, 0, slot_width, customer_area_height)
+            pygame.draw.rect(screen, (180, 200, 220), slot_rect, 2)
+            
+        # Draw start and end times under the day progress bar
+        if self.game_instance:
+            bar_width = 200
+            bar_x = SCREEN_WIDTH - 250
+            bar_y = 130
+            
+            self.text_renderer.render_text(
+                screen,
+                "8:00 AM",
+                "small",
+                BLACK,
+                bar_x,
+                bar_y + 20,
+                "left"
+            )
+            
+            self.text_renderer.render_text(
+                screen,
+                "4:00 PM",
+                "small",
+                BLACK,
+                bar_x + bar_width,
+                bar_y + 20,
+                "right"
+            )
             
     def _render_day_time(self, screen):
         """Render the day and time information
@@ -321,7 +553,7 @@ class GameScene:
             screen: Pygame surface to render on
         """
         # Draw day number
-        self.text_renderer.render_text(
+        self.text_renderer.render_counter(
             screen,
             f"Day {self.game_instance.day}",
             "medium",
@@ -332,7 +564,7 @@ class GameScene:
         )
         
         # Draw current time
-        self.text_renderer.render_text(
+        self.text_renderer.render_counter(
             screen,
             self.game_instance.get_formatted_time(),
             "medium",
@@ -355,27 +587,6 @@ class GameScene:
         # Progress bar
         pygame.draw.rect(screen, PASTEL_COLORS[2], (bar_x, bar_y, int(bar_width * progress), bar_height))
         pygame.draw.rect(screen, BLACK, (bar_x, bar_y, bar_width, bar_height), 1)
-        
-        # Draw start and end times
-        self.text_renderer.render_text(
-            screen,
-            "8:00 AM",
-            "small",
-            BLACK,
-            bar_x,
-            bar_y + 20,
-            "left"
-        )
-        
-        self.text_renderer.render_text(
-            screen,
-            "4:00 PM",
-            "small",
-            BLACK,
-            bar_x + bar_width,
-            bar_y + 20,
-            "right"
-        )
             
     def _render_daily_quote(self, screen):
         """Render the daily quote overlay
@@ -387,23 +598,8 @@ class GameScene:
         if not self.game_instance or not hasattr(self.game_instance, 'current_quote'):
             return
             
-        # Get quote animation progress
-        quote_anim = self.animation_manager.get_animation("quote_fade")
-        progress = quote_anim.get_progress() if quote_anim else 1.0
-        
-        # Calculate opacity based on time remaining
-        fade_time = 1.0  # Fade in/out time in seconds
-        if self.quote_timer < fade_time:
-            opacity = self.quote_timer / fade_time
-        elif self.quote_timer > 4.0:  # 5.0 - fade_time
-            opacity = (5.0 - self.quote_timer) / fade_time
-        else:
-            opacity = 1.0
-            
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, int(180 * opacity)))  # Black with alpha
-        screen.blit(overlay, (0, 0))
+        # The dimmed scene under the quote is drawn by render()
+        opacity = self._get_quote_opacity()
         
         # Draw day number
         self.text_renderer.render_text(
@@ -416,35 +612,18 @@ class GameScene:
             "center"
         )
         
-        # Draw quote
-        quote = self.game_instance.current_quote
-        
-        # Split quote into multiple lines if needed
-        words = quote.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            if len(current_line + " " + word) <= 50:
-                current_line += " " + word if current_line else word
-            else:
-                lines.append(current_line)
-                current_line = word
-                
-        if current_line:
-            lines.append(current_line)
-            
-        # Draw each line
-        for i, line in enumerate(lines):
-            self.text_renderer.render_text(
-                screen,
-                line,
-                "medium",
-                (255, 255, 255, int(255 * opacity)),
-                SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT // 2 - 30 + i * 30,
-                "center"
-            )
+        # Draw quote, wrapped to lines at most 560 pixels wide
+        self.text_renderer.render_text_block(
+            screen,
+            self.game_instance.current_quote,
+            "medium",
+            (255, 255, 255, int(255 * opacity)),
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2 - 30,
+            max_width=560,
+            line_height=30,
+            align="center"
+        )
             
         # Draw tap to continue message
         self.text_renderer.render_text(
@@ -457,24 +636,42 @@ class GameScene:
             "center"
         )
             
+    def _get_backdrop_key(self):
+        """Describe what still animates under the pause menu and daily quote
+        
+        Customer entrance animations keep playing while the game is paused.
+        """
+        return tuple(
+            20 + int(10 * self._get_customer_progress(customer))
+            for customer in self.customer_system.customers
+        )
+        
+    def _get_quote_opacity(self):
+        """Get the opacity of the daily quote, which fades in and out"""
+        fade_time = 1.0  # Fade in/out time in seconds
+        if self.quote_timer < fade_time:
+            return self.quote_timer / fade_time
+        elif self.quote_timer > 4.0:  # 5.0 - fade_time
+            return (5.0 - self.quote_timer) / fade_time
+        return 1.0
+        
+    def _get_pause_progress(self):
+        """Get the progress of the pause menu's opening animation"""
+        pause_anim = self.animation_manager.get_animation("pause_menu")
+        return pause_anim.get_progress() if pause_anim else 1.0
+        
     def _render_pause_menu(self, screen):
-        """Render the pause menu overlay
+        """Render the pause menu over the dimmed scene
         
         Args:
             screen: Pygame surface to render on
         """
-        # Get pause menu animation progress
-        pause_anim = self.animation_manager.get_animation("pause_menu")
-        progress = pause_anim.get_progress() if pause_anim else 1.0
-        
-        # Semi-transparent overlay with animation
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, int(180 * progress)))  # Black with animated alpha
-        screen.blit(overlay, (0, 0))
+        # The dimmed scene under the menu is drawn by render()
+        progress = self._get_pause_progress()
         
         # Pause menu title with scale animation
         scale = 0.5 + 0.5 * progress  # Scale from 0.5 to 1.0
-        title_font = pygame.font.SysFont(None, int(64 * scale))
+        title_font = get_font(int(64 * scale))
         title_text = title_font.render("PAUSED", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
         screen.blit(title_text, title_rect)
@@ -521,34 +718,13 @@ class GameScene:
         Args:
             screen: Pygame surface to render on
         """
-        # Customer area background
-        customer_area_height = 150
-        pygame.draw.rect(screen, (200, 220, 240), (0, 0, SCREEN_WIDTH, customer_area_height))
-        
-        # Draw customer slots
+        # The area and empty slots are part of the cached background
         slot_width = SCREEN_WIDTH // self.customer_system.customers.maxlen
         
         for i in range(self.customer_system.customers.maxlen):
-            slot_rect = pygame.Rect(i * slot_width, 0, slot_width, customer_area_height)
-            pygame.draw.rect(screen, (180, 200, 220), slot_rect, 2)
-            
             if i < len(self.customer_system.customers):
                 customer = list(self.customer_system.customers)[i]
-                
-                # Create animation for this customer if it doesn't exist
-                customer_id = id(customer)
-                if customer_id not in self.customer_animations:
-                    self.animation_manager.create_easing_animation(
-                        f"customer_{customer_id}",
-                        0.5,
-                        EasingAnimation.EASING_BOUNCE,
-                        False
-                    )
-                    self.customer_animations[customer_id] = True
-                
-                # Get animation progress
-                anim = self.animation_manager.get_animation(f"customer_{customer_id}")
-                progress = anim.get_progress() if anim else 1.0
+                progress = self._get_customer_progress(customer)
                 
                 # Draw customer icon with animation
                 icon_size = 20 + int(10 * progress)  # Size grows from 20 to 30
@@ -597,6 +773,30 @@ class GameScene:
                     patience_pct
                 )
                 
+    def _get_customer_progress(self, customer):
+        """Get the progress of a customer's entrance animation
+        
+        Args:
+            customer: Customer object
+            
+        Returns:
+            float: Animation progress (0.0 to 1.0)
+        """
+        # Create animation for this customer if it doesn't exist
+        customer_id = id(customer)
+        if customer_id not in self.customer_animations:
+            self.animation_manager.create_easing_animation(
+                f"customer_{customer_id}",
+                0.5,
+                EasingAnimation.EASING_BOUNCE,
+                False
+            )
+            self.customer_animations[customer_id] = True
+            
+        # Get animation progress
+        anim = self.animation_manager.get_animation(f"customer_{customer_id}")
+        return anim.get_progress() if anim else 1.0
+        
     def _render_player_info(self, screen):
         """Render player information
         
@@ -614,9 +814,8 @@ class GameScene:
         if self.sprite_manager:
             # Extract sprite name from path
             sprite_name = self.player.profile_pic.split("/")[-1].split(".")[0]
-            sprite = self.sprite_manager.get_sprite(sprite_name)
-            # Scale sprite to fit the profile rect
-            sprite = pygame.transform.scale(sprite, (profile_rect.width, profile_rect.height))
+            # Sprite scaled to fit the profile rect
+            sprite = self.sprite_manager.get_scaled_sprite(sprite_name, profile_rect.width, profile_rect.height)
             screen.blit(sprite, profile_rect)
         else:
             # Draw placeholder if sprite manager is not available
@@ -636,7 +835,7 @@ class GameScene:
         )
         
         # Draw coins
-        self.text_renderer.render_text(
+        self.text_renderer.render_counter(
             screen,
             f"Coins: {self.player.coins}",
             "medium",
@@ -647,7 +846,7 @@ class GameScene:
         )
         
         # Draw level
-        self.text_renderer.render_text(
+        self.text_renderer.render_counter(
             screen,
             f"Level: {self.player.level}",
             "medium",
@@ -658,7 +857,7 @@ class GameScene:
         )
         
         # Draw experience bar
-        self.text_renderer.render_text(
+        self.text_renderer.render_counter(
             screen,
             f"XP: {self.player.experience}/{self.player.experience_to_next_level}",
             "small",
@@ -5,6 +5,7 @@ import pygame
 import random
 import math
 from ui.buttons import Button
+from ui.input_dispatcher import InputDispatcher
 from ui.text import TextRenderer
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, DARK_RED, GREEN
 
@@ -17,6 +18,7 @@ class GameOver:
         self.restart_button = Button(SCREEN_WIDTH // 2 - 100, 400, 200, 50, "Try Again", GREEN)
         self.menu_button = Button(SCREEN_WIDTH // 2 - 100, 470, 200, 50, "Main Menu")
         self.quit_button = Button(SCREEN_WIDTH // 2 - 100, 540, 200, 50, "Quit Game")
+        self.input = InputDispatcher([self.restart_button, self.menu_button, self.quit_button])
         
         # Screen shake effect
         self.shake_duration = 2.0  # seconds
@@ -39,28 +41,27 @@ class GameOver:
         adjusted_pos = (mouse_pos[0] - self.shake_offset[0], mouse_pos[1] - self.shake_offset[1])
         
         # Update button hover states
-        self.restart_button.is_hovered(adjusted_pos)
-        self.menu_button.is_hovered(adjusted_pos)
-        self.quit_button.is_hovered(adjusted_pos)
+        self.input.update_hover(adjusted_pos)
         
         for event in events:
             # Check restart button
-            if self.restart_button.is_clicked(adjusted_pos, event):
+            clicked = self.input.get_clicked(event, self.shake_offset)
+            if clicked is self.restart_button:
                 # Reset player state for a new game
                 self.player.coins = 100
                 self.player.consecutive_lost_customers = 0
-                self.player.save_player_data()
+                self.player.request_save()
                 return "game"
                 
             # Check menu button
-            if self.menu_button.is_clicked(adjusted_pos, event):
+            if clicked is self.menu_button:
                 return "menu"
                 
             # Check quit button
-            if self.quit_button.is_clicked(adjusted_pos, event):
-                pygame.quit()
-                import sys
-                sys.exit()
+            if clicked is self.quit_button:
+                # Let the main loop shut down so pending saves are written
+                pygame.event.post(pygame.event.Event(pygame.QUIT))
+                return None
                 
         return None
         
@@ -87,6 +88,18 @@ class GameOver:
                 self.shake_offset = (0, 0)
         else:
             self.shake_offset = (0, 0)
+            
+    def is_animating(self):
+        """Check whether the game over scene changes without input
+        
+        Returns:
+            bool: True while the screen is shaking
+        """
+        return self.shake_timer > 0 or self.shake_offset != (0, 0)
+        
+    def on_exit(self):
+        """Free the cached text once the player moves on"""
+        self.text_renderer.clear_cache()
         
     def render(self, screen):
         """Render the game over scene
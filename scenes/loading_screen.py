@@ -0,0 +1,108 @@
+"""
+Loading screen shown while sprites and the saved game load in the background
+"""
+import pygame
+from ui.text import TextRenderer
+from ui.layers import StaticLayers
+from config import SCREEN_WIDTH, BLACK, WHITE, GREEN, PASTEL_COLORS
+
+class LoadingScreen:
+    def __init__(self, loaders):
+        self.loaders = loaders  # AssetLoader and GameLoader, drawn as one bar
+        self.text_renderer = TextRenderer()
+        self.background = StaticLayers(self._render_background)
+        self.bar_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 480, 400, 24)
+        
+    def handle_events(self, events):
+        """Handle events for the loading screen
+        
+        Args:
+            events: List of pygame events
+            
+        Returns:
+            None: Nothing can be clicked until loading is done
+        """
+        return None
+        
+    def update(self, dt):
+        """Update the loading screen
+        
+        Args:
+            dt: Time delta in seconds
+        """
+        pass
+        
+    def is_animating(self):
+        """Check whether the loading screen changes without input
+        
+        Returns:
+            bool: True until everything is loaded, so the progress keeps
+                being drawn
+        """
+        return not all(loader.is_done() for loader in self.loaders)
+        
+    def on_exit(self):
+        """Free the background, the loading screen is only shown once"""
+        self.background.invalidate()
+        self.text_renderer.clear_cache()
+        
+    def render(self, screen):
+        """Render the loading screen
+        
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Same backdrop and title as the main menu, which comes next
+        self.background.draw(screen)
+        
+        # Draw progress bar, each loader taking an equal share of it
+        progress = 0.0
+        for loader in self.loaders:
+            loaded, total = loader.get_progress()
+            progress += loaded / total if total else 1.0
+        fill = self.bar_rect.copy()
+        fill.width = int(self.bar_rect.width * progress / len(self.loaders))
+        pygame.draw.rect(screen, WHITE, self.bar_rect)
+        pygame.draw.rect(screen, GREEN, fill)
+        pygame.draw.rect(screen, BLACK, self.bar_rect, 2)
+        
+        # Describe the first loader still working
+        loading = [loader for loader in self.loaders if not loader.is_done()] or self.loaders[-1:]
+        self.text_renderer.render_counter(
+            screen,
+            loading[0].get_status(),
+            "small",
+            BLACK,
+            SCREEN_WIDTH // 2,
+            self.bar_rect.bottom + 15,
+            "center"
+        )
+        
+    def _render_background(self, screen):
+        """Render the background and title
+        
+        Args:
+            screen: Pygame surface to render on
+        """
+        screen.fill(PASTEL_COLORS[7])  # Pastel Lavender
+        
+        # Draw title
+        self.text_renderer.render_text(
+            screen,
+            "Kusina ni Jai",
+            "title",
+            BLACK,
+            SCREEN_WIDTH // 2,
+            150,
+            "center"
+        )
+        
+        self.text_renderer.render_text(
+            screen,
+            "A Cooking Simulation Game",
+            "medium",
+            BLACK,
+            SCREEN_WIDTH // 2,
+            220,
+            "center"
+        )
@@ -5,15 +5,29 @@ import pygame
 import os
 import json
 from ui.buttons import Button
+from ui.input_dispatcher import InputDispatcher
 from ui.text import TextRenderer
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, GREEN, PASTEL_COLORS
+from ui.layers import StaticLayers
+from ui.modal import ModalBackdrop
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, GREEN, PASTEL_COLORS,
+    SAVE_FILE, PROFILE_FILE, GAME_STATE_FILE
+)
+from storage.save_manager import delete_save_file
 
 class MainMenu:
-    def __init__(self):
+    def __init__(self, save_manager=None):
+        self.save_manager = save_manager
         self.text_renderer = TextRenderer()
+        self.background = StaticLayers(self._render_background)
+        self.backdrop = ModalBackdrop()  # The menu under the confirmation dialog
         
-        # Check if save file exists
-        self.has_save = os.path.exists("data/save.json")
+        # Check if a save exists
+        self.store = save_manager.store if save_manager else None
+        if self.store:
+            self.has_save = self.store.has_section("player")
+        else:
+            self.has_save = os.path.exists(SAVE_FILE)
         
         # Create buttons
         button_width = 200
@@ -104,6 +118,15 @@ class MainMenu:
             PASTEL_COLORS[0]  # Pastel Pink
         )
         
+        # Route the mouse to the menu buttons, or to the dialog's while
+        # it is open
+        if self.has_save:
+            menu_buttons = [self.continue_button, self.new_game_button, self.about_button, self.exit_button]
+        else:
+            menu_buttons = [self.start_button, self.about_button, self.exit_button]
+        self.menu_input = InputDispatcher(menu_buttons)
+        self.confirm_input = InputDispatcher([self.confirm_yes_button, self.confirm_no_button])
+        
     def handle_events(self, events):
         """Handle events for the main menu
         
@@ -116,20 +139,13 @@ class MainMenu:
         """
         mouse_pos = pygame.mouse.get_pos()
         
-        # Update button hover states
-        if self.has_save:
-            self.continue_button.is_hovered(mouse_pos)
-            self.new_game_button.is_hovered(mouse_pos)
+        # Update button hover states. The menu under the confirmation
+        # dialog is drawn frozen, so only the dialog's buttons respond.
+        if self.show_confirmation:
+            self.confirm_input.update_hover(mouse_pos)
         else:
-            self.start_button.is_hovered(mouse_pos)
+            self.menu_input.update_hover(mouse_pos)
             
-        self.about_button.is_hovered(mouse_pos)
-        self.exit_button.is_hovered(mouse_pos)
-        
-        if self.show_confirmation:
-            self.confirm_yes_button.is_hovered(mouse_pos)
-            self.confirm_no_button.is_hovered(mouse_pos)
-        
         for event in events:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                 if self.has_save:
@@ -139,44 +155,53 @@ class MainMenu:
                     
             if self.show_confirmation:
                 # Handle confirmation dialog
-                if self.confirm_yes_button.is_clicked(mouse_pos, event):
+                clicked = self.confirm_input.get_clicked(event)
+                if clicked is self.confirm_yes_button:
                     self._reset_game()
                     return "game", {"new_game": True}
                     
-                if self.confirm_no_button.is_clicked(mouse_pos, event):
+                if clicked is self.confirm_no_button:
                     self.show_confirmation = False
                     
             else:
                 # Handle main menu buttons
+                clicked = self.menu_input.get_clicked(event)
+                if clicked is None:
+                    continue
+                    
                 if self.has_save:
-                    if self.continue_button.is_clicked(mouse_pos, event):
+                    if clicked is self.continue_button:
                         return "game", {}
                         
-                    if self.new_game_button.is_clicked(mouse_pos, event):
+                    if clicked is self.new_game_button:
                         self.show_confirmation = True
                 else:
-                    if self.start_button.is_clicked(mouse_pos, event):
+                    if clicked is self.start_button:
                         return "game", {"new_game": True}
-                    
-                if self.about_button.is_clicked(mouse_pos, event):
+                        
+                if clicked is self.about_button:
                     return "about", {}
                     
-                if self.exit_button.is_clicked(mouse_pos, event):
-                    pygame.quit()
-                    import sys
-                    sys.exit()
+                if clicked is self.exit_button:
+                    # Let the main loop shut down so pending saves are written
+                    pygame.event.post(pygame.event.Event(pygame.QUIT))
+                    return None, {}
                 
         return None, {}
         
     def _reset_game(self):
         """Reset the game by deleting save files"""
-        save_files = ["data/save.json", "data/profile.json", "data/game_state.json"]
+        if self.store:
+            for section in ("player", "profile", "game_state"):
+                self.store.delete_section(section)
+            return
+            
+        save_files = [SAVE_FILE, PROFILE_FILE, GAME_STATE_FILE]
         for file in save_files:
-            if os.path.exists(file):
-                try:
-                    os.remove(file)
-                except Exception as e:
-                    print(f"Error deleting {file}: {e}")
+            try:
+                delete_save_file(file, self.save_manager)
+            except Exception as e:
+                print(f"Error deleting {file}: {e}")
         
     def update(self, dt):
         """Update the main menu
@@ -186,9 +211,57 @@ class MainMenu:
         """
         pass
         
+    def is_animating(self):
+        """Check whether the main menu changes without input
+        
+        Returns:
+            bool: Always False, nothing here moves on its own
+        """
+        return False
+        
+    def on_exit(self):
+        """Free the menu's cached surfaces while the game is elsewhere"""
+        self.background.invalidate()
+        self.backdrop.release()
+        self.text_renderer.clear_cache()
+        
     def render(self, screen):
         """Render the main menu
         
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Draw confirmation dialog if active, over a copy of the menu
+        # taken when it opened
+        if self.show_confirmation:
+            self.backdrop.draw(screen, self._render_menu, 128)
+            self._render_confirmation_dialog(screen)
+        else:
+            self.backdrop.release()
+            self._render_menu(screen)
+            
+    def _render_menu(self, screen):
+        """Render the menu without the confirmation dialog
+        
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Background, title and instructions never change
+        self.background.draw(screen)
+        
+        # Draw buttons
+        if self.has_save:
+            self.continue_button.draw(screen)
+            self.new_game_button.draw(screen)
+        else:
+            self.start_button.draw(screen)
+            
+        self.about_button.draw(screen)
+        self.exit_button.draw(screen)
+        
+    def _render_background(self, screen):
+        """Render the background, title and instructions
+        
         Args:
             screen: Pygame surface to render on
         """
@@ -216,16 +289,6 @@ class MainMenu:
             "center"
         )
         
-        # Draw buttons
-        if self.has_save:
-            self.continue_button.draw(screen)
-            self.new_game_button.draw(screen)
-        else:
-            self.start_button.draw(screen)
-            
-        self.about_button.draw(screen)
-        self.exit_button.draw(screen)
-        
         # Draw instructions
         self.text_renderer.render_text(
             screen, 
@@ -237,22 +300,13 @@ class MainMenu:
             "center"
         )
         
-        # Draw confirmation dialog if active
-        if self.show_confirmation:
-            self._render_confirmation_dialog(screen)
-            
     def _render_confirmation_dialog(self, screen):
         """Render the confirmation dialog
         
         Args:
             screen: Pygame surface to render on
         """
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Black with alpha
-        screen.blit(overlay, (0, 0))
-        
-        # Draw dialog box
+        # Draw dialog box (the dimmed menu under it is drawn by render())
         dialog_width = 400
         dialog_height = 200
         dialog_x = SCREEN_WIDTH // 2 - dialog_width // 2
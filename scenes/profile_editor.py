@@ -3,6 +3,7 @@ Profile editor scene for customizing player profile
 """
 import pygame
 from ui.buttons import Button, ColorButton
+from ui.input_dispatcher import InputDispatcher
 from ui.text import TextRenderer
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, LIGHT_GRAY, BEIGE, GREEN, PASTEL_COLORS
 
@@ -57,6 +58,8 @@ class ProfileEditor:
                 ColorButton(x, color_y, color_size, color_size, "", color)
             )
             
+        self.input = InputDispatcher([self.back_button, self.save_button] + self.color_buttons)
+        
     def handle_events(self, events):
         """Handle events for the profile editor
         
@@ -69,26 +72,22 @@ class ProfileEditor:
         mouse_pos = pygame.mouse.get_pos()
         
         # Update button hover states
-        self.back_button.is_hovered(mouse_pos)
-        self.save_button.is_hovered(mouse_pos)
-        
-        for button in self.color_buttons:
-            button.is_hovered(mouse_pos)
+        self.input.update_hover(mouse_pos)
         
         for event in events:
             # Check back button
-            if self.back_button.is_clicked(mouse_pos, event):
+            clicked = self.input.get_clicked(event)
+            if clicked is self.back_button:
                 return "game"
                 
             # Check save button
-            if self.save_button.is_clicked(mouse_pos, event):
+            if clicked is self.save_button:
                 self._save_profile()
                 return "game"
                 
             # Check color buttons
-            for i, button in enumerate(self.color_buttons):
-                if button.is_clicked(mouse_pos, event):
-                    self.selected_color = self.colors[i]
+            if clicked in self.color_buttons:
+                self.selected_color = clicked.color
                 
             # Check username input
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -130,6 +129,18 @@ class ProfileEditor:
         """
         pass
         
+    def is_animating(self):
+        """Check whether the profile editor changes without input
+        
+        Returns:
+            bool: Always False, nothing here moves on its own
+        """
+        return False
+        
+    def on_exit(self):
+        """Free the cached text while the profile editor is closed"""
+        self.text_renderer.clear_cache()
+        
     def render(self, screen):
         """Render the profile editor
         
@@ -206,9 +217,8 @@ class ProfileEditor:
             
             # Draw profile picture
             if self.sprite_manager:
-                sprite = self.sprite_manager.get_sprite(pic_button["pic"])
-                # Scale sprite to fit the button
-                sprite = pygame.transform.scale(sprite, (130, 130))
+                # Sprite scaled to fit the button
+                sprite = self.sprite_manager.get_scaled_sprite(pic_button["pic"], 130, 130)
                 sprite_rect = sprite.get_rect(center=pic_button["rect"].center)
                 screen.blit(sprite, sprite_rect)
             else:
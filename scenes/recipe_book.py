@@ -3,13 +3,17 @@ Recipe book scene for viewing discovered recipes
 """
 import pygame
 from ui.buttons import Button
+from ui.input_dispatcher import InputDispatcher
 from ui.text import TextRenderer
+from ui.layers import StaticLayers
+from ui.scroll_view import ScrollView, ItemGrid
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, LIGHT_GRAY, BEIGE, PASTEL_COLORS
 
 class RecipeBook:
     def __init__(self, recipe_system):
         self.recipe_system = recipe_system
         self.text_renderer = TextRenderer()
+        self.background = StaticLayers(self._render_background, self._render_page_background)
         
         # UI elements
         self.back_button = Button(50, SCREEN_HEIGHT - 70, 100, 40, "Back")
@@ -20,46 +24,27 @@ class RecipeBook:
         self.next_button = Button(SCREEN_WIDTH - 150, SCREEN_HEIGHT // 2, 100, 40, "Next")
         self.prev_button = Button(50, SCREEN_HEIGHT // 2, 100, 40, "Previous")
         
+        # Route the mouse to the buttons of the table of contents, or of a
+        # recipe page
+        self.toc_input = InputDispatcher([self.back_button])
+        self.page_input = InputDispatcher([self.back_button, self.next_button, self.prev_button])
+        
         # Selected recipe details
         self.selected_recipe = None
         
         # Table of contents mode
         self.show_table_of_contents = True
-        self.toc_buttons = []
         
-        # Scrolling for table of contents
-        self.scroll_offset = 0
-        self.max_scroll = 0
-        self.scroll_speed = 20
-        self.scroll_area_height = SCREEN_HEIGHT - 250  # Area available for scrolling
+        # Scrolling table of contents, one 400x50 button per recipe with 15
+        # pixels between them
+        self.scroll_view = ScrollView(0, 150, SCREEN_WIDTH, SCREEN_HEIGHT - 250)
+        self.toc_grid = self.scroll_view.add_grid(ItemGrid(SCREEN_WIDTH // 2 - 200, 400, 50, margin=15))
         
         self.update_toc_buttons()
         
     def update_toc_buttons(self):
         """Update table of contents buttons"""
-        self.toc_buttons = []
-        discovered_recipes = self.recipe_system.get_discovered_recipes()
-        
-        button_height = 50  # Increased height for better spacing
-        button_width = 400  # Wider buttons for longer recipe names
-        button_margin = 15  # More margin between buttons
-        start_y = 150
-        
-        for i, recipe in enumerate(discovered_recipes):
-            y = start_y + i * (button_height + button_margin)
-            self.toc_buttons.append({
-                "rect": pygame.Rect(SCREEN_WIDTH // 2 - button_width // 2, y, button_width, button_height),
-                "recipe": recipe,
-                "index": i
-            })
-            
-        # Calculate max scroll based on content height
-        if self.toc_buttons:
-            last_button = self.toc_buttons[-1]
-            content_height = last_button["rect"].bottom - 150
-            self.max_scroll = max(0, content_height - self.scroll_area_height)
-        else:
-            self.max_scroll = 0
+        self.toc_grid.set_items(self.recipe_system.get_discovered_recipes())
         
     def handle_events(self, events):
         """Handle events for the recipe book
@@ -73,45 +58,34 @@ class RecipeBook:
         mouse_pos = pygame.mouse.get_pos()
         
         # Update button hover states
-        self.back_button.is_hovered(mouse_pos)
-        
-        if not self.show_table_of_contents:
-            self.next_button.is_hovered(mouse_pos)
-            self.prev_button.is_hovered(mouse_pos)
+        button_input = self.toc_input if self.show_table_of_contents else self.page_input
+        button_input.update_hover(mouse_pos)
         
         for event in events:
             # Check back button
-            if self.back_button.is_clicked(mouse_pos, event):
+            clicked = button_input.get_clicked(event)
+            if clicked is self.back_button:
                 return "game"
                 
             # Handle scrolling in table of contents
-            if self.show_table_of_contents and event.type == pygame.MOUSEWHEEL:
-                self.scroll_offset -= event.y * self.scroll_speed
-                self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
+            if self.show_table_of_contents and self.scroll_view.handle_event(event):
                 continue  # Skip further processing for mousewheel events
                 
             if self.show_table_of_contents:
-                # Check table of contents buttons
+                # Check the table of contents button under the mouse
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click only
-                    # Adjust mouse position for scrolling
-                    scroll_adjusted_pos = (mouse_pos[0], mouse_pos[1] + self.scroll_offset)
-                    
-                    for button in self.toc_buttons:
-                        # Only check buttons that are in the visible area
-                        button_rect = button["rect"].copy()
-                        button_rect.y -= self.scroll_offset
-                        
-                        if 150 <= button_rect.y <= SCREEN_HEIGHT - 100 and button_rect.collidepoint(mouse_pos):
-                            self.current_page = button["index"]
-                            self.selected_recipe = button["recipe"]
-                            self.show_table_of_contents = False
-                            return None
+                    grid, index = self.scroll_view.get_item_at(event.pos)
+                    if grid is not None:
+                        self.current_page = index
+                        self.selected_recipe = grid.items[index]
+                        self.show_table_of_contents = False
+                        return None
             else:
                 # Check navigation buttons
-                if self.next_button.is_clicked(mouse_pos, event):
+                if clicked is self.next_button:
                     self._next_page()
                     
-                if self.prev_button.is_clicked(mouse_pos, event):
+                if clicked is self.prev_button:
                     self._prev_page()
                     
                 # Check for table of contents button
@@ -148,9 +122,62 @@ class RecipeBook:
         """
         pass
         
+    def is_animating(self):
+        """Check whether the recipe book changes without input
+        
+        Returns:
+            bool: Always False, nothing here moves on its own
+        """
+        return False
+        
+    def on_exit(self):
+        """Free the cached page background and text while the book is closed"""
+        self.background.invalidate()
+        self.text_renderer.clear_cache()
+        
     def render(self, screen):
         """Render the recipe book
         
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Draw recipe book
+        discovered_recipes = self.recipe_system.get_discovered_recipes()
+        
+        # Everything on the current page that isn't a button or the
+        # scrolling table of contents is cached until the page changes
+        self.background.draw(screen, self._get_background_key(discovered_recipes))
+        
+        if discovered_recipes:
+            if self.show_table_of_contents:
+                self._render_table_of_contents(screen, discovered_recipes)
+            else:
+                self._render_recipe_page(screen, discovered_recipes)
+                
+        # Draw back button
+        self.back_button.draw(screen)
+        
+    def _get_background_key(self, recipes):
+        """Describe the static content of the current page
+        
+        Args:
+            recipes: List of discovered recipes
+            
+        Returns:
+            Hashable key that changes when the page does
+        """
+        if not recipes:
+            return None
+        if self.show_table_of_contents:
+            return "table_of_contents"
+            
+        if self.current_page >= len(recipes):
+            self.current_page = 0
+        return ("page", self.current_page, len(recipes), recipes[self.current_page].name)
+        
+    def _render_background(self, screen):
+        """Render the background and title
+        
         Args:
             screen: Pygame surface to render on
         """
@@ -168,7 +195,12 @@ class RecipeBook:
             "center"
         )
         
-        # Draw recipe book
+    def _render_page_background(self, screen):
+        """Render the static content of the current page
+        
+        Args:
+            screen: Pygame surface to render on
+        """
         discovered_recipes = self.recipe_system.get_discovered_recipes()
         
         if not discovered_recipes:
@@ -181,14 +213,21 @@ class RecipeBook:
                 250,
                 "center"
             )
+        elif self.show_table_of_contents:
+            # Draw table of contents title
+            self.text_renderer.render_text(
+                screen,
+                "Table of Contents",
+                "large",
+                BLACK,
+                SCREEN_WIDTH // 2,
+                100,
+                "center"
+            )
         else:
-            if self.show_table_of_contents:
-                self._render_table_of_contents(screen, discovered_recipes)
-            else:
-                self._render_recipe_page(screen, discovered_recipes)
-        
-        # Draw back button
-        self.back_button.draw(screen)
+            self._render_recipe_details(
+                screen, discovered_recipes[self.current_page], len(discovered_recipes)
+            )
                 
     def _render_table_of_contents(self, screen, recipes):
         """Render the table of contents
@@ -197,66 +236,44 @@ class RecipeBook:
             screen: Pygame surface to render on
             recipes: List of recipes to display
         """
-        # Draw table of contents title
-        self.text_renderer.render_text(
-            screen,
-            "Table of Contents",
-            "large",
-            BLACK,
-            SCREEN_WIDTH // 2,
-            100,
-            "center"
-        )
-        
-        # Create a clipping rect for the scrollable area
-        scroll_area = pygame.Rect(0, 150, SCREEN_WIDTH, self.scroll_area_height)
-        
         # Draw scrollbar if needed
-        if self.max_scroll > 0:
-            scrollbar_height = self.scroll_area_height * (self.scroll_area_height / (self.scroll_area_height + self.max_scroll))
-            scrollbar_pos = 150 + (self.scroll_offset / self.max_scroll) * (self.scroll_area_height - scrollbar_height)
-            pygame.draw.rect(screen, (150, 150, 150), (SCREEN_WIDTH - 20, scrollbar_pos, 10, scrollbar_height))
-            pygame.draw.rect(screen, BLACK, (SCREEN_WIDTH - 20, scrollbar_pos, 10, scrollbar_height), 1)
-        
-        # Draw recipe buttons (with scrolling)
-        for button in self.toc_buttons:
-            # Adjust button position for scrolling
-            button_rect = button["rect"].copy()
-            button_rect.y -= self.scroll_offset
+        self.scroll_view.draw_scrollbar(screen)
+        
+        # Draw the recipe buttons in view
+        for index, button_rect in self.scroll_view.get_visible(self.toc_grid):
+            recipe = self.toc_grid.items[index]
             
-            # Only draw buttons that are in the visible area
-            if scroll_area.colliderect(button_rect):
-                # Draw button background
-                pygame.draw.rect(screen, PASTEL_COLORS[1], button_rect)
-                pygame.draw.rect(screen, BLACK, button_rect, 2)
-                
-                # Draw recipe name (truncate if too long)
-                recipe_name = button["recipe"].name
-                max_name_length = 30  # Increased from 20
-                if len(recipe_name) > max_name_length:
-                    recipe_name = recipe_name[:max_name_length-3] + "..."
-                    
-                self.text_renderer.render_text(
-                    screen,
-                    recipe_name,
-                    "medium",
-                    BLACK,
-                    button_rect.centerx,
-                    button_rect.centery - 10,  # Move up to make room for difficulty
-                    "center"
-                )
+            # Draw button background
+            pygame.draw.rect(screen, PASTEL_COLORS[1], button_rect)
+            pygame.draw.rect(screen, BLACK, button_rect, 2)
+            
+            # Draw recipe name (truncate if too long)
+            recipe_name = recipe.name
+            max_name_length = 30  # Increased from 20
+            if len(recipe_name) > max_name_length:
+                recipe_name = recipe_name[:max_name_length-3] + "..."
                 
-                # Draw difficulty stars
-                difficulty_stars = "★" * button["recipe"].difficulty
-                self.text_renderer.render_text(
-                    screen,
-                    f"Difficulty: {difficulty_stars}",
-                    "small",
-                    BLACK,
-                    button_rect.centerx,
-                    button_rect.centery + 15,  # Position below recipe name
-                    "center"
-                )
+            self.text_renderer.render_text(
+                screen,
+                recipe_name,
+                "medium",
+                BLACK,
+                button_rect.centerx,
+                button_rect.centery - 10,  # Move up to make room for difficulty
+                "center"
+            )
+            
+            # Draw difficulty stars
+            difficulty_stars = "★" * recipe.difficulty
+            self.text_renderer.render_text(
+                screen,
+                f"Difficulty: {difficulty_stars}",
+                "small",
+                BLACK,
+                button_rect.centerx,
+                button_rect.centery + 15,  # Position below recipe name
+                "center"
+            )
             
     def _render_recipe_page(self, screen, recipes):
         """Render a recipe page
@@ -267,13 +284,23 @@ class RecipeBook:
         """
         # Calculate page info
         max_pages = len(recipes)
+        self.selected_recipe = recipes[self.current_page]
         
-        if self.current_page >= len(recipes):
-            self.current_page = 0
+        # Draw navigation buttons
+        if self.current_page < max_pages - 1:
+            self.next_button.draw(screen)
+            
+        if self.current_page > 0:
+            self.prev_button.draw(screen)
             
-        recipe = recipes[self.current_page]
-        self.selected_recipe = recipe
+    def _render_recipe_details(self, screen, recipe, max_pages):
+        """Render the text, border and table of contents button of a recipe page
         
+        Args:
+            screen: Pygame surface to render on
+            recipe: Recipe on the page
+            max_pages: Number of pages
+        """
         # Draw page info
         self.text_renderer.render_text(
             screen,
@@ -295,24 +322,9 @@ class RecipeBook:
         pygame.draw.rect(screen, PASTEL_COLORS[6], (book_x, book_y, book_width, book_height))
         pygame.draw.rect(screen, BLACK, (book_x, book_y, book_width, book_height), 2)
         
-        # Draw recipe name (wrap if too long)
-        recipe_name = recipe.name
-        if len(recipe_name) > 25:
-            # Split into multiple lines
-            words = recipe_name.split()
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                if len(current_line + " " + word) <= 25:
-                    current_line += " " + word if current_line else word
-                else:
-                    lines.append(current_line)
-                    current_line = word
-                    
-            if current_line:
-                lines.append(current_line)
-                
+        # Draw recipe name (wrap if too long for the page)
+        lines = self.text_renderer.wrap_text(recipe.name, "large", book_width - 100)
+        if len(lines) > 1:
             # Draw each line
             for i, line in enumerate(lines):
                 self.text_renderer.render_text(
@@ -328,7 +340,7 @@ class RecipeBook:
             # Draw as a single line
             self.text_renderer.render_text(
                 screen,
-                recipe_name,
+                recipe.name,
                 "large",
                 BLACK,
                 SCREEN_WIDTH // 2,
@@ -408,13 +420,6 @@ class RecipeBook:
                 "left"
             )
             
-        # Draw navigation buttons
-        if self.current_page < max_pages - 1:
-            self.next_button.draw(screen)
-            
-        if self.current_page > 0:
-            self.prev_button.draw(screen)
-            
         # Draw table of contents button
         toc_button_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 70, 200, 40)
         pygame.draw.rect(screen, PASTEL_COLORS[1], toc_button_rect)
@@ -3,7 +3,10 @@ Recipe creator scene for cooking dishes
 """
 import pygame
 from ui.buttons import Button, IngredientButton, ToolButton, CookButton
+from ui.input_dispatcher import InputDispatcher
 from ui.text import TextRenderer
+from ui.layers import StaticLayers
+from ui.scroll_view import ScrollView, ItemGrid
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, BEIGE
 
 class RecipeCreator:
@@ -11,21 +14,25 @@ class RecipeCreator:
         self.recipe_system = recipe_system
         self.kitchen = kitchen
         self.text_renderer = TextRenderer()
+        self.background = StaticLayers(self._render_background)
         
         self.selected_ingredients = []
         self.selected_tools = []
         
         # UI elements
-        self.ingredient_buttons = []
-        self.tool_buttons = []
         self.cook_button = CookButton(SCREEN_WIDTH // 2 - 75, SCREEN_HEIGHT - 150, 150, 50)
         self.back_button = Button(50, SCREEN_HEIGHT - 70, 100, 40, "Back")
+        self.input = InputDispatcher([self.cook_button, self.back_button])
         
-        # Scrolling
-        self.scroll_offset = 0
-        self.max_scroll = 0
-        self.scroll_speed = 20
-        self.scroll_area_height = SCREEN_HEIGHT - 300  # Area available for scrolling
+        # Scrolling ingredients (left side) and tools (right side). Their
+        # buttons are only made while they're in view
+        self.scroll_view = ScrollView(0, 150, SCREEN_WIDTH, SCREEN_HEIGHT - 300)
+        self.ingredient_grid = self.scroll_view.add_grid(
+            ItemGrid(50, 100, 40, columns=3, margin=10, make_widget=self._make_ingredient_button)
+        )
+        self.tool_grid = self.scroll_view.add_grid(
+            ItemGrid(450, 100, 40, columns=2, margin=10, make_widget=self._make_tool_button)
+        )
         
         # Result message
         self.result_message = ""
@@ -36,60 +43,21 @@ class RecipeCreator:
         
     def _setup_ui(self):
         """Set up UI elements"""
-        # Clear existing buttons
-        self.ingredient_buttons = []
-        self.tool_buttons = []
-        self.scroll_offset = 0
-        
-        # Get unlocked ingredients and tools
-        unlocked_ingredients = self.kitchen.get_unlocked_ingredients()
-        unlocked_tools = self.kitchen.get_unlocked_tools()
-        
-        # Create ingredient buttons
-        button_width = 100
-        button_height = 40
-        margin = 10
-        
-        # Ingredients area (left side)
-        x_start = 50
-        y_start = 150
-        
-        for i, ingredient in enumerate(unlocked_ingredients):
-            row = i // 3
-            col = i % 3
-            x = x_start + col * (button_width + margin)
-            y = y_start + row * (button_height + margin)
-            
-            self.ingredient_buttons.append(
-                IngredientButton(x, y, button_width, button_height, ingredient)
-            )
-            
-        # Tools area (right side)
-        x_start = 450
-        y_start = 150
-        
-        for i, tool in enumerate(unlocked_tools):
-            row = i // 2
-            col = i % 2
-            x = x_start + col * (button_width + margin)
-            y = y_start + row * (button_height + margin)
-            
-            self.tool_buttons.append(
-                ToolButton(x, y, button_width, button_height, tool)
-            )
-            
-        # Calculate max scroll based on content height
-        if self.ingredient_buttons or self.tool_buttons:
-            # Find the button with the lowest position
-            all_buttons = self.ingredient_buttons + self.tool_buttons
-            if all_buttons:
-                last_button = max(all_buttons, key=lambda b: b.rect.bottom)
-                content_height = last_button.rect.bottom - 150
-                self.max_scroll = max(0, content_height - self.scroll_area_height)
-            else:
-                self.max_scroll = 0
-        else:
-            self.max_scroll = 0
+        self.ingredient_grid.set_items(self.kitchen.get_unlocked_ingredients())
+        self.tool_grid.set_items(self.kitchen.get_unlocked_tools())
+        self.scroll_view.reset()
+        
+    def _make_ingredient_button(self, ingredient, rect):
+        """Make the button of an ingredient scrolling into view"""
+        button = IngredientButton(rect.x, rect.y, rect.width, rect.height, ingredient)
+        button.selected = ingredient in self.selected_ingredients
+        return button
+        
+    def _make_tool_button(self, tool, rect):
+        """Make the button of a tool scrolling into view"""
+        button = ToolButton(rect.x, rect.y, rect.width, rect.height, tool)
+        button.selected = tool in self.selected_tools
+        return button
         
     def handle_events(self, events):
         """Handle events for the recipe creator
@@ -104,71 +72,54 @@ class RecipeCreator:
         mouse_pos = pygame.mouse.get_pos()
         
         # Update button hover states for fixed buttons
-        self.cook_button.is_hovered(mouse_pos)
-        self.back_button.is_hovered(mouse_pos)
-        
-        # Adjust mouse position for scrolling when checking ingredient/tool buttons
-        scroll_adjusted_pos = (mouse_pos[0], mouse_pos[1] + self.scroll_offset)
-        
-        # Update hover states for scrollable buttons
-        for button in self.ingredient_buttons:
-            # Only check buttons that are in the visible area
-            button_rect = button.rect
-            if 150 <= button_rect.y - self.scroll_offset <= SCREEN_HEIGHT - 200:
-                button.is_hovered(scroll_adjusted_pos)
-            
-        for button in self.tool_buttons:
-            # Only check buttons that are in the visible area
-            button_rect = button.rect
-            if 150 <= button_rect.y - self.scroll_offset <= SCREEN_HEIGHT - 200:
-                button.is_hovered(scroll_adjusted_pos)
+        self.input.update_hover(mouse_pos)
+        
+        # Update hover states of the ingredient and tool buttons in view
+        self.scroll_view.update_hover(mouse_pos)
         
         for event in events:
             # Handle scrolling
-            if event.type == pygame.MOUSEWHEEL:
-                self.scroll_offset -= event.y * self.scroll_speed
-                self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
-                
+            self.scroll_view.handle_event(event)
+            
             if event.type == pygame.MOUSEBUTTONDOWN:
-                # Check ingredient buttons
-                for button in self.ingredient_buttons:
-                    # Only check buttons that are in the visible area
-                    button_rect = button.rect
-                    if 150 <= button_rect.y - self.scroll_offset <= SCREEN_HEIGHT - 200:
-                        if button_rect.collidepoint(scroll_adjusted_pos):
-                            if button.toggle():
-                                if button.ingredient_name not in self.selected_ingredients:
-                                    self.selected_ingredients.append(button.ingredient_name)
-                            else:
-                                if button.ingredient_name in self.selected_ingredients:
-                                    self.selected_ingredients.remove(button.ingredient_name)
-                
-                # Check tool buttons
-                for button in self.tool_buttons:
-                    # Only check buttons that are in the visible area
-                    button_rect = button.rect
-                    if 150 <= button_rect.y - self.scroll_offset <= SCREEN_HEIGHT - 200:
-                        if button_rect.collidepoint(scroll_adjusted_pos):
-                            if button.toggle():
-                                if button.tool_name not in self.selected_tools:
-                                    self.selected_tools.append(button.tool_name)
-                            else:
-                                if button.tool_name in self.selected_tools:
-                                    self.selected_tools.remove(button.tool_name)
-                
+                # Check the ingredient or tool under the mouse
+                grid, index = self.scroll_view.get_item_at(event.pos)
+                if grid is self.ingredient_grid:
+                    self._toggle(grid, index, self.selected_ingredients)
+                elif grid is self.tool_grid:
+                    self._toggle(grid, index, self.selected_tools)
+                    
                 # Check cook button
-                if self.cook_button.is_clicked(mouse_pos, event):
+                clicked = self.input.get_clicked(event)
+                if clicked is self.cook_button:
                     result = self.cook()
                     if result[0]:  # If cooking was successful
                         return "game", {"cooked_dish": result[1]}
                     
                 # Check back button
-                if self.back_button.is_clicked(mouse_pos, event):
+                if clicked is self.back_button:
                     self.reset()
                     return "game", {}
                     
         return None, {}
         
+    def _toggle(self, grid, index, selected):
+        """Select or deselect an ingredient or tool
+        
+        Args:
+            grid: ItemGrid the item is in
+            index: Index of the item
+            selected: List of the selected names of its kind
+        """
+        name = grid.items[index]
+        button = self.scroll_view.get_widgets(grid)[index]
+        if button.toggle():
+            if name not in selected:
+                selected.append(name)
+        else:
+            if name in selected:
+                selected.remove(name)
+                
     def update(self, dt):
         """Update the recipe creator
         
@@ -180,6 +131,28 @@ class RecipeCreator:
             self.result_timer -= dt
             if self.result_timer <= 0:
                 self.result_message = ""
+                
+    def is_animating(self):
+        """Check whether the recipe creator changes without input
+        
+        Returns:
+            bool: True while a result message is counting down
+        """
+        return self.result_timer > 0
+        
+    def on_enter(self):
+        """Start cooking afresh with the ingredients and tools unlocked now"""
+        self.selected_ingredients = []
+        self.selected_tools = []
+        self.result_message = ""
+        self.result_timer = 0
+        self._setup_ui()
+        self.input.update_hover(pygame.mouse.get_pos())
+        
+    def on_exit(self):
+        """Free the cached background and text until the next dish"""
+        self.background.invalidate()
+        self.text_renderer.clear_cache()
         
     def cook(self):
         """Attempt to cook with the selected ingredients and tools
@@ -209,11 +182,9 @@ class RecipeCreator:
         self.selected_ingredients = []
         self.selected_tools = []
         
-        for button in self.ingredient_buttons:
-            button.selected = False
-            
-        for button in self.tool_buttons:
-            button.selected = False
+        for grid in (self.ingredient_grid, self.tool_grid):
+            for button in grid.widgets.values():
+                button.selected = False
             
     def show_result(self, message, duration=2.0):
         """Show a result message
@@ -228,6 +199,52 @@ class RecipeCreator:
     def render(self, screen):
         """Render the recipe creator
         
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Background, title and section headers never change
+        self.background.draw(screen)
+        
+        # Draw scrollbar if needed
+        self.scroll_view.draw_scrollbar(screen)
+        
+        # Draw the ingredient and tool buttons in view
+        self.scroll_view.draw(screen, self.ingredient_grid)
+        self.scroll_view.draw(screen, self.tool_grid)
+        
+        # Draw cook button (fixed position)
+        self.cook_button.draw(screen)
+        
+        # Draw back button (fixed position)
+        self.back_button.draw(screen)
+        
+        # Draw selected ingredients and tools
+        selected_text = f"Selected: {', '.join(self.selected_ingredients)} | Tools: {', '.join(self.selected_tools)}"
+        self.text_renderer.render_text(
+            screen,
+            selected_text,
+            "small",
+            BLACK,
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT - 200,
+            "center"
+        )
+        
+        # Draw result message if active
+        if self.result_message:
+            self.text_renderer.render_text(
+                screen,
+                self.result_message,
+                "medium",
+                BLACK,
+                SCREEN_WIDTH // 2,
+                SCREEN_HEIGHT - 100,
+                "center"
+            )
+        
+    def _render_background(self, screen):
+        """Render the background, title and section headers
+        
         Args:
             screen: Pygame surface to render on
         """
@@ -265,79 +282,3 @@ class RecipeCreator:
             120,
             "left"
         )
-        
-        # Create a clipping rect for the scrollable area
-        scroll_area = pygame.Rect(0, 150, SCREEN_WIDTH, self.scroll_area_height)
-        
-        # Draw scrollbar if needed
-        if self.max_scroll > 0:
-            scrollbar_height = self.scroll_area_height * (self.scroll_area_height / (self.scroll_area_height + self.max_scroll))
-            scrollbar_pos = 150 + (self.scroll_offset / self.max_scroll) * (self.scroll_area_height - scrollbar_height)
-            pygame.draw.rect(screen, (150, 150, 150), (SCREEN_WIDTH - 20, scrollbar_pos, 10, scrollbar_height))
-            pygame.draw.rect(screen, BLACK, (SCREEN_WIDTH - 20, scrollbar_pos, 10, scrollbar_height), 1)
-        
-        # Draw ingredient buttons (with scrolling)
-        for button in self.ingredient_buttons:
-            # Adjust button position for scrolling
-            button_rect = button.rect.copy()
-            button_rect.y -= self.scroll_offset
-            
-            # Only draw buttons that are in the visible area
-            if scroll_area.colliderect(button_rect):
-                # Store original rect
-                original_rect = button.rect
-                
-                # Temporarily set the rect to the scrolled position
-                button.rect = button_rect
-                button.draw(screen)
-                
-                # Restore original rect
-                button.rect = original_rect
-        
-        # Draw tool buttons (with scrolling)
-        for button in self.tool_buttons:
-            # Adjust button position for scrolling
-            button_rect = button.rect.copy()
-            button_rect.y -= self.scroll_offset
-            
-            # Only draw buttons that are in the visible area
-            if scroll_area.colliderect(button_rect):
-                # Store original rect
-                original_rect = button.rect
-                
-                # Temporarily set the rect to the scrolled position
-                button.rect = button_rect
-                button.draw(screen)
-                
-                # Restore original rect
-                button.rect = original_rect
-        
-        # Draw cook button (fixed position)
-        self.cook_button.draw(screen)
-        
-        # Draw back button (fixed position)
-        self.back_button.draw(screen)
-        
-        # Draw selected ingredients and tools
-        selected_text = f"Selected: {', '.join(self.selected_ingredients)} | Tools: {', '.join(self.selected_tools)}"
-        self.text_renderer.render_text(
-            screen,
-            selected_text,
-            "small",
-            BLACK,
-            SCREEN_WIDTH // 2,
-            SCREEN_HEIGHT - 200,
-            "center"
-        )
-        
-        # Draw result message if active
-        if self.result_message:
-            self.text_renderer.render_text(
-                screen,
-                self.result_message,
-                "medium",
-                BLACK,
-                SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT - 100,
-                "center"
-            )
@@ -0,0 +1,167 @@
+"""
+Scene registry that builds each scene the first time it is shown
+"""
+import time
+from collections import deque
+import pygame
+
+# Packages of the game's own classes, whose attributes get_surface_bytes follows
+_OWN_PACKAGES = ("ui", "scenes")
+
+def get_surface_bytes(obj, shared=()):
+    """Estimate the memory held in the surfaces an object keeps
+    
+    Follows the object's attributes, and the lists, tuples, sets and
+    dictionaries in them, into other objects of the game's ui and scenes
+    classes. Players, systems and the objects in shared are not followed,
+    since several scenes hold them. A subsurface counts as the part of its
+    parent it shows.
+    
+    Args:
+        obj: Object to measure, such as a scene
+        shared: Objects to leave out
+        
+    Returns:
+        int: Bytes of pixels
+    """
+    seen = {id(item) for item in shared}
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, pygame.Surface):
+            total += item.get_width() * item.get_height() * item.get_bytesize()
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+        elif type(item).__module__.split(".")[0] in _OWN_PACKAGES and hasattr(item, "__dict__"):
+            stack.extend(vars(item).values())
+    return total
+
+
+class SceneRegistry:
+    """Scenes by name, each built the first time it is asked for
+    
+    Scenes are registered with a function that builds them, so starting the
+    game (or a new game) only builds the scenes that get shown. enter()
+    switches the current scene, calling on_exit() on the scene being left
+    and on_enter() on the scene being shown, for scenes that have them.
+    Scenes free their cached surfaces in on_exit() and refresh what may
+    have changed while they were away in on_enter().
+    
+    Reads like the dictionary of scenes it replaces: registry[name] builds
+    the scene if needed, and items() lists the scenes built so far.
+    """
+    
+    def __init__(self, shared=()):
+        self.factories = {}  # Name -> function building the scene
+        self.scenes = {}  # Name -> scene, for the scenes built
+        self.build_times = {}  # Name -> seconds the last build took
+        self.builds = {}  # Name -> times built
+        self.current = None  # Name of the scene shown
+        self.shared = shared  # Objects scenes share, left out of their memory
+        
+    def register(self, name, factory):
+        """Register how to build a scene, dropping the scene of that name if built
+        
+        Args:
+            name: Name of the scene
+            factory: Function taking no arguments and returning the scene
+        """
+        self.unload(name)
+        self.factories[name] = factory
+        
+    def unload(self, name):
+        """Drop a built scene, it is built again the next time it is asked for
+        
+        Args:
+            name: Name of the scene
+        """
+        scene = self.scenes.pop(name, None)
+        if scene is not None and name == self.current:
+            if hasattr(scene, "on_exit"):
+                scene.on_exit()
+            self.current = None
+            
+    def get(self, name):
+        """Get a scene, building it if it isn't built yet
+        
+        Args:
+            name: Name of the scene
+            
+        Returns:
+            The scene
+        """
+        scene = self.scenes.get(name)
+        if scene is None:
+            start = time.perf_counter()
+            scene = self.scenes[name] = self.factories[name]()
+            self.build_times[name] = time.perf_counter() - start
+            self.builds[name] = self.builds.get(name, 0) + 1
+        return scene
+        
+    __getitem__ = get
+    
+    def __setitem__(self, name, scene):
+        """Replace a scene with one already built"""
+        self.register(name, lambda: scene)
+        self.scenes[name] = scene
+        
+    def __contains__(self, name):
+        return name in self.factories
+        
+    def items(self):
+        """Get the scenes built so far
+        
+        Returns:
+            list: (name, scene) of each built scene
+        """
+        return list(self.scenes.items())
+        
+    def is_built(self, name):
+        """Check whether a scene has been built
+        
+        Returns:
+            bool: True if the scene is built
+        """
+        return name in self.scenes
+        
+    def enter(self, name):
+        """Show a scene, leaving the current one
+        
+        Args:
+            name: Name of the scene to show
+            
+        Returns:
+            The scene
+        """
+        previous = self.scenes.get(self.current)
+        if previous is not None and hasattr(previous, "on_exit"):
+            previous.on_exit()
+            
+        scene = self.get(name)
+        self.current = name
+        if hasattr(scene, "on_enter"):
+            scene.on_enter()
+        return scene
+        
+    def get_stats(self):
+        """Get how long each scene took to build and the memory it holds
+        
+        Returns:
+            dict: Scene name -> built, times built, seconds the last build
+                took (None if never built) and bytes of surfaces it holds
+        """
+        return {
+            name: {
+                "built": name in self.scenes,
+                "builds": self.builds.get(name, 0),
+                "build_time": self.build_times.get(name),
+                "surface_bytes": get_surface_bytes(self.scenes[name], self.shared) if name in self.scenes else 0
+            }
+            for name in self.factories
+        }
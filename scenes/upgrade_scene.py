@@ -3,7 +3,10 @@ Upgrade shop scene
 """
 import pygame
 from ui.buttons import Button
+from ui.input_dispatcher import InputDispatcher
 from ui.text import TextRenderer
+from ui.layers import StaticLayers
+from ui.scroll_view import ScrollView, ItemGrid
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, LIGHT_GRAY
 
 class UpgradeScene:
@@ -11,16 +14,21 @@ class UpgradeScene:
         self.player = player
         self.kitchen = kitchen
         self.text_renderer = TextRenderer()
+        self.background = StaticLayers(self._render_background)
         
         # UI elements
         self.back_button = Button(50, SCREEN_HEIGHT - 70, 100, 40, "Back")
-        self.upgrade_buttons = []
+        self.input = InputDispatcher([self.back_button])
         
-        # Scrolling
-        self.scroll_offset = 0
-        self.max_scroll = 0
-        self.scroll_speed = 20
-        self.scroll_area_height = SCREEN_HEIGHT - 250  # Area available for scrolling
+        # Scrolling ingredient (left) and tool (right) upgrades, as
+        # (name, cost). Their buttons are only made while they're in view
+        self.scroll_view = ScrollView(0, 200, SCREEN_WIDTH, SCREEN_HEIGHT - 250)
+        self.ingredient_grid = self.scroll_view.add_grid(
+            ItemGrid(50, 200, 30, margin=10, make_widget=self._make_upgrade_button)
+        )
+        self.tool_grid = self.scroll_view.add_grid(
+            ItemGrid(350, 200, 30, margin=10, make_widget=self._make_upgrade_button)
+        )
         
         # Result message
         self.result_message = ""
@@ -31,54 +39,14 @@ class UpgradeScene:
         
     def _setup_ui(self):
         """Set up UI elements"""
-        self.upgrade_buttons = []
-        self.scroll_offset = 0
-        
-        # Get locked ingredients and tools
-        locked_ingredients = self.kitchen.get_locked_ingredients()
-        locked_tools = self.kitchen.get_locked_tools()
+        self.ingredient_grid.set_items(self.kitchen.get_locked_ingredients())
+        self.tool_grid.set_items(self.kitchen.get_locked_tools())
+        self.scroll_view.reset()
         
-        # Create ingredient upgrade buttons
-        y_pos = 200
-        for i, (ingredient, cost) in enumerate(locked_ingredients):
-            button = Button(
-                50,
-                y_pos + i * 40,
-                200,
-                30,
-                f"Unlock {ingredient} - {cost} coins"
-            )
-            self.upgrade_buttons.append({
-                "button": button,
-                "type": "ingredient",
-                "name": ingredient,
-                "cost": cost
-            })
-            
-        # Create tool upgrade buttons
-        y_pos = 200
-        for i, (tool, cost) in enumerate(locked_tools):
-            button = Button(
-                350,
-                y_pos + i * 40,
-                200,
-                30,
-                f"Unlock {tool} - {cost} coins"
-            )
-            self.upgrade_buttons.append({
-                "button": button,
-                "type": "tool",
-                "name": tool,
-                "cost": cost
-            })
-            
-        # Calculate max scroll based on content height
-        if self.upgrade_buttons:
-            last_button = max(self.upgrade_buttons, key=lambda b: b["button"].rect.bottom)
-            content_height = last_button["button"].rect.bottom - 200
-            self.max_scroll = max(0, content_height - self.scroll_area_height)
-        else:
-            self.max_scroll = 0
+    def _make_upgrade_button(self, upgrade, rect):
+        """Make the button of an upgrade scrolling into view"""
+        name, cost = upgrade
+        return Button(rect.x, rect.y, rect.width, rect.height, f"Unlock {name} - {cost} coins")
         
     def handle_events(self, events):
         """Handle events for the upgrade scene
@@ -92,59 +60,50 @@ class UpgradeScene:
         mouse_pos = pygame.mouse.get_pos()
         
         # Update button hover states
-        self.back_button.is_hovered(mouse_pos)
-        
-        # Adjust mouse position for scrolling when checking upgrade buttons
-        scroll_adjusted_pos = (mouse_pos[0], mouse_pos[1] + self.scroll_offset)
+        self.input.update_hover(mouse_pos)
         
-        for upgrade in self.upgrade_buttons:
-            # Only check buttons that are in the visible area
-            button_rect = upgrade["button"].rect
-            if 200 <= button_rect.y - self.scroll_offset <= SCREEN_HEIGHT - 100:
-                upgrade["button"].is_hovered(scroll_adjusted_pos)
+        # Update hover states of the upgrade buttons in view
+        self.scroll_view.update_hover(mouse_pos)
         
         for event in events:
             # Check back button
-            if self.back_button.is_clicked(mouse_pos, event):
+            if self.input.get_clicked(event) is self.back_button:
                 return "game"
                 
             # Handle scrolling
-            if event.type == pygame.MOUSEWHEEL:
-                self.scroll_offset -= event.y * self.scroll_speed
-                self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
-                
-            # Check upgrade buttons
+            self.scroll_view.handle_event(event)
+            
+            # Check the upgrade under the mouse
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-                for upgrade in self.upgrade_buttons:
-                    button_rect = upgrade["button"].rect
-                    # Only check buttons that are in the visible area
-                    if 200 <= button_rect.y - self.scroll_offset <= SCREEN_HEIGHT - 100:
-                        # Adjust mouse position for scrolling
-                        if button_rect.collidepoint(scroll_adjusted_pos):
-                            self._purchase_upgrade(upgrade)
-                            return None  # Stay in the same scene
-                
+                grid, index = self.scroll_view.get_item_at(event.pos)
+                if grid is not None:
+                    upgrade_type = "ingredient" if grid is self.ingredient_grid else "tool"
+                    self._purchase_upgrade(upgrade_type, *grid.items[index])
+                    return None  # Stay in the same scene
+                    
         return None
         
-    def _purchase_upgrade(self, upgrade):
+    def _purchase_upgrade(self, upgrade_type, name, cost):
         """Attempt to purchase an upgrade
         
         Args:
-            upgrade: Upgrade data dictionary
+            upgrade_type: "ingredient" or "tool"
+            name: Name of the ingredient or tool
+            cost: Price in coins
         """
-        if self.player.coins < upgrade["cost"]:
-            self.show_result(f"Not enough coins! Need {upgrade['cost']} coins.", 2.0)
+        if self.player.coins < cost:
+            self.show_result(f"Not enough coins! Need {cost} coins.", 2.0)
             return
             
         success = False
-        if upgrade["type"] == "ingredient":
-            success, cost = self.kitchen.unlock_ingredient(upgrade["name"])
-        elif upgrade["type"] == "tool":
-            success, cost = self.kitchen.unlock_tool(upgrade["name"])
+        if upgrade_type == "ingredient":
+            success, cost = self.kitchen.unlock_ingredient(name)
+        elif upgrade_type == "tool":
+            success, cost = self.kitchen.unlock_tool(name)
             
         if success:
             self.player.spend_coins(cost)
-            self.show_result(f"Unlocked {upgrade['name']}!", 2.0)
+            self.show_result(f"Unlocked {name}!", 2.0)
             # Refresh UI to remove purchased upgrade
             self._setup_ui()
         
@@ -160,6 +119,19 @@ class UpgradeScene:
             if self.result_timer <= 0:
                 self.result_message = ""
                 
+    def is_animating(self):
+        """Check whether the upgrade scene changes without input
+        
+        Returns:
+            bool: True while a result message is counting down
+        """
+        return self.result_timer > 0
+        
+    def on_exit(self):
+        """Free the shop's cached background and text while it is closed"""
+        self.background.invalidate()
+        self.text_renderer.clear_cache()
+        
     def show_result(self, message, duration=2.0):
         """Show a result message
         
@@ -176,22 +148,11 @@ class UpgradeScene:
         Args:
             screen: Pygame surface to render on
         """
-        # Clear screen
-        screen.fill(LIGHT_GRAY)
-        
-        # Draw title
-        self.text_renderer.render_text(
-            screen,
-            "Upgrade Shop",
-            "large",
-            BLACK,
-            SCREEN_WIDTH // 2,
-            50,
-            "center"
-        )
+        # Background, title and header never change
+        self.background.draw(screen)
         
         # Draw player coins
-        self.text_renderer.render_text(
+        self.text_renderer.render_counter(
             screen,
             f"Coins: {self.player.coins}",
             "medium",
@@ -201,46 +162,13 @@ class UpgradeScene:
             "left"
         )
         
-        # Draw available upgrades header
-        self.text_renderer.render_text(
-            screen,
-            "Available Upgrades:",
-            "medium",
-            BLACK,
-            50,
-            170,
-            "left"
-        )
-        
-        # Create a clipping rect for the scrollable area
-        scroll_area = pygame.Rect(0, 200, SCREEN_WIDTH, self.scroll_area_height)
-        
         # Draw scrollbar if needed
-        if self.max_scroll > 0:
-            scrollbar_height = self.scroll_area_height * (self.scroll_area_height / (self.scroll_area_height + self.max_scroll))
-            scrollbar_pos = 200 + (self.scroll_offset / self.max_scroll) * (self.scroll_area_height - scrollbar_height)
-            pygame.draw.rect(screen, (150, 150, 150), (SCREEN_WIDTH - 20, scrollbar_pos, 10, scrollbar_height))
-            pygame.draw.rect(screen, BLACK, (SCREEN_WIDTH - 20, scrollbar_pos, 10, scrollbar_height), 1)
+        self.scroll_view.draw_scrollbar(screen)
+        
+        # Draw the upgrade buttons in view
+        self.scroll_view.draw(screen, self.ingredient_grid)
+        self.scroll_view.draw(screen, self.tool_grid)
         
-        # Draw upgrade buttons (with scrolling)
-        for upgrade in self.upgrade_buttons:
-            button = upgrade["button"]
-            # Adjust button position for scrolling
-            button_rect = button.rect.copy()
-            button_rect.y -= self.scroll_offset
-            
-            # Only draw buttons that are in the visible area
-            if scroll_area.colliderect(button_rect):
-                # Store original rect
-                original_rect = button.rect
-                
-                # Temporarily set the rect to the scrolled position
-                button.rect = button_rect
-                button.draw(screen)
-                
-                # Restore original rect
-                button.rect = original_rect
-            
         # Draw back button (always at the bottom, outside scroll area)
         self.back_button.draw(screen)
         
@@ -255,3 +183,34 @@ class UpgradeScene:
                 SCREEN_HEIGHT - 120,
                 "center"
             )
+        
+    def _render_background(self, screen):
+        """Render the background, title and upgrades header
+        
+        Args:
+            screen: Pygame surface to render on
+        """
+        # Clear screen
+        screen.fill(LIGHT_GRAY)
+        
+        # Draw title
+        self.text_renderer.render_text(
+            screen,
+            "Upgrade Shop",
+            "large",
+            BLACK,
+            SCREEN_WIDTH // 2,
+            50,
+            "center"
+        )
+        
+        # Draw available upgrades header
+        self.text_renderer.render_text(
+            screen,
+            "Available Upgrades:",
+            "medium",
+            BLACK,
+            50,
+            170,
+            "left"
+        )
@@ -0,0 +1,254 @@
+"""
+On-disk cache of decoded and pre-scaled sprite images
+"""
+import hashlib
+import os
+import struct
+import threading
+import time
+import pygame
+from storage.json_writer import write_bytes_atomic
+
+MAGIC = b"KPIX"
+VERSION = 1
+
+# magic, version, width, height, then width * height RGBA pixels
+HEADER = struct.Struct("<4sHxxII")
+
+def hash_image(path):
+    """Hash the bytes of an image file
+    
+    Args:
+        path: Path of the image
+        
+    Returns:
+        str: Hex digest of the file's contents
+    """
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def decode_image(path, scale=1.0):
+    """Decode an image and scale it, without converting it to the display format
+    
+    Nothing here touches the display, so it can run off the main thread.
+    
+    Args:
+        path: Path of the image
+        scale: Scale factor
+        
+    Returns:
+        Surface: The image, to convert_alpha() before drawing
+    """
+    sprite = pygame.image.load(path)
+    if scale != 1.0:
+        width = int(sprite.get_width() * scale)
+        height = int(sprite.get_height() * scale)
+        sprite = pygame.transform.scale(sprite, (width, height))
+    return sprite
+
+
+class AssetCache:
+    """Sprite images kept as raw RGBA pixels, ready for convert_alpha()
+    
+    Decoding a PNG costs several times more than reading back its pixels,
+    so each image is decoded once and its pixels saved in the cache folder,
+    along with the image scaled to the size it is loaded at. Entries are
+    keyed by a hash of the image file and the size, so an edited image gets
+    new entries instead of stale pixels, whatever its modification time.
+    
+    decode_image() can be called from several threads at once, such as by
+    an AssetLoader's workers.
+    """
+    
+    def __init__(self, folder):
+        self.folder = folder
+        self.digests = {}  # Image path -> (mtime_ns, size, digest) hashed this run
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0  # Seconds spent loading images, summed over threads
+        self.lock = threading.Lock()  # Guards the counters
+        
+    def get_digest(self, path):
+        """Get the hash of an image file, hashing it again only if it changed"""
+        stat = os.stat(path)
+        known = self.digests.get(path)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+        digest = hash_image(path)
+        self.digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+        
+    def _get_path(self, digest, size=None):
+        """File an image is cached in, at its own size (None) or scaled to a size"""
+        if size is None:
+            return os.path.join(self.folder, f"{digest}.raw")
+        return os.path.join(self.folder, f"{digest}_{size[0]}x{size[1]}.raw")
+        
+    def _read_size(self, digest):
+        """Get an image's own size from its cached header, or None if it isn't cached"""
+        try:
+            with open(self._get_path(digest), "rb") as file:
+                header = file.read(HEADER.size)
+        except OSError:
+            return None
+        if len(header) < HEADER.size:
+            return None
+        magic, version, width, height = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            return None
+        return width, height
+        
+    def read(self, digest, size=None):
+        """Read cached pixels back into a surface
+        
+        Args:
+            digest: Hash of the image file
+            size: (width, height) it was scaled to, or None for its own size
+            
+        Returns:
+            Surface or None: The pixels, ready to convert_alpha(), or None if
+                they aren't cached
+        """
+        try:
+            with open(self._get_path(digest, size), "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, version, width, height = HEADER.unpack_from(data)
+        if (magic != MAGIC or version != VERSION or (size is not None and (width, height) != tuple(size))
+                or len(data) != HEADER.size + width * height * 4):
+            return None  # Written by another version, or cut short
+        pixels = memoryview(data)[HEADER.size:]
+        return pygame.image.frombuffer(pixels, (width, height), "RGBA")
+        
+    def write(self, digest, surface, scaled=False):
+        """Save a surface's pixels
+        
+        Args:
+            digest: Hash of the image file
+            surface: The image, at its own size or scaled
+            scaled: True if the surface was scaled from the image
+        """
+        width, height = surface.get_size()
+        path = self._get_path(digest, (width, height) if scaled else None)
+        try:
+            # Not fsynced: a file lost in a crash is decoded and saved again
+            write_bytes_atomic(path, HEADER.pack(MAGIC, VERSION, width, height) + pygame.image.tobytes(surface, "RGBA"), sync=False)
+        except Exception as e:
+            print(f"Error caching sprite image: {e}")
+            
+    def load_image(self, path, scale=1.0):
+        """Load an image at a scale, decoding and scaling it only if it isn't cached
+        
+        Args:
+            path: Path of the image
+            scale: Scale factor, as for SpriteManager.load_sprite
+            
+        Returns:
+            Surface or None: The converted sprite, or None if there is no such
+                file. Images pygame can't decode raise pygame.error.
+        """
+        sprite = self.decode_image(path, scale)
+        return sprite.convert_alpha() if sprite is not None else None
+        
+    def decode_image(self, path, scale=1.0):
+        """Get an image's pixels at a scale, from the cache or by decoding it
+        
+        Args:
+            path: Path of the image
+            scale: Scale factor
+            
+        Returns:
+            Surface or None: The sprite, to convert_alpha() before drawing, or
+                None if there is no such file. Images pygame can't decode
+                raise pygame.error.
+        """
+        if not os.path.exists(path):
+            return None
+        start = time.perf_counter()
+        try:
+            digest = self.get_digest(path)
+            size = None
+            if scale != 1.0:
+                # The scaled size comes from the cached header, so a hit
+                # never decodes the image
+                own_size = self._read_size(digest)
+                if own_size is not None:
+                    size = (int(own_size[0] * scale), int(own_size[1] * scale))
+            if scale == 1.0 or size is not None:
+                sprite = self.read(digest, size)
+                if sprite is not None:
+                    with self.lock:
+                        self.hits += 1
+                    return sprite
+                    
+            with self.lock:
+                self.misses += 1
+            sprite = self.read(digest) if scale != 1.0 else None
+            if sprite is None:
+                sprite = decode_image(path)
+                self.write(digest, sprite)
+            if scale != 1.0:
+                width = int(sprite.get_width() * scale)
+                height = int(sprite.get_height() * scale)
+                sprite = pygame.transform.scale(sprite, (width, height))
+                self.write(digest, sprite, scaled=True)
+            return sprite
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.load_time += elapsed
+            
+    def build(self, images, prune=True):
+        """Decode and scale images ahead of time, the game's asset build step
+        
+        Args:
+            images: List of (path, scale) to cache
+            prune: Also delete cached files none of the images use any more
+            
+        Returns:
+            int: Number of images cached
+        """
+        keep = set()
+        built = 0
+        for path, scale in images:
+            try:
+                sprite = self.decode_image(path, scale)
+            except pygame.error as e:
+                print(f"Error building sprite {path}: {e}")
+                continue
+            if sprite is None:
+                continue
+            digest = self.get_digest(path)
+            keep.add(os.path.basename(self._get_path(digest)))
+            if scale != 1.0:
+                keep.add(os.path.basename(self._get_path(digest, sprite.get_size())))
+            built += 1
+            
+        if prune and os.path.isdir(self.folder):
+            for name in os.listdir(self.folder):
+                if name.endswith(".raw") and name not in keep:
+                    os.remove(os.path.join(self.folder, name))
+        return built
+        
+    def get_cache_stats(self):
+        """Get asset cache counters
+        
+        Returns:
+            dict: Images read from the cache, images decoded, and seconds spent
+                loading images
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "load_time": self.load_time
+        }
+        
+    def reset_cache_stats(self):
+        """Reset the counters"""
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
@@ -0,0 +1,118 @@
+"""
+Append-only journal of JSON entries kept next to a base save file
+"""
+import json
+import os
+from storage.json_writer import remove_file
+
+class Journal:
+    """Line-per-entry JSON journal that is folded back into a base file
+    
+    Small changes are appended as one compact JSON line instead of
+    rewriting the whole base file, so each change costs the same no matter
+    how big the base has grown. Loading reads the base and then replays the
+    journal over it; entries must be safe to replay more than once.
+    
+    Compaction rotates the journal to a ".old" file, queues the new base
+    file and then queues removal of the rotated journal. Both go through the
+    save manager's writer in order, so the rotated entries are only deleted
+    once the base that contains them is on disk. Appends happen on the
+    calling thread; they are short and never block on a pending compaction.
+    """
+    
+    def __init__(self, path, max_bytes, save_manager=None):
+        self.path = path
+        self.rotated_path = f"{path}.old"  # Journal being folded into the base
+        self.max_bytes = max_bytes  # Size at which compaction is due
+        self.save_manager = save_manager
+        self.size = 0  # Bytes of entries not yet folded into the base
+        for journal_path in (self.rotated_path, self.path):
+            if os.path.exists(journal_path):
+                self._end_partial_line(journal_path)
+                self.size += os.path.getsize(journal_path)
+                
+    def _end_partial_line(self, journal_path):
+        """Terminate a line cut short by a crash so later appends stay separate"""
+        with open(journal_path, "rb+") as file:
+            file.seek(0, os.SEEK_END)
+            if file.tell() == 0:
+                return
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                file.write(b"\n")
+                
+    def read(self):
+        """Read every entry not yet folded into the base, oldest first
+        
+        A line cut short by a crash mid-append is skipped.
+        
+        Returns:
+            list: Decoded entries
+        """
+        entries = []
+        for journal_path in (self.rotated_path, self.path):
+            if not os.path.exists(journal_path):
+                continue
+            with open(journal_path, "r") as file:
+                for line in file:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        return entries
+        
+    def append(self, entry):
+        """Append an entry to the journal
+        
+        Args:
+            entry: JSON-serializable entry
+        """
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a") as file:
+            file.write(line)
+        self.size += len(line)
+        
+    def needs_compaction(self):
+        """Check whether the journal has grown past its size limit"""
+        return self.size >= self.max_bytes
+        
+    def rotate(self):
+        """Move the current entries aside before a new base file is written
+        
+        Call this right before queueing the base file, then call
+        drop_rotated() right after.
+        """
+        if os.path.exists(self.rotated_path):
+            if self.save_manager is not None and self.save_manager.is_pending(self.rotated_path):
+                # The last compaction is still being written; let it finish
+                self.save_manager.wait_for_writer()
+                
+        if not os.path.exists(self.path):
+            return
+            
+        if os.path.exists(self.rotated_path):
+            # Left over from an interrupted compaction, so keep both sets
+            with open(self.path, "r") as source, open(self.rotated_path, "a") as target:
+                target.write(source.read())
+            os.remove(self.path)
+        else:
+            os.replace(self.path, self.rotated_path)
+            
+    def drop_rotated(self):
+        """Delete the rotated entries once the base file queued before is written"""
+        self.size = 0
+        if self.save_manager is not None:
+            self.save_manager.delete_file(self.rotated_path)
+        else:
+            remove_file(self.rotated_path)
+            
+    def clear(self):
+        """Delete the journal and any rotated entries"""
+        if self.save_manager is not None and self.save_manager.is_pending(self.rotated_path):
+            self.save_manager.wait_for_writer()
+        remove_file(self.rotated_path)
+        remove_file(self.path)
+        self.size = 0
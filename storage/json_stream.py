@@ -0,0 +1,117 @@
+"""
+Incremental reader for large JSON documents
+"""
+import json
+from json.decoder import WHITESPACE
+
+CHUNK_SIZE = 1 << 20  # Characters read from the file at a time
+
+class _Reader:
+    """Buffered cursor over a text file that decodes one JSON value at a time"""
+    
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.consumed = 0  # Characters dropped from the front of the buffer
+        self.eof = False
+        
+    def _read_more(self):
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+            
+        # Drop what has been parsed so the buffer stays about one chunk long
+        self.consumed += self.position
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+        
+    def _error(self, message):
+        return ValueError(f"{message} at character {self.consumed + self.position}")
+        
+    def peek(self):
+        """Skip whitespace and return the next character, or "" at the end"""
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read_more():
+                return ""
+                
+    def expect(self, char):
+        """Consume the next character, which has to be char"""
+        if self.peek() != char:
+            raise self._error(f"Expected {char!r}")
+        self.position += 1
+        
+    def value(self):
+        """Decode the next value
+        
+        Returns:
+            tuple: (decoded value, JSON text of the value)
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # A number at the very end of the buffer may continue in the
+                # next chunk
+                if end < len(self.buffer) or self.eof:
+                    text = self.buffer[self.position:end]
+                    self.position = end
+                    return value, text
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise self._error(f"Invalid JSON ({e.msg})")
+            self._read_more()
+            
+def iter_members(file, raw_arrays=(), chunk_size=CHUNK_SIZE):
+    """Stream the members of a top-level JSON object without loading it whole
+    
+    Only one member (or one array element) is held in memory at a time, plus
+    the read buffer.
+    
+    Args:
+        file: Text file positioned at the start of the document
+        raw_arrays: Keys of array members to stream element by element
+        chunk_size: Characters to read at a time
+        
+    Yields:
+        tuple: (key, value) for each member. Arrays named in raw_arrays
+            yield (key, element) once per element instead, with the element
+            left as JSON text so it can be handed to another process cheaply.
+    """
+    reader = _Reader(file, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+        
+    while True:
+        key, _ = reader.value()
+        if not isinstance(key, str):
+            raise reader._error("Expected a member name")
+        reader.expect(":")
+        
+        if key in raw_arrays and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() != "]":
+                while True:
+                    _, text = reader.value()
+                    yield key, text
+                    if reader.peek() != ",":
+                        break
+                    reader.position += 1
+            reader.expect("]")
+        else:
+            value, _ = reader.value()
+            yield key, value
+            
+        if reader.peek() != ",":
+            break
+        reader.position += 1
+        
+    reader.expect("}")
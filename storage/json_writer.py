@@ -0,0 +1,217 @@
+"""
+Background writer thread for JSON save files
+"""
+import json
+import os
+import tempfile
+import textwrap
+import threading
+
+# Queued in place of data to delete a file instead of writing it
+REMOVE = object()
+
+# mkstemp creates files readable only by the owner; save files should get
+# the same permissions open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def write_json_atomic(path, data, indent=2):
+    """Write JSON to a file without ever leaving a partial file behind
+    
+    The data goes to a temporary file in the same directory, which is
+    fsynced and then renamed over the target. Readers see either the old
+    file or the new one, never a truncated write.
+    
+    Args:
+        path: Path of the file to write
+        data: JSON-serializable data
+        indent: Indentation passed to json.dump
+    """
+    _replace_file(path, "w", lambda file: json.dump(data, file, indent=indent))
+    
+def write_json_array_atomic(path, key, items, indent=2):
+    """Write {key: [items]} the way write_json_atomic would, one item at a time
+    
+    The items can be a generator, so a large array never has to be held in
+    memory as a whole. The file comes out the same as json.dump would
+    write it.
+    
+    Args:
+        path: Path of the file to write
+        key: Name of the array in the top-level object
+        items: Iterable of JSON-serializable items
+        indent: Indentation passed to json.dumps
+    """
+    def write(file):
+        item_indent = " " * indent * 2
+        file.write(f"{{\n{' ' * indent}{json.dumps(key)}: [")
+        separator = "\n"
+        for item in items:
+            file.write(separator + textwrap.indent(json.dumps(item, indent=indent), item_indent))
+            separator = ",\n"
+        if separator == "\n":
+            file.write("]\n}")
+        else:
+            file.write(f"\n{' ' * indent}]\n}}")
+    _replace_file(path, "w", write)
+    
+def write_bytes_atomic(path, data, sync=True):
+    """Write binary data to a file the same way write_json_atomic does
+    
+    Args:
+        path: Path of the file to write
+        data: Bytes-like object to write
+        sync: Fsync before renaming. Files that can be rebuilt (caches) can
+            skip it, still never leaving a partial file under the name
+    """
+    _replace_file(path, "wb", lambda file: file.write(data), sync)
+    
+def _replace_file(path, mode, write, sync=True):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, mode) as file:
+            write(file)
+            file.flush()
+            if sync:
+                os.fsync(file.fileno())
+        os.chmod(temp_path, 0o666 & ~_UMASK)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+        
+def remove_file(path):
+    """Delete a file if it exists
+    
+    Args:
+        path: Path of the file to delete
+    """
+    if os.path.exists(path):
+        os.remove(path)
+
+
+class JsonWriter:
+    """Single I/O thread that writes JSON snapshots off the render thread
+    
+    Callers hand over a fresh snapshot of the data to write. Only the latest
+    snapshot per path is kept, so a file that changes several times before
+    the thread gets to it is written once. Paths are written in the order
+    they were first queued. Other save work, such as updating a row of the
+    save store, is queued as a function under a name in place of a path.
+    """
+    
+    def __init__(self):
+        self.pending = {}  # Path -> snapshot (or REMOVE), in queue order
+        self.condition = threading.Condition()
+        self.busy = False
+        self.current = None  # Path being written right now
+        self.closed = False
+        self.write_count = 0
+        self.error_count = 0
+        self.thread = threading.Thread(target=self._run, name="json-writer", daemon=True)
+        self.thread.start()
+        
+    def write(self, path, data):
+        """Queue a JSON snapshot to be written to a file
+        
+        Args:
+            path: Path of the file to write
+            data: JSON-serializable snapshot that nobody mutates afterwards
+        """
+        self._queue(path, data)
+        
+    def remove(self, path):
+        """Queue a file to be deleted
+        
+        Args:
+            path: Path of the file to delete
+        """
+        self._queue(path, REMOVE)
+        
+    def call(self, name, function):
+        """Queue a function to run on the writer thread
+        
+        Args:
+            name: Name the work is queued under; queuing another function
+                under it before it runs replaces the first
+            function: Function taking no arguments that does the saving
+        """
+        self._queue(name, function)
+        
+    def _queue(self, path, data):
+        with self.condition:
+            if not self.closed:
+                self.pending[path] = data
+                self.condition.notify_all()
+                return
+                
+        # The thread is gone, so do the work here rather than lose it
+        self._perform(path, data)
+        
+    def is_pending(self, path):
+        """Check whether a write or removal of a path has not finished yet
+        
+        Args:
+            path: Path of the file
+            
+        Returns:
+            bool: True if the path is queued or being written
+        """
+        with self.condition:
+            return path in self.pending or path == self.current
+            
+    def flush(self):
+        """Block until every queued write has finished"""
+        with self.condition:
+            while self.pending or self.busy:
+                self.condition.wait()
+                
+    def close(self):
+        """Finish all queued writes and stop the thread"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+        
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                    
+                path = next(iter(self.pending))
+                data = self.pending.pop(path)
+                self.busy = True
+                self.current = path
+                
+            try:
+                self._perform(path, data)
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.current = None
+                    self.condition.notify_all()
+                    
+    def _perform(self, path, data):
+        try:
+            if data is REMOVE:
+                remove_file(path)
+            elif callable(data):
+                data()
+                self.write_count += 1
+            else:
+                write_json_atomic(path, data)
+                self.write_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error writing {path}: {e}")
@@ -0,0 +1,750 @@
+"""
+Compiled binary recipe catalog that is read through mmap
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import MutableMapping
+from storage.json_writer import write_bytes_atomic
+
+MAGIC = b"KRCP"
+VERSION = 1
+
+# magic, version, source mtime (ns), source size, recipe count, duplicates
+# dropped, bytes per bitset, then the offset of each section
+HEADER = struct.Struct("<4sHxxqqIII4xQQQQQQQQQ")
+
+# name offset, name length, ingredient count, tool count, requirements
+# offset, difficulty, discovered, cooking time
+RECORD = struct.Struct("<IHBBIBBxxd")
+
+# Largest recipes and vocabulary the record and requirement fields can hold
+MAX_REQUIREMENTS = 255  # Ingredients, or tools, of one recipe
+MAX_NAME_BYTES = 0xFFFF  # UTF-8 bytes of a recipe name
+MAX_VOCABULARY = 0x10000  # Distinct ingredients, or tools, of a catalog
+
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+EMPTY_SLOT = 0xFFFFFFFF
+
+def _signature_key(ingredient_ids, tool_ids):
+    """Pack a set of interned IDs into the key hashed by the signature table"""
+    ingredient_ids = sorted(set(ingredient_ids))
+    tool_ids = sorted(set(tool_ids))
+    return struct.pack(
+        f"<HH{len(ingredient_ids)}H{len(tool_ids)}H",
+        len(ingredient_ids), len(tool_ids), *ingredient_ids, *tool_ids
+    )
+    
+def fits_record(data):
+    """Check whether a recipe's name and requirements fit in a catalog record
+    
+    Args:
+        data: Recipe dictionary as stored in recipes.json
+        
+    Returns:
+        bool: True if the recipe can be compiled
+    """
+    return (len(data["ingredients"]) <= MAX_REQUIREMENTS and len(data["tools"]) <= MAX_REQUIREMENTS
+            and len(data["name"].encode("utf-8")) <= MAX_NAME_BYTES)
+            
+def _forget_new_ids(ids):
+    """Take back the IDs handed out past the end of the vocabulary"""
+    for name in list(ids)[MAX_VOCABULARY:]:
+        del ids[name]
+        
+def _bitsets(groups, recipe_count):
+    """Turn lists of recipe IDs into little-endian bitsets of equal length"""
+    size_in_bytes = (recipe_count + 7) // 8
+    for recipe_ids in groups:
+        bits = bytearray(size_in_bytes)
+        for recipe_id in recipe_ids:
+            bits[recipe_id >> 3] |= 1 << (recipe_id & 7)
+        yield bytes(bits)
+        
+def compile_catalog(recipes_data, path, source_stat=None):
+    """Compile recipe dictionaries into a catalog file
+    
+    A recipe whose name (ignoring case) comes up again is replaced by the
+    later entry, keeping its place, as loading the JSON into a dictionary
+    did. Recipes that repeat an earlier recipe's ingredient and tool
+    combination are dropped, and their discovered flag is folded into the
+    recipe kept, the same way RecipeSystem treats duplicates. Both count
+    as duplicates.
+    
+    Recipes the format can't hold are left out: those with more than
+    MAX_REQUIREMENTS ingredients or tools or a name over MAX_NAME_BYTES,
+    and those that would take the ingredient or tool vocabulary past
+    MAX_VOCABULARY.
+    
+    Args:
+        recipes_data: Recipe dictionaries as stored in recipes.json
+        path: Path of the catalog file to write
+        source_stat: os.stat_result of the JSON source, used to detect
+            when the catalog is stale (optional)
+            
+    Returns:
+        list: Recipe dictionaries left out
+    """
+    ingredient_ids = {}
+    tool_ids = {}
+    records = []  # [data, ingredient IDs, tool IDs, discovered]
+    signatures = {}  # Signature key -> record position
+    left_out = []
+    
+    # Later entries win over earlier ones with the same name
+    by_name = {}
+    for data in recipes_data:
+        if fits_record(data):
+            by_name[data["name"].casefold()] = data
+        else:
+            left_out.append(data)
+            
+    for data in by_name.values():
+        ingredients = [ingredient_ids.setdefault(item, len(ingredient_ids)) for item in data["ingredients"]]
+        tools = [tool_ids.setdefault(item, len(tool_ids)) for item in data["tools"]]
+        if len(ingredient_ids) > MAX_VOCABULARY or len(tool_ids) > MAX_VOCABULARY:
+            _forget_new_ids(ingredient_ids)
+            _forget_new_ids(tool_ids)
+            left_out.append(data)
+            continue
+        key = _signature_key(ingredients, tools)
+        if key in signatures:
+            records[signatures[key]][3] |= bool(data.get("discovered", False))
+            continue
+        signatures[key] = len(records)
+        records.append([data, ingredients, tools, bool(data.get("discovered", False))])
+        
+    recipe_count = len(records)
+    names = bytearray()
+    record_bytes = bytearray()
+    requirements = []
+    ingredient_groups = [[] for _ in ingredient_ids]
+    tool_groups = [[] for _ in tool_ids]
+    size_groups = {}
+    discovered_ids = []
+    folded_names = []
+    
+    for recipe_id, (data, ingredients, tools, discovered) in enumerate(records):
+        name = data["name"].encode("utf-8")
+        record_bytes += RECORD.pack(
+            len(names), len(name), len(ingredients), len(tools), len(requirements),
+            int(data["difficulty"]), discovered, float(data["cooking_time"])
+        )
+        names += name
+        requirements.extend(ingredients)
+        requirements.extend(tools)
+        
+        for ingredient_id in set(ingredients):
+            ingredient_groups[ingredient_id].append(recipe_id)
+        for tool_id in set(tools):
+            tool_groups[tool_id].append(recipe_id)
+        size = len(set(ingredients)) + len(set(tools))
+        size_groups.setdefault(size, []).append(recipe_id)
+        if discovered:
+            discovered_ids.append(recipe_id)
+        folded_names.append((data["name"].casefold(), data["name"], recipe_id))
+        
+    # Name lookups binary search this table of recipe IDs. Folded names are
+    # unique by now, so sorting on them alone gives the same order much
+    # faster than comparing whole tuples
+    folded_names.sort(key=lambda entry: entry[0])
+    name_order = struct.pack(f"<{recipe_count}I", *(recipe_id for _, _, recipe_id in folded_names))
+    
+    # Open-addressing hash table from signature key to recipe ID
+    slot_count = 1
+    while slot_count < recipe_count * 2:
+        slot_count *= 2
+    slots = [EMPTY_SLOT] * slot_count
+    for key, recipe_id in signatures.items():
+        slot = zlib.crc32(key) & (slot_count - 1)
+        while slots[slot] != EMPTY_SLOT:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = recipe_id
+    signature_table = struct.pack(f"<{slot_count}I", *slots)
+    
+    sizes = sorted(size_groups)
+    vocabulary = json.dumps({
+        "ingredients": list(ingredient_ids),
+        "tools": list(tool_ids),
+        "sizes": sizes
+    }).encode("utf-8")
+    masks = b"".join(_bitsets(
+        ingredient_groups + tool_groups + [size_groups[size] for size in sizes] + [discovered_ids],
+        recipe_count
+    ))
+    
+    sections = [
+        vocabulary,
+        bytes(record_bytes),
+        struct.pack(f"<{len(requirements)}H", *requirements),
+        bytes(names),
+        name_order,
+        signature_table,
+        masks
+    ]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        offsets.append(position)
+        position += len(section)
+        
+    header = HEADER.pack(
+        MAGIC, VERSION,
+        source_stat.st_mtime_ns if source_stat else 0,
+        source_stat.st_size if source_stat else 0,
+        recipe_count, len(recipes_data) - recipe_count - len(left_out), (recipe_count + 7) // 8,
+        *offsets, len(vocabulary), slot_count
+    )
+    write_bytes_atomic(path, header + b"".join(sections))
+    return left_out
+    
+def open_catalog(source_path, compiled_path):
+    """Open the compiled catalog for a recipes JSON file, compiling it if needed
+    
+    The catalog is rebuilt whenever the JSON file's modification time or
+    size no longer match the ones it was compiled from.
+    
+    Args:
+        source_path: Path of the recipes JSON file
+        compiled_path: Path of the compiled catalog
+        
+    Returns:
+        CompiledCatalog: Open catalog
+    """
+    source_stat = os.stat(source_path)
+    if os.path.exists(compiled_path):
+        try:
+            catalog = CompiledCatalog(compiled_path)
+        except (OSError, ValueError):
+            catalog = None  # Empty or unreadable, so compile it again
+        if catalog is not None:
+            if catalog.is_compiled_from(source_stat):
+                return catalog
+            catalog.close()
+            
+    with open(source_path, "r") as file:
+        recipes_data = json.load(file).get("recipes", [])
+    compile_catalog(recipes_data, compiled_path, source_stat)
+    return CompiledCatalog(compiled_path)
+
+
+class CompiledCatalog:
+    """Read-only view of a compiled catalog file
+    
+    The file is memory-mapped and nothing is decoded up front except the
+    ingredient and tool vocabulary. Records, names and lookups are read
+    straight from the mapping when asked for.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            
+        self.valid = len(self.data) >= HEADER.size
+        if self.valid:
+            fields = HEADER.unpack_from(self.data)
+            self.valid = fields[0] == MAGIC and fields[1] == VERSION
+        if not self.valid:
+            return
+            
+        (_, _, self.source_mtime_ns, self.source_size, self.count, self.duplicates,
+         self.mask_bytes, self.vocabulary_offset, self.records_offset,
+         self.requirements_offset, self.names_offset, self.order_offset,
+         self.signatures_offset, self.masks_offset, vocabulary_length,
+         self.slot_count) = fields
+         
+        vocabulary = json.loads(
+            self.data[self.vocabulary_offset:self.vocabulary_offset + vocabulary_length]
+        )
+        self.ingredients = vocabulary["ingredients"]
+        self.tools = vocabulary["tools"]
+        self.sizes = vocabulary["sizes"]
+        self.ingredient_ids = {item: i for i, item in enumerate(self.ingredients)}
+        self.tool_ids = {item: i for i, item in enumerate(self.tools)}
+        
+    def __len__(self):
+        return self.count
+        
+    def ids(self):
+        """Get the position of every recipe in the catalog
+        
+        Returns:
+            iterable: Recipe positions in catalog order
+        """
+        return range(self.count)
+        
+    def close(self):
+        """Release the memory mapping"""
+        self.data.close()
+        
+    def is_compiled_from(self, source_stat):
+        """Check whether the catalog is up to date with its JSON source
+        
+        Args:
+            source_stat: os.stat_result of the JSON source
+            
+        Returns:
+            bool: True if the catalog can be used as is
+        """
+        return (
+            self.valid
+            and self.source_mtime_ns == source_stat.st_mtime_ns
+            and self.source_size == source_stat.st_size
+        )
+        
+    def name(self, recipe_id):
+        """Get the name of a recipe
+        
+        Args:
+            recipe_id: Position of the recipe in the catalog
+            
+        Returns:
+            str: Recipe name
+        """
+        name_offset, name_length = struct.unpack_from(
+            "<IH", self.data, self.records_offset + recipe_id * RECORD.size
+        )
+        start = self.names_offset + name_offset
+        return self.data[start:start + name_length].decode("utf-8")
+        
+    def record(self, recipe_id):
+        """Decode a recipe into the dictionary format used by recipes.json
+        
+        Args:
+            recipe_id: Position of the recipe in the catalog
+            
+        Returns:
+            dict: Recipe data
+        """
+        (name_offset, name_length, ingredient_count, tool_count, requirements,
+         difficulty, discovered, cooking_time) = RECORD.unpack_from(
+            self.data, self.records_offset + recipe_id * RECORD.size
+        )
+        start = self.names_offset + name_offset
+        ids = struct.unpack_from(
+            f"<{ingredient_count + tool_count}H", self.data,
+            self.requirements_offset + requirements * U16.size
+        )
+        return {
+            "name": self.data[start:start + name_length].decode("utf-8"),
+            "ingredients": [self.ingredients[i] for i in ids[:ingredient_count]],
+            "tools": [self.tools[i] for i in ids[ingredient_count:]],
+            "cooking_time": int(cooking_time) if cooking_time.is_integer() else cooking_time,
+            "difficulty": difficulty,
+            "discovered": bool(discovered)
+        }
+        
+    def _requirement_ids(self, recipe_id):
+        _, _, ingredient_count, tool_count, requirements, _, _, _ = RECORD.unpack_from(
+            self.data, self.records_offset + recipe_id * RECORD.size
+        )
+        ids = struct.unpack_from(
+            f"<{ingredient_count + tool_count}H", self.data,
+            self.requirements_offset + requirements * U16.size
+        )
+        return ids[:ingredient_count], ids[ingredient_count:]
+        
+    def _lower_bound(self, key):
+        """Find the first position in the name table not sorted before key"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            recipe_id = U32.unpack_from(self.data, self.order_offset + middle * U32.size)[0]
+            name = self.name(recipe_id)
+            if (name.casefold(), name) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+        
+    def find(self, name):
+        """Find a recipe by its exact name
+        
+        Args:
+            name: Recipe name
+            
+        Returns:
+            int or None: Position of the recipe in the catalog
+        """
+        position = self._lower_bound((name.casefold(), name))
+        if position < self.count:
+            recipe_id = U32.unpack_from(self.data, self.order_offset + position * U32.size)[0]
+            if self.name(recipe_id) == name:
+                return recipe_id
+        return None
+        
+    def find_folded_name(self, folded_name):
+        """Find a recipe name by its case-folded form
+        
+        Args:
+            folded_name: Case-folded recipe name
+            
+        Returns:
+            str or None: The recipe's actual name
+        """
+        position = self._lower_bound((folded_name, ""))
+        if position < self.count:
+            recipe_id = U32.unpack_from(self.data, self.order_offset + position * U32.size)[0]
+            name = self.name(recipe_id)
+            if name.casefold() == folded_name:
+                return name
+        return None
+        
+    def find_signature(self, ingredients, tools):
+        """Find the recipe that uses exactly these ingredients and tools
+        
+        Args:
+            ingredients: Ingredient names
+            tools: Tool names
+            
+        Returns:
+            str or None: Name of the recipe
+        """
+        if not self.count:
+            return None
+        try:
+            ingredient_ids = [self.ingredient_ids[item] for item in ingredients]
+            tool_ids = [self.tool_ids[item] for item in tools]
+        except KeyError:
+            return None
+            
+        key = _signature_key(ingredient_ids, tool_ids)
+        mask = self.slot_count - 1
+        slot = zlib.crc32(key) & mask
+        while True:
+            recipe_id = U32.unpack_from(self.data, self.signatures_offset + slot * U32.size)[0]
+            if recipe_id == EMPTY_SLOT:
+                return None
+            if _signature_key(*self._requirement_ids(recipe_id)) == key:
+                return self.name(recipe_id)
+            slot = (slot + 1) & mask
+            
+    def _mask(self, position):
+        start = self.masks_offset + position * self.mask_bytes
+        return int.from_bytes(self.data[start:start + self.mask_bytes], "little")
+        
+    def masks(self):
+        """Load the precomputed RecipeIndex bitsets
+        
+        Returns:
+            tuple: (ingredient masks, tool masks, size masks), each a dict
+                from item or requirement count to a bitset of recipe IDs
+        """
+        ingredient_masks = {item: self._mask(i) for i, item in enumerate(self.ingredients)}
+        offset = len(self.ingredients)
+        tool_masks = {item: self._mask(offset + i) for i, item in enumerate(self.tools)}
+        offset += len(self.tools)
+        size_masks = {size: self._mask(offset + i) for i, size in enumerate(self.sizes)}
+        return ingredient_masks, tool_masks, size_masks
+        
+    def discovered_ids(self):
+        """Get the positions of every recipe compiled as discovered
+        
+        Returns:
+            list: Recipe positions in catalog order
+        """
+        start = self.masks_offset + self.mask_bytes * (
+            len(self.ingredients) + len(self.tools) + len(self.sizes)
+        )
+        recipe_ids = []
+        for byte_index, byte in enumerate(self.data[start:start + self.mask_bytes]):
+            if byte:
+                recipe_ids.extend(byte_index * 8 + bit for bit in range(8) if byte >> bit & 1)
+        return recipe_ids
+
+
+class ChainedCatalog:
+    """Two compiled catalogs read as one, such as recipes.json and the content packs
+    
+    Positions in the second catalog follow on from those of the first, and
+    lookups try the first catalog before the second. A recipe of the second
+    catalog is hidden when a discovered recipe of the first has its name,
+    which is how a discovered pack recipe ends up once it is written to
+    recipes.json.
+    """
+    
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+        self.offset = len(first)  # Position of the second catalog's first recipe
+        self.hidden = set()  # Positions in the second catalog
+        self.hidden_names = set()  # Case-folded names of the hidden recipes
+        for recipe_id in first.discovered_ids():
+            name = first.name(recipe_id)
+            hidden_id = second.find(name)
+            if hidden_id is not None:
+                self.hidden.add(hidden_id)
+                self.hidden_names.add(name.casefold())
+        self.count = len(first) + len(second) - len(self.hidden)
+        self.duplicates = first.duplicates + second.duplicates
+        
+    def __len__(self):
+        return self.offset + len(self.second)
+        
+    def ids(self):
+        """Get the position of every recipe that isn't hidden
+        
+        Returns:
+            generator: Recipe positions in catalog order
+        """
+        yield from self.first.ids()
+        for recipe_id in self.second.ids():
+            if recipe_id not in self.hidden:
+                yield self.offset + recipe_id
+                
+    def close(self):
+        """Release both memory mappings"""
+        self.first.close()
+        self.second.close()
+        
+    def name(self, recipe_id):
+        if recipe_id < self.offset:
+            return self.first.name(recipe_id)
+        return self.second.name(recipe_id - self.offset)
+        
+    def record(self, recipe_id):
+        if recipe_id < self.offset:
+            return self.first.record(recipe_id)
+        return self.second.record(recipe_id - self.offset)
+        
+    def find(self, name):
+        recipe_id = self.first.find(name)
+        if recipe_id is not None:
+            return recipe_id
+        recipe_id = self.second.find(name)
+        if recipe_id is None or recipe_id in self.hidden:
+            return None
+        return self.offset + recipe_id
+        
+    def find_folded_name(self, folded_name):
+        return self.first.find_folded_name(folded_name) or self._visible(
+            self.second.find_folded_name(folded_name)
+        )
+        
+    def find_signature(self, ingredients, tools):
+        return self.first.find_signature(ingredients, tools) or self._visible(
+            self.second.find_signature(ingredients, tools)
+        )
+        
+    def _visible(self, name):
+        """Pass on a name found in the second catalog unless it is hidden"""
+        if name is None or name.casefold() in self.hidden_names:
+            return None
+        return name
+        
+    def masks(self):
+        """Load both catalogs' bitsets, shifting the second's past the first
+        
+        Returns:
+            tuple: (ingredient masks, tool masks, size masks) as from
+                CompiledCatalog.masks
+        """
+        hidden = 0
+        for recipe_id in self.hidden:
+            hidden |= 1 << recipe_id
+        combined = []
+        for first_masks, second_masks in zip(self.first.masks(), self.second.masks()):
+            masks = dict(first_masks)
+            for key, mask in second_masks.items():
+                masks[key] = masks.get(key, 0) | (mask & ~hidden) << self.offset
+            combined.append(masks)
+        return tuple(combined)
+        
+    def discovered_ids(self):
+        """Get the positions of every recipe compiled as discovered
+        
+        Returns:
+            list: Recipe positions in catalog order
+        """
+        return self.first.discovered_ids() + [
+            self.offset + recipe_id for recipe_id in self.second.discovered_ids()
+            if recipe_id not in self.hidden
+        ]
+
+
+class CatalogNames:
+    """Recipe names by index ID, read from a catalog with room to grow
+    
+    Stands in for RecipeIndex.names so the index never has to decode every
+    name in the catalog.
+    """
+    
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.changed = {}  # Catalog position -> replacement (None once removed)
+        self.extra = []  # Names indexed after the catalog was loaded
+        
+    def __len__(self):
+        return len(self.catalog) + len(self.extra)
+        
+    def __getitem__(self, recipe_id):
+        if recipe_id >= len(self.catalog):
+            return self.extra[recipe_id - len(self.catalog)]
+        if recipe_id in self.changed:
+            return self.changed[recipe_id]
+        return self.catalog.name(recipe_id)
+        
+    def __setitem__(self, recipe_id, name):
+        if recipe_id >= len(self.catalog):
+            self.extra[recipe_id - len(self.catalog)] = name
+        else:
+            self.changed[recipe_id] = name
+            
+    def append(self, name):
+        self.extra.append(name)
+
+
+class CatalogIds:
+    """Index IDs by recipe name, read from a catalog with room to grow
+    
+    Stands in for RecipeIndex.ids alongside CatalogNames.
+    """
+    
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.extra = {}  # Name -> ID for names indexed after loading
+        self.removed = set()  # Catalog names dropped from the index
+        
+    def __len__(self):
+        return self.catalog.count - len(self.removed) + len(self.extra)
+        
+    def __contains__(self, name):
+        return self.get(name) is not None
+        
+    def __setitem__(self, name, recipe_id):
+        self.extra[name] = recipe_id
+        
+    def get(self, name, default=None):
+        if name in self.extra:
+            return self.extra[name]
+        if name in self.removed:
+            return default
+        recipe_id = self.catalog.find(name)
+        return default if recipe_id is None else recipe_id
+        
+    def pop(self, name, default=None):
+        if name in self.extra:
+            return self.extra.pop(name)
+        recipe_id = self.get(name)
+        if recipe_id is None:
+            return default
+        self.removed.add(name)
+        return recipe_id
+
+
+class CatalogRecipes(MutableMapping):
+    """Recipe name -> Recipe mapping that builds recipes from a catalog on access
+    
+    Recipes are only created the first time they are looked up, except for
+    discovered recipes, which are created up front so the recipe book and
+    customers can list them without touching the rest of the catalog.
+    Recipes added or replaced later are kept in memory on top.
+    """
+    
+    def __init__(self, catalog, recipe_factory):
+        self.catalog = catalog
+        self.recipe_factory = recipe_factory  # Builds a recipe from a dictionary
+        self.loaded = {}  # Name -> recipe created or added so far
+        self.extra = {}  # Names added that are not in the catalog, in order
+        self.removed = set()  # Catalog names deleted from the mapping
+        self.positions = {}  # Name -> catalog position, for loaded catalog recipes
+        for recipe_id in catalog.discovered_ids():
+            self._load(recipe_id)
+            
+    def _load(self, recipe_id):
+        recipe = self.recipe_factory(self.catalog.record(recipe_id))
+        self.loaded[recipe.name] = recipe
+        self.positions[recipe.name] = recipe_id
+        return recipe
+        
+    def _in_catalog(self, name):
+        return name not in self.removed and self.catalog.find(name) is not None
+        
+    def __getitem__(self, name):
+        recipe = self.loaded.get(name)
+        if recipe is not None:
+            return recipe
+        if name in self.removed:
+            raise KeyError(name)
+        recipe_id = self.catalog.find(name)
+        if recipe_id is None:
+            raise KeyError(name)
+        return self._load(recipe_id)
+        
+    def __setitem__(self, name, recipe):
+        if name not in self.loaded:
+            recipe_id = None if name in self.removed else self.catalog.find(name)
+            if recipe_id is None:
+                self.extra[name] = None
+            else:
+                self.positions[name] = recipe_id
+        self.loaded[name] = recipe
+        
+    def __delitem__(self, name):
+        if name in self.extra:
+            del self.extra[name]
+        elif self._in_catalog(name):
+            self.removed.add(name)
+        else:
+            raise KeyError(name)
+        self.loaded.pop(name, None)
+        self.positions.pop(name, None)
+        
+    def __iter__(self):
+        for recipe_id in self.catalog.ids():
+            name = self.catalog.name(recipe_id)
+            if name not in self.removed:
+                yield name
+        yield from list(self.extra)
+        
+    def __len__(self):
+        return self.catalog.count - len(self.removed) + len(self.extra)
+        
+    def discovered(self):
+        """Get every discovered recipe without building the rest
+        
+        Returns:
+            list: Discovered recipes
+        """
+        return [recipe for recipe in self.loaded.values() if recipe.discovered]
+        
+    def records(self, saved_count=None):
+        """Get every recipe as a dictionary without building the rest
+        
+        The recipes built so far are copied now, so the result can be read
+        on another thread while the mapping keeps changing, as long as the
+        catalog stays open.
+        
+        Args:
+            saved_count: Number of leading catalog positions that hold saved
+                recipes. Recipes past them, such as content pack recipes,
+                are left out unless they were built and discovered
+                (default: every position)
+                
+        Returns:
+            generator: Recipe dictionaries in mapping order
+        """
+        if saved_count is None:
+            saved_count = len(self.catalog)
+        loaded = {name: recipe.to_dict() for name, recipe in self.loaded.items()}
+        unsaved = [
+            name for name, recipe_id in self.positions.items()
+            if recipe_id >= saved_count and loaded[name]["discovered"]
+        ]
+        return self._records(loaded, set(self.removed), unsaved + list(self.extra), saved_count)
+        
+    def _records(self, loaded, removed, extra, saved_count):
+        for recipe_id in self.catalog.ids():
+            if recipe_id >= saved_count:
+                break
+            name = self.catalog.name(recipe_id)
+            if name in removed:
+                continue
+            data = loaded.get(name)
+            yield data if data is not None else self.catalog.record(recipe_id)
+        for name in extra:
+            yield loaded[name]
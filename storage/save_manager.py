@@ -0,0 +1,196 @@
+"""
+Save manager for coalescing writes to the save files
+"""
+from config import SAVE_FLUSH_INTERVAL
+from storage.json_writer import write_json_atomic, write_json_array_atomic, remove_file
+
+def write_json(path, data, save_manager=None):
+    """Write a JSON save file, off the main thread when a save manager is given
+    
+    Args:
+        path: Path of the file to write
+        data: JSON-serializable snapshot of the state
+        save_manager: SaveManager whose writer thread should do the work (optional)
+    """
+    if save_manager is not None:
+        save_manager.write_json(path, data)
+    else:
+        write_json_atomic(path, data)
+        
+def write_json_array(path, key, items, save_manager=None):
+    """Write {key: [items]} item by item, off the main thread when a save manager is given
+    
+    Args:
+        path: Path of the file to write
+        key: Name of the array in the top-level object
+        items: Iterable of JSON-serializable items, read on the writer
+            thread, so it must not change afterwards
+        save_manager: SaveManager whose writer thread should do the work (optional)
+    """
+    if save_manager is not None:
+        save_manager.call(path, lambda: write_json_array_atomic(path, key, items))
+    else:
+        write_json_array_atomic(path, key, items)
+        
+def delete_save_file(path, save_manager=None):
+    """Delete a save file, in order with any queued writes to it
+    
+    Args:
+        path: Path of the file to delete
+        save_manager: SaveManager whose writer thread should do the work (optional)
+    """
+    if save_manager is not None:
+        save_manager.delete_file(path)
+    else:
+        remove_file(path)
+
+
+class SaveManager:
+    """Collects save requests and writes each dirty file at most once per flush
+    
+    Game objects mark themselves dirty instead of writing straight away. The
+    main loop calls update() once per frame, which flushes every pending save
+    when the flush interval has passed. Scene changes and quitting flush
+    immediately, so a crash loses at most one flush window of progress.
+    
+    With a JsonWriter attached, the files themselves are written on the
+    writer's thread; otherwise they are written atomically in place. Game
+    objects that find a SqliteStore here save into it instead of JSON files.
+    """
+    
+    def __init__(self, flush_interval=SAVE_FLUSH_INTERVAL, writer=None, store=None):
+        self.flush_interval = flush_interval  # Seconds between flushes (0 = every frame)
+        self.writer = writer  # JsonWriter for background I/O (optional)
+        self.store = store  # SqliteStore used instead of JSON files (optional)
+        self.dirty = {}  # Key -> save callback
+        self.time_since_flush = 0.0
+        self.flush_count = 0
+        self.save_count = 0
+        
+    def mark_dirty(self, key, save_callback):
+        """Queue a save for the next flush
+        
+        Marking the same key again before a flush replaces the callback, so
+        several changes in one frame turn into a single write.
+        
+        Args:
+            key: Name of the state being saved (e.g. "player")
+            save_callback: Function that writes the state to disk
+        """
+        self.dirty[key] = save_callback
+        
+    def is_dirty(self, key=None):
+        """Check whether there are unsaved changes
+        
+        Args:
+            key: Only check this key (optional)
+            
+        Returns:
+            bool: True if a save is pending
+        """
+        if key is None:
+            return bool(self.dirty)
+        return key in self.dirty
+        
+    def discard(self, key):
+        """Drop a pending save without writing it
+        
+        Args:
+            key: Name of the state to drop
+        """
+        self.dirty.pop(key, None)
+        
+    def update(self, dt):
+        """Advance the flush timer and flush if the interval has passed
+        
+        Args:
+            dt: Time delta in seconds
+        """
+        self.time_since_flush += dt
+        if self.dirty and self.time_since_flush >= self.flush_interval:
+            self.flush()
+            
+    def flush(self):
+        """Write every pending save now"""
+        self.time_since_flush = 0.0
+        if not self.dirty:
+            return
+            
+        pending = self.dirty
+        self.dirty = {}
+        
+        for save_callback in pending.values():
+            save_callback()
+            
+        self.flush_count += 1
+        self.save_count += len(pending)
+        
+    def sync(self):
+        """Flush pending saves and wait until they are on disk
+        
+        Use before reading save files back in.
+        """
+        self.flush()
+        self.wait_for_writer()
+        
+    def wait_for_writer(self):
+        """Block until the writer thread has finished everything queued so far"""
+        if self.writer:
+            self.writer.flush()
+            
+    def is_pending(self, path):
+        """Check whether a queued write or removal of a file has not finished
+        
+        Args:
+            path: Path of the file
+            
+        Returns:
+            bool: True if the writer thread still has work for the path
+        """
+        if self.writer:
+            return self.writer.is_pending(path)
+        return False
+        
+    def close(self):
+        """Flush pending saves, stop the writer thread and close the store"""
+        self.flush()
+        if self.writer:
+            self.writer.close()
+        if self.store:
+            self.store.close()
+            
+    def write_json(self, path, data):
+        """Write a JSON snapshot, on the writer thread if there is one
+        
+        Args:
+            path: Path of the file to write
+            data: JSON-serializable snapshot of the state
+        """
+        if self.writer:
+            self.writer.write(path, data)
+        else:
+            write_json_atomic(path, data)
+            
+    def delete_file(self, path):
+        """Delete a file after any writes already queued for it
+        
+        Args:
+            path: Path of the file to delete
+        """
+        if self.writer:
+            self.writer.remove(path)
+        else:
+            remove_file(path)
+            
+    def call(self, name, function):
+        """Run a save function, on the writer thread if there is one
+        
+        Args:
+            name: Name the work is queued under, replacing work queued
+                under it that hasn't run yet
+            function: Function taking no arguments that does the saving
+        """
+        if self.writer:
+            self.writer.call(name, function)
+        else:
+            function()
@@ -0,0 +1,328 @@
+"""
+SQLite save store that keeps all game state in one database
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from config import (
+    SAVE_DB_FILE, SAVE_FILE, PROFILE_FILE, GAME_STATE_FILE,
+    RECIPES_FILE, INGREDIENTS_FILE
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS state (
+    section TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (section, key)
+);
+CREATE TABLE IF NOT EXISTS kitchen_items (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    cost INTEGER NOT NULL,
+    unlocked INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (kind, name)
+);
+CREATE TABLE IF NOT EXISTS recipes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    ingredients TEXT NOT NULL,
+    tools TEXT NOT NULL,
+    cooking_time INTEGER NOT NULL,
+    difficulty INTEGER NOT NULL,
+    discovered INTEGER NOT NULL
+);
+"""
+
+class SqliteStore:
+    """Transactional save store built on the standard library's sqlite3
+    
+    Player, profile and day/time data live in a key/value "state" table,
+    one section per file they used to be saved in. Kitchen items and
+    recipes get a row each, so unlocking an ingredient or discovering a
+    recipe updates one row instead of rewriting everything.
+    
+    The database runs in WAL mode with synchronous=NORMAL, so small commits
+    do not wait for an fsync. A crash can lose the last few commits but
+    never corrupts the database.
+    
+    The connection is shared with the save manager's writer thread, which
+    runs single recipe updates, so every use of it holds a lock.
+    """
+    
+    def __init__(self, path=SAVE_DB_FILE):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+        
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.connection.close()
+            
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock and commit everything done inside, or roll it all back"""
+        with self.lock, self.connection:
+            yield self.connection
+            
+    def _query(self, sql, parameters=()):
+        """Run a query under the lock and fetch every row"""
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+            
+
+    # State sections (player, profile, game_state)
+    
+    def has_section(self, section):
+        """Check whether a state section has been saved
+        
+        Args:
+            section: Name of the section (e.g. "player")
+            
+        Returns:
+            bool: True if the section has any saved values
+        """
+        rows = self._query("SELECT 1 FROM state WHERE section = ? LIMIT 1", (section,))
+        return bool(rows)
+        
+    def load_section(self, section):
+        """Load a state section
+        
+        Args:
+            section: Name of the section
+            
+        Returns:
+            dict or None: Saved values, or None if the section is empty
+        """
+        rows = self._query("SELECT key, value FROM state WHERE section = ?", (section,))
+        if not rows:
+            return None
+        return {key: json.loads(value) for key, value in rows}
+        
+    def save_section(self, section, data):
+        """Save the values of a state section
+        
+        Only keys present in data are written; other keys are left alone.
+        
+        Args:
+            section: Name of the section
+            data: Dictionary of JSON-serializable values
+        """
+        with self._transaction() as connection:
+            self._save_section(connection, section, data)
+            
+    def _save_section(self, connection, section, data):
+        connection.executemany(
+            "INSERT OR REPLACE INTO state (section, key, value) VALUES (?, ?, ?)",
+            [(section, key, json.dumps(value)) for key, value in data.items()]
+        )
+            
+    def delete_section(self, section):
+        """Delete every value in a state section
+        
+        Args:
+            section: Name of the section
+        """
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM state WHERE section = ?", (section,))
+            
+    # Kitchen
+    
+    def load_kitchen(self):
+        """Load ingredients and tools
+        
+        Returns:
+            tuple: (ingredients, tools) dictionaries keyed by name, or None if
+            nothing has been saved
+        """
+        rows = self._query("SELECT kind, name, cost, unlocked, category FROM kitchen_items ORDER BY rowid")
+        if not rows:
+            return None
+            
+        items = {"ingredient": {}, "tool": {}}
+        for kind, name, cost, unlocked, category in rows:
+            items[kind][name] = {
+                "cost": cost,
+                "unlocked": bool(unlocked),
+                "category": category
+            }
+        return items["ingredient"], items["tool"]
+        
+    def save_kitchen(self, ingredients, tools):
+        """Replace all saved ingredients and tools
+        
+        Args:
+            ingredients: Dictionary of ingredient name -> data
+            tools: Dictionary of tool name -> data
+        """
+        with self._transaction() as connection:
+            self._save_kitchen(connection, ingredients, tools)
+            
+    def _save_kitchen(self, connection, ingredients, tools):
+        rows = [
+            (kind, name, data["cost"], int(data["unlocked"]), data["category"])
+            for kind, items in (("ingredient", ingredients), ("tool", tools))
+            for name, data in items.items()
+        ]
+        connection.execute("DELETE FROM kitchen_items")
+        connection.executemany(
+            "INSERT INTO kitchen_items (kind, name, cost, unlocked, category) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+            
+    def set_item_unlocked(self, kind, name, unlocked=True):
+        """Update the unlocked flag of one ingredient or tool
+        
+        Args:
+            kind: "ingredient" or "tool"
+            name: Name of the item
+            unlocked: New unlocked state
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE kitchen_items SET unlocked = ? WHERE kind = ? AND name = ?",
+                (int(unlocked), kind, name)
+            )
+            
+    def clear_kitchen(self):
+        """Delete all saved ingredients and tools"""
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM kitchen_items")
+            
+    # Recipes
+    
+    def load_recipes(self):
+        """Load all recipes in the order they were added
+        
+        Returns:
+            list: Recipe dictionaries in the same format as Recipe.to_dict()
+        """
+        rows = self._query(
+            "SELECT name, ingredients, tools, cooking_time, difficulty, discovered "
+            "FROM recipes ORDER BY id"
+        )
+        return [
+            {
+                "name": name,
+                "ingredients": json.loads(ingredients),
+                "tools": json.loads(tools),
+                "cooking_time": cooking_time,
+                "difficulty": difficulty,
+                "discovered": bool(discovered)
+            }
+            for name, ingredients, tools, cooking_time, difficulty, discovered in rows
+        ]
+        
+    def _recipe_row(self, data):
+        return (
+            data["name"],
+            json.dumps(data["ingredients"]),
+            json.dumps(data["tools"]),
+            data["cooking_time"],
+            data["difficulty"],
+            int(data.get("discovered", False))
+        )
+        
+    def save_recipes(self, recipes):
+        """Replace all saved recipes
+        
+        Args:
+            recipes: Iterable of recipe dictionaries
+        """
+        with self._transaction() as connection:
+            self._save_recipes(connection, recipes)
+            
+    def _save_recipes(self, connection, recipes):
+        connection.execute("DELETE FROM recipes")
+        connection.executemany(
+            "INSERT INTO recipes (name, ingredients, tools, cooking_time, difficulty, discovered) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [self._recipe_row(data) for data in recipes]
+        )
+            
+    def upsert_recipe(self, data):
+        """Add a recipe, or update the saved recipe with the same name
+        
+        Args:
+            data: Recipe dictionary
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT INTO recipes (name, ingredients, tools, cooking_time, difficulty, discovered) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET ingredients = excluded.ingredients, "
+                "tools = excluded.tools, cooking_time = excluded.cooking_time, "
+                "difficulty = excluded.difficulty, discovered = excluded.discovered",
+                self._recipe_row(data)
+            )
+            
+    def clear_recipes(self):
+        """Delete all saved recipes"""
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM recipes")
+            
+    # Importing old saves
+    
+    def import_json_files(self):
+        """Copy the loose JSON save files into the database, once
+        
+        Files that are missing or unreadable are skipped. Everything is
+        imported in one transaction, together with the meta row recording
+        the import, so an interrupted import leaves nothing behind and runs
+        again next time, while later runs leave the database alone.
+        
+        Returns:
+            bool: True if an import ran
+        """
+        if self._query("SELECT value FROM meta WHERE key = 'json_imported'"):
+            return False
+            
+        with self._transaction() as connection:
+            sections = [("player", SAVE_FILE), ("profile", PROFILE_FILE), ("game_state", GAME_STATE_FILE)]
+            for section, path in sections:
+                data = self._read_json(path)
+                if data:
+                    self._save_section(connection, section, data)
+                    
+            kitchen = self._read_json(INGREDIENTS_FILE)
+            if kitchen:
+                ingredients = {item["name"]: item for item in kitchen.get("ingredients", [])}
+                tools = {item["name"]: item for item in kitchen.get("tools", [])}
+                self._save_kitchen(connection, ingredients, tools)
+                
+            recipes = self._read_json(RECIPES_FILE)
+            if recipes:
+                # Later entries win, as they did when the JSON file was loaded
+                by_name = {data["name"]: data for data in recipes.get("recipes", [])}
+                self._save_recipes(connection, by_name.values())
+                
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', '1')"
+            )
+        return True
+        
+    def _read_json(self, path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as file:
+                return json.load(file)
+        except Exception as e:
+            print(f"Error importing {path}: {e}")
+            return None
@@ -191,6 +191,24 @@ class AnimationManager:
             
         return progresses
         
+    def is_running(self, names=None):
+        """Check whether any animation is still playing
+        
+        Args:
+            names: Names of the animations to check (default: all of them)
+            
+        Returns:
+            bool: True if an animation is unfinished and not paused
+        """
+        if names is None:
+            animations = self.animations.values()
+        else:
+            animations = [self.animations[name] for name in names if name in self.animations]
+        return any(
+            not animation.finished and not animation.paused
+            for animation in animations
+        )
+        
     def reset_animation(self, name):
         """Reset an animation
         
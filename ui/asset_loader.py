@@ -0,0 +1,116 @@
+"""
+Background loading of sprite images while the loading screen shows
+"""
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from config import ASSET_LOADER_WORKERS, ASSET_CONVERT_BUDGET_MS
+from storage.asset_cache import decode_image
+
+class AssetLoader:
+    """Decodes sprite images on a pool of worker threads
+    
+    Reading and decoding an image doesn't touch the display, so it runs on
+    the workers. Converting it to the display format does, so decoded images
+    are handed back through a queue and converted by update(), a few
+    milliseconds' worth per frame, on the main thread. The game keeps
+    drawing frames (the loading screen) the whole time, however many images
+    there are.
+    """
+    
+    def __init__(self, asset_cache=None, workers=ASSET_LOADER_WORKERS):
+        self.asset_cache = asset_cache
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader")
+        self.decoded = queue.Queue()  # (name, surface or None) from the workers
+        self.surfaces = {}  # Name -> converted surface, or None if it couldn't be loaded
+        self.loaded = 0
+        self.total = 0
+        self.start_time = time.perf_counter()
+        self.load_time = None  # Seconds until every image was converted
+        
+    def load(self, images, scale=1.0):
+        """Queue images to be decoded in the background
+        
+        Args:
+            images: Dictionary of sprite name -> image path
+            scale: Scale factor for the sprites
+        """
+        for name, path in images.items():
+            self.total += 1
+            self.pool.submit(self._decode, name, path, scale)
+            
+    def _decode(self, name, path, scale):
+        """Decode one image on a worker thread, and queue it to be converted"""
+        sprite = None
+        try:
+            if self.asset_cache is not None:
+                sprite = self.asset_cache.decode_image(path, scale)
+            else:
+                sprite = decode_image(path, scale)
+        except (pygame.error, OSError):
+            pass  # Left as None, and given a placeholder
+        finally:
+            self.decoded.put((name, sprite))
+            
+    def _convert(self, name, sprite):
+        """Convert a decoded image on the main thread"""
+        self.surfaces[name] = sprite.convert_alpha() if sprite is not None else None
+        self.loaded += 1
+        if self.is_done() and self.load_time is None:
+            self.load_time = time.perf_counter() - self.start_time
+            self.pool.shutdown(wait=False)
+            
+    def update(self, budget_ms=ASSET_CONVERT_BUDGET_MS):
+        """Convert decoded images for up to budget_ms, call once per frame
+        
+        Args:
+            budget_ms: Milliseconds to spend converting this frame (at least
+                one image is converted if any is ready)
+                
+        Returns:
+            bool: True once every image is loaded
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        while not self.is_done():
+            try:
+                name, sprite = self.decoded.get_nowait()
+            except queue.Empty:
+                break
+            self._convert(name, sprite)
+            if time.perf_counter() >= deadline:
+                break
+        return self.is_done()
+        
+    def wait(self):
+        """Block until every image is loaded"""
+        while not self.is_done():
+            self._convert(*self.decoded.get())
+            
+    def is_done(self):
+        """Check whether every queued image is loaded
+        
+        Returns:
+            bool: True if nothing is left to decode or convert
+        """
+        return self.loaded == self.total
+        
+    def get_progress(self):
+        """Get how far loading is
+        
+        Returns:
+            tuple: (images loaded, images queued)
+        """
+        return self.loaded, self.total
+        
+    def get_status(self):
+        """Get what is being loaded, for the loading screen
+        
+        Returns:
+            str: Description and images loaded so far
+        """
+        return f"Loading sprites {self.loaded}/{self.total}"
+        
+    def release(self):
+        """Drop the loaded surfaces once they've been handed over, keeping the progress"""
+        self.surfaces = {}
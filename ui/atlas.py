@@ -0,0 +1,166 @@
+"""
+Packing sprites into a few large atlas surfaces
+"""
+import json
+import os
+import pygame
+from storage.json_writer import write_json_atomic
+
+LAYOUT_VERSION = 1
+
+def pack_shelves(sizes, page_size, padding=1):
+    """Pack rectangles onto pages in rows (shelves)
+    
+    Rectangles are placed tallest first, left to right along a shelf. One
+    that doesn't fit on the shelf starts a new shelf under it, and one that
+    doesn't fit under the last shelf starts a new page. A rectangle larger
+    than a page gets a page of its own.
+    
+    Args:
+        sizes: Dictionary of name -> (width, height)
+        page_size: (width, height) of a page
+        padding: Empty pixels left between rectangles
+            
+    Returns:
+        tuple: (dictionary of name -> (page, x, y, width, height), list of
+            the (width, height) each page needs)
+    """
+    page_width, page_height = page_size
+    placements = {}
+    pages = []
+    x = y = shelf_height = 0
+    
+    for name in sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name)):
+        width, height = sizes[name]
+        if pages and x + width > page_width:
+            # Start a new shelf under this one
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        if not pages or y + height > page_height:
+            pages.append([0, 0])
+            x = y = shelf_height = 0
+            
+        page = len(pages) - 1
+        placements[name] = (page, x, y, width, height)
+        pages[page][0] = max(pages[page][0], x + width)
+        pages[page][1] = max(pages[page][1], y + height)
+        x += width + padding
+        shelf_height = max(shelf_height, height + padding)
+        
+    return placements, [tuple(size) for size in pages]
+
+
+def _describe_sources(surfaces, paths):
+    """What the layout was packed from: each image file and the size it loaded at"""
+    sources = {}
+    for name, surface in surfaces.items():
+        stat = os.stat(paths[name])
+        sources[name] = {
+            "path": paths[name],
+            "mtime_ns": stat.st_mtime_ns,
+            "bytes": stat.st_size,
+            "size": list(surface.get_size())
+        }
+    return sources
+
+
+def _read_layout(layout_path, sources, page_size, padding):
+    """Get the saved layout, if it was packed from the same images the same way
+    
+    Returns:
+        tuple or None: (placements, page sizes), or None to pack again
+    """
+    if not layout_path or not os.path.exists(layout_path):
+        return None
+    try:
+        with open(layout_path, "r") as file:
+            layout = json.load(file)
+    except (OSError, ValueError):
+        return None  # Unreadable, so pack again
+        
+    if (layout.get("version") != LAYOUT_VERSION or layout.get("page_size") != list(page_size)
+            or layout.get("padding") != padding or layout.get("sources") != sources):
+        return None
+    placements = {name: tuple(placement) for name, placement in layout["sprites"].items()}
+    return placements, [tuple(size) for size in layout["pages"]]
+
+
+class SpriteAtlas:
+    """Sprites copied onto a few large pages
+    
+    Each sprite is a subsurface of its page, so hundreds of small sprites
+    are held in a handful of surfaces.
+    """
+    
+    def __init__(self, pages, placements, repacked):
+        self.pages = pages  # Page surfaces
+        self.placements = placements  # Name -> (page, x, y, width, height)
+        self.repacked = repacked  # False if the saved layout was used
+        
+    def get_rect(self, name):
+        """Get where a sprite is on its page
+        
+        Args:
+            name: Name of the sprite
+            
+        Returns:
+            tuple: (page index, pygame.Rect)
+        """
+        page, x, y, width, height = self.placements[name]
+        return page, pygame.Rect(x, y, width, height)
+
+
+def build_atlas(surfaces, paths, layout_path=None, page_size=(1024, 1024), padding=1):
+    """Copy sprites onto atlas pages, reusing the saved layout if nothing changed
+    
+    The layout is saved next to the game data with the modification time,
+    file size and loaded size of every image, and packing is skipped on the
+    next start while they all match.
+    
+    Args:
+        surfaces: Dictionary of name -> loaded sprite surface
+        paths: Dictionary of name -> image path the sprite was loaded from
+        layout_path: File the packed layout is kept in (None = don't keep it)
+        page_size: (width, height) of a page
+        padding: Empty pixels between sprites
+        
+    Returns:
+        SpriteAtlas: The packed sprites
+    """
+    sources = _describe_sources(surfaces, paths)
+    layout = _read_layout(layout_path, sources, page_size, padding)
+    repacked = layout is None
+    if repacked:
+        layout = pack_shelves({name: surface.get_size() for name, surface in surfaces.items()}, page_size, padding)
+        if layout_path:
+            try:
+                write_json_atomic(layout_path, {
+                    "version": LAYOUT_VERSION,
+                    "page_size": list(page_size),
+                    "padding": padding,
+                    "sources": sources,
+                    "pages": [list(size) for size in layout[1]],
+                    "sprites": {name: list(placement) for name, placement in layout[0].items()}
+                })
+            except Exception as e:
+                print(f"Error saving sprite atlas layout: {e}")
+                
+    placements, page_sizes = layout
+    pages = []
+    template = next(iter(surfaces.values()), None)
+    for size in page_sizes:
+        if template is not None and template.get_flags() & pygame.SRCALPHA:
+            # Made in the sprites' pixel format, so the page needs no converting
+            page = pygame.Surface(size, pygame.SRCALPHA, template)
+        else:
+            page = pygame.Surface(size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+        pages.append(page)
+        
+    # Pages start out clear and sprites don't overlap, so a plain blit
+    # copies each sprite's pixels, alpha included, as they are
+    for name, (page, x, y, width, height) in placements.items():
+        pages[page].blit(surfaces[name], (x, y))
+    return SpriteAtlas(pages, placements, repacked)
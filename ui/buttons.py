@@ -3,27 +3,100 @@ Button classes for UI elements
 """
 import pygame
 from config import BLACK, GRAY, GREEN, BLUE, RED
+from ui.fonts import get_font
+
+def _lighten(color):
+    """Slightly lighter version of an RGB color, used for hovered buttons"""
+    return tuple(min(c + 20, 255) for c in color)
+
 
 class Button:
+    """Clickable button with a text label
+    
+    Each visual state (normal, hovered, ...) is rendered to a surface the
+    first time it is drawn, so drawing a button is a single blit. The
+    surfaces are rendered again when the text, colors, font or size change.
+    Only the RGB part of the colors is used, as before.
+    """
+    
     def __init__(self, x, y, width, height, text, color=GRAY, text_color=BLACK, font_size=24):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
         self.text_color = text_color
         self.font_size = font_size
-        self.font = pygame.font.SysFont(None, font_size)
+        self.font = get_font(font_size)
         self.hovered = False
+        self._surfaces = {}  # State -> (surface, offset from rect.topleft)
+        self._surfaces_key = None
         
     def draw(self, screen):
-        # Draw button with slightly lighter color when hovered
-        current_color = tuple(min(c + 20, 255) for c in self.color) if self.hovered else self.color
-        pygame.draw.rect(screen, current_color, self.rect)
-        pygame.draw.rect(screen, BLACK, self.rect, 2)
+        surface, (dx, dy) = self._get_state_surface(self._get_state())
+        screen.blit(surface, (self.rect.x + dx, self.rect.y + dy))
+        
+    def get_draw_rect(self):
+        """Get the screen area draw() covers, which can be larger than rect"""
+        surface, (dx, dy) = self._get_state_surface(self._get_state())
+        return surface.get_rect(topleft=(self.rect.x + dx, self.rect.y + dy))
+        
+    def get_render_key(self):
+        """Get a value that changes whenever the button would look different"""
+        return self._get_state(), self._get_surfaces_key()
+        
+    def _get_state(self):
+        """Name of the visual state to draw"""
+        return "hovered" if self.hovered else "normal"
+        
+    def _get_state_color(self, state):
+        """Fill color of a visual state"""
+        color = tuple(self.color[:3])
+        return _lighten(color) if state == "hovered" else color
+        
+    def _get_surfaces_key(self):
+        """Everything the rendered state surfaces depend on"""
+        return (self.text, tuple(self.color[:3]), tuple(self.text_color[:3]), self.font, self.rect.size)
+        
+    def _get_state_surface(self, state):
+        """Get the rendered surface of a state, rendering it if needed
+        
+        Returns:
+            tuple: (surface, (x, y) offset of the surface from rect.topleft)
+        """
+        key = self._get_surfaces_key()
+        if key != self._surfaces_key:
+            self._surfaces.clear()
+            self._surfaces_key = key
+            
+        entry = self._surfaces.get(state)
+        if entry is None:
+            entry = self._surfaces[state] = self._render_state(state)
+        return entry
         
-        # Draw text
+    def _render_state(self, state):
+        """Render the button in one state
+        
+        Returns:
+            tuple: (surface, (x, y) offset of the surface from rect.topleft)
+        """
         text_surface = self.font.render(self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        
+        # Text wider than the button spills over its edges, so the surface
+        # grows to fit it and is transparent around the button
+        area = self.rect.union(text_rect)
+        if area == self.rect:
+            surface = pygame.Surface(area.size)
+        else:
+            surface = pygame.Surface(area.size, pygame.SRCALPHA)
+            # Transparent pixels take the text color, so the text's
+            # antialiased edges don't darken when blended onto them
+            surface.fill((*self.text_color[:3], 0))
+            
+        button_rect = self.rect.move(-area.x, -area.y)
+        pygame.draw.rect(surface, self._get_state_color(state), button_rect)
+        pygame.draw.rect(surface, BLACK, button_rect, 2)
+        surface.blit(text_surface, text_rect.move(-area.x, -area.y))
+        return surface, (area.x - self.rect.x, area.y - self.rect.y)
         
     def is_hovered(self, pos):
         self.hovered = self.rect.collidepoint(pos)
@@ -41,19 +114,19 @@ class ToggleButton(Button):
         self.selected = False
         self.selected_color = selected_color
         
-    def draw(self, screen):
-        # Use selected color if selected
-        current_color = self.selected_color if self.selected else self.color
-        if self.hovered and not self.selected:
-            current_color = tuple(min(c + 20, 255) for c in current_color)
-            
-        pygame.draw.rect(screen, current_color, self.rect)
-        pygame.draw.rect(screen, BLACK, self.rect, 2)
+    def _get_state(self):
+        # Selected buttons don't light up when hovered
+        if self.selected:
+            return "selected"
+        return "hovered" if self.hovered else "normal"
         
-        # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+    def _get_state_color(self, state):
+        if state == "selected":
+            return tuple(self.selected_color[:3])
+        return super()._get_state_color(state)
+        
+    def _get_surfaces_key(self):
+        return super()._get_surfaces_key() + (tuple(self.selected_color[:3]),)
         
     def toggle(self):
         self.selected = not self.selected
@@ -81,17 +154,19 @@ class ColorButton(Button):
     def __init__(self, x, y, width, height, text="", color=(255, 0, 0), text_color=BLACK, font_size=24):
         super().__init__(x, y, width, height, text, color, text_color, font_size)
         
-    def draw(self, screen):
+    def _render_state(self, state):
         # Draw color button (no text)
-        pygame.draw.rect(screen, self.color, self.rect)
-        pygame.draw.rect(screen, BLACK, self.rect, 2)
-        
-        # Draw highlight when hovered
-        if self.hovered:
-            highlight_rect = pygame.Rect(
-                self.rect.x - 2,
-                self.rect.y - 2,
-                self.rect.width + 4,
-                self.rect.height + 4
-            )
-            pygame.draw.rect(screen, (255, 255, 255), highlight_rect, 2)
+        if state != "hovered":
+            surface = pygame.Surface(self.rect.size)
+            button_rect = surface.get_rect()
+            pygame.draw.rect(surface, tuple(self.color[:3]), button_rect)
+            pygame.draw.rect(surface, BLACK, button_rect, 2)
+            return surface, (0, 0)
+            
+        # Draw highlight around the button when hovered
+        surface = pygame.Surface((self.rect.width + 4, self.rect.height + 4), pygame.SRCALPHA)
+        button_rect = self.rect.move(-self.rect.x + 2, -self.rect.y + 2)
+        pygame.draw.rect(surface, tuple(self.color[:3]), button_rect)
+        pygame.draw.rect(surface, BLACK, button_rect, 2)
+        pygame.draw.rect(surface, (255, 255, 255), surface.get_rect(), 2)
+        return surface, (-2, -2)
@@ -0,0 +1,76 @@
+"""
+Dirty rectangle tracking for scenes that only redraw what changed
+"""
+import pygame
+
+def merge_rects(rects):
+    """Merge overlapping rectangles so no area is redrawn twice
+    
+    Args:
+        rects: Iterable of pygame.Rect
+        
+    Returns:
+        list: Non-overlapping pygame.Rect covering the same area (or more)
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRegions:
+    """Remembers what each named region of the screen showed last frame
+    
+    Every frame, a scene marks each region it draws with the rect it covers
+    and a key describing its content (the text, value or state shown). A
+    region is dirty when its key or rect differs from the previous frame.
+    Regions that aren't marked in a frame are treated as removed, so their
+    old area is dirty too.
+    """
+    
+    def __init__(self):
+        self._regions = {}  # Name -> (key, rect) as of the last frame
+        self._marked = set()
+        self._dirty = []
+        
+    def mark(self, name, rect, key):
+        """Record the content of a region for this frame
+        
+        Args:
+            name: Unique name of the region
+            rect: Screen area the region covers
+            key: Hashable description of what the region shows
+            
+        Returns:
+            bool: True if the region changed since the last frame
+        """
+        rect = pygame.Rect(rect)
+        self._marked.add(name)
+        previous = self._regions.get(name)
+        if previous == (key, rect):
+            return False
+            
+        self._regions[name] = (key, rect)
+        self._dirty.append(rect)
+        if previous is not None and previous[1] != rect:
+            self._dirty.append(previous[1])  # Erase where it used to be
+        return True
+        
+    def collect(self):
+        """Finish the frame and get the areas that need redrawing
+        
+        Returns:
+            list: Non-overlapping pygame.Rect to redraw
+        """
+        for name in [name for name in self._regions if name not in self._marked]:
+            self._dirty.append(self._regions.pop(name)[1])
+            
+        rects = merge_rects(self._dirty)
+        self._dirty = []
+        self._marked = set()
+        return rects
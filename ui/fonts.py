@@ -0,0 +1,94 @@
+"""
+Process-wide registry of loaded fonts
+"""
+import time
+from collections import deque
+import pygame
+
+_fonts = {}  # (face, size) -> pygame.font.Font
+_pending = deque()  # (face, size) waiting to be warmed up
+_stats = {"hits": 0, "loads": 0, "load_time": 0.0}
+
+def get_font(size, face=None):
+    """Get a shared font, loading it the first time it is asked for
+    
+    Loading a font means finding and parsing the font file, so every part
+    of the UI shares one font object per face and size instead of creating
+    its own.
+    
+    Args:
+        size: Font size in points
+        face: Font name passed to pygame.font.SysFont (None = default font)
+        
+    Returns:
+        pygame.font.Font: Shared font
+    """
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is not None:
+        _stats["hits"] += 1
+        return font
+        
+    start = time.perf_counter()
+    font = pygame.font.SysFont(face, size)
+    _stats["load_time"] += time.perf_counter() - start
+    _stats["loads"] += 1
+    _fonts[key] = font
+    return font
+    
+def warm_up(sizes, face=None):
+    """Load fonts now so nothing has to load them mid-frame
+    
+    Args:
+        sizes: Font sizes to load
+        face: Font name (None = default font)
+    """
+    for size in sizes:
+        get_font(size, face)
+        
+def queue_warm_up(sizes, face=None):
+    """Queue fonts to be loaded a few at a time by warm_up_step()
+    
+    Args:
+        sizes: Font sizes to load
+        face: Font name (None = default font)
+    """
+    _pending.extend((face, size) for size in sizes if (face, size) not in _fonts)
+    
+def warm_up_step(count=1):
+    """Load up to count queued fonts
+    
+    Call once per frame while the game is idle, such as on the menu.
+    
+    Args:
+        count: Maximum number of fonts to load
+        
+    Returns:
+        bool: True if fonts are still queued
+    """
+    while _pending and count > 0:
+        face, size = _pending.popleft()
+        if (face, size) not in _fonts:
+            get_font(size, face)
+            count -= 1
+    return bool(_pending)
+    
+def get_font_stats():
+    """Get registry counters
+    
+    Returns:
+        dict: Fonts loaded, lookups served from the registry and the total
+            time spent loading fonts in seconds
+    """
+    return {
+        "fonts": len(_fonts),
+        "hits": _stats["hits"],
+        "loads": _stats["loads"],
+        "load_time": _stats["load_time"],
+        "pending": len(_pending)
+    }
+    
+def clear_fonts():
+    """Forget every loaded font, e.g. after pygame.font has been re-initialized"""
+    _fonts.clear()
+    _pending.clear()
@@ -0,0 +1,147 @@
+"""
+Mouse input routing through a spatial index of widgets
+"""
+import pygame
+
+# Event types the game reads. Everything else is dropped before it reaches
+# the queue, so it never wakes the idle loop or gets looped over
+GAME_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.TEXTINPUT,  # Fills in KEYDOWN's unicode for the username field
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEWHEEL,
+    pygame.VIDEORESIZE,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWFOCUSLOST,
+    pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWMINIMIZED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWHIDDEN
+]
+
+def filter_events():
+    """Only let the event types the game reads into the queue"""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(GAME_EVENTS)
+
+
+def coalesce_motion(events):
+    """Drop every MOUSEMOTION event but the last
+    
+    Only where the mouse ended up matters, and hover is worked out from
+    that once per frame.
+    
+    Args:
+        events: List of pygame events
+        
+    Returns:
+        list: The events, with at most one MOUSEMOTION
+    """
+    last_motion = None
+    for event in events:
+        if event.type == pygame.MOUSEMOTION:
+            last_motion = event
+    return [event for event in events if event.type != pygame.MOUSEMOTION or event is last_motion]
+
+
+class InputDispatcher:
+    """Finds the widget under the mouse with a grid of screen cells
+    
+    Each widget is listed in the cells its rect covers, so finding the
+    widget at a point only checks the few widgets in that point's cell,
+    however many there are. A scene keeps one dispatcher for each set of
+    widgets that respond together (the main screen, a dialog, ...), and
+    asks the active one which widget is hovered or clicked.
+    
+    Widgets need a rect and a hovered attribute.
+    """
+    
+    def __init__(self, widgets=(), cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (column, row) -> widgets covering that cell
+        self.hovered = None
+        for widget in widgets:
+            self.add(widget)
+            
+    def add(self, widget):
+        """Index a widget where it is now
+        
+        Args:
+            widget: Widget with a rect
+        """
+        for cell in self._get_cells(widget.rect):
+            self.cells.setdefault(cell, []).append(widget)
+            
+    def remove(self, widget):
+        """Stop routing input to a widget
+        
+        Args:
+            widget: Widget added before, at the same position
+        """
+        for cell in self._get_cells(widget.rect):
+            widgets = self.cells.get(cell)
+            if widgets and widget in widgets:
+                widgets.remove(widget)
+        if widget is self.hovered:
+            widget.hovered = False
+            self.hovered = None
+            
+    def _get_cells(self, rect):
+        """Get the cells a rect covers"""
+        size = self.cell_size
+        return [
+            (column, row)
+            for column in range(rect.left // size, (rect.right - 1) // size + 1)
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1)
+        ]
+        
+    def get_widget_at(self, pos):
+        """Get the widget at a screen position
+        
+        Args:
+            pos: (x, y) screen position
+            
+        Returns:
+            The widget, or None
+        """
+        cell = (int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size)
+        for widget in self.cells.get(cell, ()):
+            if widget.rect.collidepoint(pos):
+                return widget
+        return None
+        
+    def update_hover(self, pos):
+        """Mark the widget under the mouse as hovered, and no other
+        
+        Args:
+            pos: (x, y) mouse position
+            
+        Returns:
+            The hovered widget, or None
+        """
+        widget = self.get_widget_at(pos)
+        if widget is not self.hovered:
+            if self.hovered is not None:
+                self.hovered.hovered = False
+            self.hovered = widget
+        if widget is not None:
+            widget.hovered = True
+        return widget
+        
+    def get_clicked(self, event, offset=(0, 0)):
+        """Get the widget a mouse click landed on
+        
+        Args:
+            event: Pygame event
+            offset: (x, y) to subtract from the click position, for scenes
+                drawn shifted (screen shake)
+                
+        Returns:
+            The clicked widget, or None if the event isn't a click on one
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return None
+        return self.get_widget_at((event.pos[0] - offset[0], event.pos[1] - offset[1]))
@@ -0,0 +1,42 @@
+"""
+Cached static background layers for scenes
+"""
+import pygame
+
+class StaticLayers:
+    """Off-screen copy of the parts of a scene that don't change
+    
+    A scene lists the functions that draw its static layers (background
+    fill, titles, frames, ...) in the order they are painted. They are drawn
+    once to an off-screen surface, and each frame the scene blits that
+    surface instead of drawing them again, then draws its dynamic content
+    on top.
+    
+    The layers are drawn again when the screen size changes, when the key
+    passed to draw() changes (for scenes whose static content depends on a
+    page or mode), or after invalidate().
+    """
+    
+    def __init__(self, *layers):
+        self.layers = list(layers)  # Functions taking the surface to draw on
+        self.surface = None
+        self.key = None
+        
+    def invalidate(self):
+        """Draw the layers again on the next frame"""
+        self.surface = None
+        
+    def draw(self, screen, key=None):
+        """Blit the cached layers, drawing them first if needed
+        
+        Args:
+            screen: Pygame surface to render on
+            key: Hashable description of what the static layers show
+        """
+        if self.surface is None or self.surface.get_size() != screen.get_size() or key != self.key:
+            self.surface = pygame.Surface(screen.get_size())
+            for layer in self.layers:
+                layer(self.surface)
+            self.key = key
+            
+        screen.blit(self.surface, (0, 0))
@@ -0,0 +1,82 @@
+"""
+Frozen, dimmed backdrops for modal overlays
+"""
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Full-screen surfaces shared by every backdrop, since only one scene (and
+# so one modal) is drawn at a time
+_pool = {
+    "shade": None,  # Opaque black, blitted with surface alpha to dim
+    "frozen": None,  # Snapshot of the scene under the modal
+    "dimmed": None,  # Snapshot with the dimming applied
+    "owner": None  # Backdrop whose snapshot the surfaces hold
+}
+
+def dim(screen, alpha):
+    """Darken the game area of a surface
+    
+    Looks the same as blitting a (0, 0, 0, alpha) SRCALPHA surface, without
+    allocating one.
+    
+    Args:
+        screen: Pygame surface to darken
+        alpha: Darkness (0-255)
+    """
+    shade = _pool["shade"]
+    if shade is None:
+        shade = _pool["shade"] = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        shade.fill((0, 0, 0))
+    shade.set_alpha(alpha)
+    screen.blit(shade, (0, 0))
+
+
+class ModalBackdrop:
+    """The scene under a modal overlay, drawn once and reused every frame
+    
+    While a modal is open the scene under it doesn't change, so it is
+    rendered to an off-screen snapshot the first frame the modal is drawn.
+    The dimmed copy is kept as well, and only made again when the amount of
+    dimming changes (while the modal fades in or out). Scenes with
+    animations that keep playing under the modal pass a key describing
+    them, and the snapshot is taken again when it changes.
+    """
+    
+    def __init__(self):
+        self.frozen = False  # The pool holds this backdrop's current snapshot
+        self.key = None
+        self.dimmed_alpha = None
+        
+    def release(self):
+        """Take a new snapshot the next time a modal opens"""
+        self.frozen = False
+        
+    def draw(self, screen, render_scene, alpha, key=None):
+        """Draw the dimmed scene
+        
+        Args:
+            screen: Pygame surface to render on
+            render_scene: Function drawing the scene under the modal onto a surface
+            alpha: How much to dim the scene (0-255)
+            key: Hashable description of what is still animating under the modal
+        """
+        size = screen.get_size()
+        if _pool["frozen"] is None or _pool["frozen"].get_size() != size:
+            _pool["frozen"] = pygame.Surface(size)
+            _pool["dimmed"] = pygame.Surface(size)
+            self.frozen = False
+            
+        if not self.frozen or _pool["owner"] is not self or key != self.key:
+            render_scene(_pool["frozen"])
+            _pool["owner"] = self
+            self.frozen = True
+            self.key = key
+            self.dimmed_alpha = None
+            
+        dimmed = _pool["dimmed"]
+        if alpha != self.dimmed_alpha:
+            dimmed.blit(_pool["frozen"], (0, 0))
+            dim(dimmed, alpha)
+            self.dimmed_alpha = alpha
+            
+        screen.blit(dimmed, (0, 0))
@@ -0,0 +1,82 @@
+"""
+Pre-rendered glyphs for numbers that change every few frames
+"""
+import re
+import pygame
+
+# Everything a HUD number is made of: digits, the clock's colon and AM/PM,
+# the XP slash and the spaces between them
+GLYPHS = list("0123456789:/ ") + ["AM", "PM"]
+
+# A number and whatever glyphs follow it ("1250", "45/100", "9:30 AM")
+NUMBER_PATTERN = re.compile(r"\d[\d:/ ]*(?:AM|PM)?")
+GLYPH_PATTERN = re.compile(r"AM|PM|.", re.DOTALL)
+
+def split_numbers(text):
+    """Split text into its labels and its numbers
+    
+    Args:
+        text: Text such as "Coins: 1250"
+        
+    Returns:
+        list: (part, is_number) in order, such as [("Coins: ", False), ("1250", True)]
+    """
+    parts = []
+    start = 0
+    for match in NUMBER_PATTERN.finditer(text):
+        if match.start() > start:
+            parts.append((text[start:match.start()], False))
+        parts.append((match.group(), True))
+        start = match.end()
+    if start < len(text):
+        parts.append((text[start:], False))
+    return parts
+
+
+class NumeralAtlas:
+    """Every number glyph of one font and color, rendered once onto one surface
+    
+    Numbers are drawn by blitting areas of the atlas, so a counter that
+    shows a new value every frame never renders text, and costs the same
+    whatever value it shows. Glyphs are placed at their whole-pixel advance
+    width, so a digit always takes the same space, where rendering the whole
+    number can kern or round a pair of digits a pixel closer or further.
+    """
+    
+    def __init__(self, font, color):
+        self.font = font
+        self.height = font.get_height()
+        self.areas = {}  # Glyph -> area of the atlas
+        self.widths = {}  # Glyph -> advance width
+        
+        x = 0
+        for glyph in GLYPHS:
+            width = self.widths[glyph] = font.size(glyph)[0]
+            self.areas[glyph] = pygame.Rect(x, 0, width, self.height)
+            x += width
+            
+        # Filled with the text color at zero alpha, so blending the glyphs
+        # in keeps their edges the color they were rendered in
+        self.surface = pygame.Surface((x, self.height), pygame.SRCALPHA)
+        self.surface.fill((*color[:3], 0))
+        for glyph, area in self.areas.items():
+            self.surface.blit(font.render(glyph, True, color[:3]), area)
+            
+    def place(self, number, x, placed):
+        """Lay out the glyphs of a number in a line of text
+        
+        Args:
+            number: String of glyphs
+            x: Where the number starts on the line
+            placed: List to add (atlas, x, area) to for each glyph
+            
+        Returns:
+            int: Where the number ends on the line
+        """
+        surface = self.surface
+        areas = self.areas
+        widths = self.widths
+        for glyph in GLYPH_PATTERN.findall(number):
+            placed.append((surface, x, areas[glyph]))
+            x += widths[glyph]
+        return x
@@ -0,0 +1,238 @@
+"""
+Virtualized scrolling lists of items
+"""
+import pygame
+from config import BLACK
+
+class ItemGrid:
+    """Items of one size laid out in rows, shown inside a ScrollView
+    
+    Where an item goes is worked out from its index, so nothing is laid out
+    up front. Widgets for the items (buttons, ...) are made by make_widget
+    when an item scrolls into view and dropped when it scrolls out, so any
+    state they show has to come from the scene's own data.
+    """
+    
+    def __init__(self, x, item_width, item_height, columns=1, margin=0, make_widget=None):
+        self.x = x
+        self.item_width = item_width
+        self.item_height = item_height
+        self.columns = columns
+        self.margin = margin  # Space between rows and columns
+        self.make_widget = make_widget  # Function taking (item, rect), returning a widget
+        self.items = []
+        self.widgets = {}  # Index -> widget of the items in view
+        
+    def set_items(self, items):
+        """Replace the items, dropping every widget
+        
+        Args:
+            items: List of items to show
+        """
+        self.items = items
+        self.widgets = {}
+        
+    def get_row_count(self):
+        """Get the number of rows the items fill"""
+        return -(-len(self.items) // self.columns)
+        
+    def get_content_height(self):
+        """Get the height of all the rows, from the top of the first to the bottom of the last"""
+        rows = self.get_row_count()
+        if not rows:
+            return 0
+        return rows * (self.item_height + self.margin) - self.margin
+        
+    def get_rect(self, index, top):
+        """Get the rect of an item
+        
+        Args:
+            index: Index of the item
+            top: Y position of the first row
+            
+        Returns:
+            pygame.Rect: Where the item is drawn
+        """
+        row, column = divmod(index, self.columns)
+        return pygame.Rect(
+            self.x + column * (self.item_width + self.margin),
+            top + row * (self.item_height + self.margin),
+            self.item_width,
+            self.item_height
+        )
+        
+    def get_index_at(self, x, y):
+        """Get the item at a point
+        
+        Args:
+            x: X position
+            y: Y position, relative to the top of the first row
+            
+        Returns:
+            int or None: Index of the item, or None if the point is between
+                items or past the last one
+        """
+        if x < self.x or y < 0:
+            return None
+            
+        column, column_x = divmod(x - self.x, self.item_width + self.margin)
+        row, row_y = divmod(y, self.item_height + self.margin)
+        if column >= self.columns or column_x >= self.item_width or row_y >= self.item_height:
+            return None
+            
+        index = row * self.columns + column
+        return index if index < len(self.items) else None
+
+
+class ScrollView:
+    """Scrolling area showing one or more ItemGrids under one scroll offset
+    
+    Only the rows inside the view are visited: which rows are visible, and
+    which item is under the mouse, are worked out from the scroll offset
+    and the row height. Drawing and hit-testing cost the same with ten
+    items or ten thousand.
+    """
+    
+    def __init__(self, x, y, width, height, scroll_speed=20):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.scroll_speed = scroll_speed
+        self.scroll_offset = 0
+        self.grids = []
+        
+    def add_grid(self, grid):
+        """Show a grid in the view
+        
+        Args:
+            grid: ItemGrid whose first row is at the top of the view
+            
+        Returns:
+            ItemGrid: The grid
+        """
+        self.grids.append(grid)
+        return grid
+        
+    def get_max_scroll(self):
+        """Get how far the view scrolls, based on its tallest grid"""
+        content_height = max((grid.get_content_height() for grid in self.grids), default=0)
+        return max(0, content_height - self.rect.height)
+        
+    def scroll(self, amount):
+        """Scroll by a number of pixels, staying within the content
+        
+        Args:
+            amount: Pixels to scroll down (negative scrolls up)
+        """
+        self.scroll_offset = max(0, min(self.scroll_offset + amount, self.get_max_scroll()))
+        
+    def reset(self):
+        """Scroll back to the top"""
+        self.scroll_offset = 0
+        
+    def handle_event(self, event):
+        """Scroll with the mouse wheel
+        
+        Args:
+            event: Pygame event
+            
+        Returns:
+            bool: True if the event scrolled the view
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll(-event.y * self.scroll_speed)
+            return True
+        return False
+        
+    def get_visible(self, grid):
+        """Get the items of a grid that are at least partly in view
+        
+        Args:
+            grid: ItemGrid shown in the view
+            
+        Returns:
+            list: (index, screen rect) of each visible item
+        """
+        row_height = grid.item_height + grid.margin
+        first_row = max(0, (self.scroll_offset - grid.item_height) // row_height + 1)
+        end_row = min(grid.get_row_count(), -(-(self.scroll_offset + self.rect.height) // row_height))
+        
+        top = self.rect.y - self.scroll_offset
+        end = min(len(grid.items), end_row * grid.columns)
+        return [(index, grid.get_rect(index, top)) for index in range(first_row * grid.columns, end)]
+        
+    def get_widgets(self, grid):
+        """Get the widgets of the visible items, placed where they're drawn
+        
+        Widgets are made for items that scrolled into view, and dropped for
+        items that scrolled out.
+        
+        Args:
+            grid: ItemGrid shown in the view
+            
+        Returns:
+            dict: Index -> widget of each visible item
+        """
+        widgets = {}
+        for index, rect in self.get_visible(grid):
+            widget = grid.widgets.get(index)
+            if widget is None:
+                widget = grid.make_widget(grid.items[index], rect)
+            widget.rect.topleft = rect.topleft
+            widgets[index] = widget
+        grid.widgets = widgets
+        return widgets
+        
+    def get_item_at(self, pos):
+        """Get the item at a screen position
+        
+        Args:
+            pos: (x, y) screen position
+            
+        Returns:
+            tuple: (grid, index) of the item, or (None, None)
+        """
+        if not self.rect.collidepoint(pos):
+            return None, None
+            
+        y = pos[1] - self.rect.y + self.scroll_offset
+        for grid in self.grids:
+            index = grid.get_index_at(pos[0], y)
+            if index is not None:
+                return grid, index
+        return None, None
+        
+    def update_hover(self, pos):
+        """Update the hover state of the visible widgets
+        
+        Args:
+            pos: (x, y) mouse position
+        """
+        hovered_grid, hovered_index = self.get_item_at(pos)
+        for grid in self.grids:
+            if grid.make_widget is None:
+                continue
+            for index, widget in self.get_widgets(grid).items():
+                widget.hovered = grid is hovered_grid and index == hovered_index
+                
+    def draw(self, screen, grid):
+        """Draw the widgets of the visible items of a grid
+        
+        Args:
+            screen: Pygame surface to render on
+            grid: ItemGrid shown in the view
+        """
+        for widget in self.get_widgets(grid).values():
+            widget.draw(screen)
+            
+    def draw_scrollbar(self, screen):
+        """Draw the scrollbar, if there is anything to scroll
+        
+        Args:
+            screen: Pygame surface to render on
+        """
+        max_scroll = self.get_max_scroll()
+        if max_scroll > 0:
+            height = self.rect.height
+            scrollbar_height = height * (height / (height + max_scroll))
+            scrollbar_pos = self.rect.y + (self.scroll_offset / max_scroll) * (height - scrollbar_height)
+            pygame.draw.rect(screen, (150, 150, 150), (self.rect.right - 20, scrollbar_pos, 10, scrollbar_height))
+            pygame.draw.rect(screen, BLACK, (self.rect.right - 20, scrollbar_pos, 10, scrollbar_height), 1)
@@ -3,12 +3,37 @@ Sprite manager for loading and handling game sprites
 """
 import pygame
 import os
-from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from collections import OrderedDict
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, SPRITE_CACHE_BUDGET, SPRITE_ATLAS_PAGE_SIZE
+from ui.atlas import build_atlas
+from ui.fonts import get_font
 
 class SpriteManager:
-    def __init__(self):
-        self.sprites = {}
+    """Loads sprites and keeps them, and their scaled variants, within a memory budget
+    
+    Sprites and variants (a sprite scaled to a size) share one cache,
+    least recently used first. When the surfaces in it take more than
+    budget bytes, the least recently used are dropped. A dropped sprite is
+    loaded again from where it came from (its image, spritesheet or
+    placeholder) the next time it is asked for. Atlas pages count against
+    the budget too, but are kept for as long as the manager is.
+    
+    Given an AssetCache, sprite images are read from its decoded pixels
+    instead of being decoded and scaled on every start.
+    """
+    
+    def __init__(self, budget=SPRITE_CACHE_BUDGET, asset_cache=None):
+        self.sprites = OrderedDict()  # (name, size or None, smooth) -> surface
+        self.sources = {}  # Name -> ("image", path, scale), ("sheet", sheet name, rect), ("atlas", page, rect) or ("placeholder", width, height)
         self.spritesheets = {}
+        self.atlas_pages = []  # Pages of every atlas loaded
+        self.budget = budget
+        self.asset_cache = asset_cache
+        self.cache_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
         self.original_screen_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
         self.current_screen_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
         self.scale_factor_x = 1.0
@@ -25,26 +50,66 @@ class SpriteManager:
         Returns:
             bool: True if loaded successfully, False otherwise
         """
+        self.sources[name] = ("image", path, scale)
+        self._forget(name)
+        sprite = self._load_image(path, scale)
+        if sprite is None:
+            # Create a placeholder sprite
+            self.sources[name] = ("placeholder", 64, 64)
+            sprite = self._create_placeholder(name, 64, 64)
+        self._store((name, None, False), sprite)
+        return self.sources[name][0] == "image"
+        
+    def load_sprites(self, images, loaded=None):
+        """Load sprite images, each as its own surface
+        
+        Args:
+            images: Dictionary of sprite name -> image path
+            loaded: Dictionary of sprite name -> surface (or None if it
+                couldn't be loaded) already loaded, such as by an
+                AssetLoader. Images not in it are loaded here
+                
+        Returns:
+            int: Number of sprites loaded from their images
+        """
+        loaded = loaded or {}
+        count = 0
+        for name, path in images.items():
+            if name not in loaded:
+                count += self.load_sprite(name, path)
+                continue
+                
+            self.sources[name] = ("image", path, 1.0)
+            self._forget(name)
+            sprite = loaded[name]
+            if sprite is None:
+                self.sources[name] = ("placeholder", 64, 64)
+                sprite = self._create_placeholder(name, 64, 64)
+            else:
+                count += 1
+            self._store((name, None, False), sprite)
+        return count
+        
+    def _load_image(self, path, scale):
+        """Load and scale a sprite image
+        
+        Returns:
+            Surface or None: The sprite, or None if it couldn't be loaded
+        """
         try:
+            if self.asset_cache is not None:
+                return self.asset_cache.load_image(path, scale)
             if os.path.exists(path):
                 sprite = pygame.image.load(path).convert_alpha()
                 
                 # Scale the sprite
                 width = int(sprite.get_width() * scale)
                 height = int(sprite.get_height() * scale)
-                sprite = pygame.transform.scale(sprite, (width, height))
-                
-                self.sprites[name] = sprite
-                return True
-            else:
-                # Create a placeholder sprite
-                self._create_placeholder(name, 64, 64)
-                return False
+                return pygame.transform.scale(sprite, (width, height))
         except pygame.error:
-            # Create a placeholder sprite
-            self._create_placeholder(name, 64, 64)
-            return False
-            
+            pass
+        return None
+        
     def _create_placeholder(self, name, width, height):
         """Create a placeholder sprite
         
@@ -52,6 +117,9 @@ class SpriteManager:
             name: Name to reference the sprite
             width: Width of the placeholder
             height: Height of the placeholder
+            
+        Returns:
+            Surface: The placeholder
         """
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
@@ -61,12 +129,12 @@ class SpriteManager:
         
         # Add text if the font module is initialized
         if pygame.font.get_init():
-            font = pygame.font.SysFont(None, 14)
+            font = get_font(14)
             text = font.render(name, True, (0, 0, 0))
             text_rect = text.get_rect(center=(width // 2, height // 2))
             surface.blit(text, text_rect)
             
-        self.sprites[name] = surface
+        return surface
         
     def load_spritesheet(self, name, path, sprite_width, sprite_height, rows, cols):
         """Load a spritesheet and split it into individual sprites
@@ -86,32 +154,86 @@ class SpriteManager:
             if os.path.exists(path):
                 sheet = pygame.image.load(path).convert_alpha()
                 self.spritesheets[name] = sheet
-                
-                # Split the spritesheet into individual sprites
-                for row in range(rows):
-                    for col in range(cols):
-                        x = col * sprite_width
-                        y = row * sprite_height
-                        sprite = sheet.subsurface(pygame.Rect(x, y, sprite_width, sprite_height))
-                        sprite_name = f"{name}_{row}_{col}"
-                        self.sprites[sprite_name] = sprite
-                        
-                return True
+                loaded = True
             else:
-                # Create placeholder sprites
-                for row in range(rows):
-                    for col in range(cols):
-                        sprite_name = f"{name}_{row}_{col}"
-                        self._create_placeholder(sprite_name, sprite_width, sprite_height)
-                return False
+                loaded = False
         except pygame.error:
-            # Create placeholder sprites
-            for row in range(rows):
-                for col in range(cols):
-                    sprite_name = f"{name}_{row}_{col}"
-                    self._create_placeholder(sprite_name, sprite_width, sprite_height)
-            return False
+            loaded = False
             
+        # The sprites are cut out of the sheet, or made as placeholders,
+        # when they are first asked for
+        for row in range(rows):
+            for col in range(cols):
+                sprite_name = f"{name}_{row}_{col}"
+                if loaded:
+                    rect = pygame.Rect(col * sprite_width, row * sprite_height, sprite_width, sprite_height)
+                    self.sources[sprite_name] = ("sheet", name, rect)
+                else:
+                    self.sources[sprite_name] = ("placeholder", sprite_width, sprite_height)
+                self._forget(sprite_name)
+        return loaded
+        
+    def load_atlas(self, images, layout_path=None, loaded=None):
+        """Load sprite images packed together onto a few atlas pages
+        
+        Each sprite is handed out by get_sprite() as a subsurface of its
+        page. Images that can't be loaded get placeholders, as with
+        load_sprite().
+        
+        This is for large sprite sets, such as food icons, customer
+        portraits or chef animation frames, where hundreds of small
+        surfaces would otherwise be kept. Copying onto the pages costs more
+        than it saves for a handful of sprites, so the profile pictures
+        loaded at startup go through load_sprites() instead.
+        
+        Args:
+            images: Dictionary of sprite name -> image path
+            layout_path: File the packed layout is kept in between runs, so
+                packing is skipped while the images are unchanged
+            loaded: Dictionary of sprite name -> surface (or None if it
+                couldn't be loaded) already loaded, such as by an
+                AssetLoader. Images not in it are loaded here
+                
+        Returns:
+            int: Number of sprites loaded from their images
+        """
+        loaded = loaded or {}
+        surfaces = {}
+        for name, path in images.items():
+            if name in loaded:
+                sprite = loaded[name]
+            else:
+                sprite = self._load_image(path, 1.0)
+            if sprite is not None:
+                surfaces[name] = sprite
+            else:
+                self.sources[name] = ("placeholder", 64, 64)
+                self._forget(name)
+                
+        atlas = build_atlas(surfaces, images, layout_path, (SPRITE_ATLAS_PAGE_SIZE, SPRITE_ATLAS_PAGE_SIZE))
+        first_page = len(self.atlas_pages)
+        self.atlas_pages.extend(atlas.pages)
+        self.cache_bytes += sum(self._get_bytes(page) for page in atlas.pages)
+        for name in surfaces:
+            page, rect = atlas.get_rect(name)
+            self.sources[name] = ("atlas", first_page + page, rect)
+            self._forget(name)
+        return len(surfaces)
+        
+    def _load_sprite(self, name):
+        """Make a sprite from its source, or a placeholder for unknown names"""
+        source = self.sources.get(name, ("placeholder", 64, 64))
+        if source[0] == "image":
+            sprite = self._load_image(source[1], source[2])
+            if sprite is not None:
+                return sprite
+            source = self.sources[name] = ("placeholder", 64, 64)
+        elif source[0] == "sheet":
+            return self.spritesheets[source[1]].subsurface(source[2])
+        elif source[0] == "atlas":
+            return self.atlas_pages[source[1]].subsurface(source[2])
+        return self._create_placeholder(name, source[1], source[2])
+        
     def get_sprite(self, name):
         """Get a sprite by name
         
@@ -121,13 +243,108 @@ class SpriteManager:
         Returns:
             Surface: The sprite surface or a placeholder if not found
         """
-        if name in self.sprites:
-            return self.sprites[name]
+        key = (name, None, False)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.cache_hits += 1
+            return sprite
+            
+        self.cache_misses += 1
+        sprite = self._load_sprite(name)
+        self._store(key, sprite)
+        return sprite
+        
+    def get_scaled_sprite(self, name, width, height, smooth=False):
+        """Get a sprite scaled to a size, scaling it only the first time
+        
+        Args:
+            name: Name of the sprite
+            width: Width to scale to
+            height: Height to scale to
+            smooth: Use smoothscale instead of scale
+            
+        Returns:
+            Surface: The scaled sprite, shared, so blit it rather than modify it
+        """
+        key = (name, (width, height), smooth)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.cache_hits += 1
+            return sprite
+            
+        base = self.get_sprite(name)
+        if base.get_size() == (width, height):
+            return base
+            
+        self.cache_misses += 1
+        if smooth:
+            sprite = pygame.transform.smoothscale(base, (width, height))
         else:
-            # Create a placeholder if the sprite doesn't exist
-            self._create_placeholder(name, 64, 64)
-            return self.sprites[name]
+            sprite = pygame.transform.scale(base, (width, height))
+        self._store(key, sprite)
+        return sprite
+        
+    def _store(self, key, sprite):
+        """Add a surface to the cache, dropping the least recently used over the budget"""
+        old = self.sprites.pop(key, None)
+        if old is not None:
+            self.cache_bytes -= self._get_bytes(old)
+        self.sprites[key] = sprite
+        self.cache_bytes += self._get_bytes(sprite)
+        
+        # The surface just added stays, even on its own over the budget
+        while self.cache_bytes > self.budget and len(self.sprites) > 1:
+            _, evicted = self.sprites.popitem(last=False)
+            size = self._get_bytes(evicted)
+            self.cache_bytes -= size
+            self.evicted_bytes += size
+            self.evictions += 1
             
+    def _forget(self, name):
+        """Drop a sprite and its variants, after its source changes"""
+        for key in [key for key in self.sprites if key[0] == name]:
+            self.cache_bytes -= self._get_bytes(self.sprites.pop(key))
+            
+    def _get_bytes(self, surface):
+        """Memory taken by a surface's pixels, or for a spritesheet sprite the part of the sheet it shows
+        
+        An atlas sprite takes nothing of its own, as its page is counted
+        once when the atlas is loaded.
+        """
+        parent = surface.get_parent()
+        if parent is not None and any(parent is page for page in self.atlas_pages):
+            return 0
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+        
+    def get_cache_stats(self):
+        """Get sprite cache counters
+        
+        Returns:
+            dict: Hits, misses, hit rate, number of cached surfaces, bytes they
+                and the atlas pages take, the budget, and surfaces and bytes
+                evicted
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "entries": len(self.sprites),
+            "bytes": self.cache_bytes,
+            "budget": self.budget,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes
+        }
+        
+    def reset_cache_stats(self):
+        """Reset the hit, miss and eviction counters, keeping the cached surfaces"""
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        
     def update_screen_size(self, width, height):
         """Update the scale factors based on new screen size
         
@@ -2,17 +2,140 @@
 Text rendering utilities for the game
 """
 import pygame
-from config import BLACK, WHITE, RED, YELLOW, GREEN
+from collections import OrderedDict
+from config import BLACK, WHITE, RED, YELLOW, GREEN, TEXT_CACHE_SIZE, TEXT_LAYOUT_CACHE_SIZE, COUNTER_CACHE_SIZE
+from ui.fonts import get_font
+from ui.numerals import NumeralAtlas, split_numbers
+
+# Line breaks of wrapped text, shared by every TextRenderer, least recently
+# used first
+_layouts = OrderedDict()  # (text, font, max_width) -> tuple of lines
+
+def wrap_lines(text, font, max_width=None):
+    """Break text into lines that fit within a width
+    
+    Newlines always start a new line. Words are measured with the font, and
+    a word wider than max_width gets a line of its own. The lines of each
+    (text, font, max_width) are worked out once and kept, so text wrapped
+    every frame is only measured the first time.
+    
+    Args:
+        text: Text to break
+        font: Pygame font the text is drawn with
+        max_width: Maximum line width in pixels, or None to only break at newlines
+        
+    Returns:
+        tuple: Lines of text
+    """
+    key = (text, font, max_width)
+    lines = _layouts.get(key)
+    if lines is not None:
+        _layouts.move_to_end(key)
+        return lines
+        
+    lines = []
+    for paragraph in text.split("\n"):
+        if max_width is None:
+            lines.append(paragraph)
+            continue
+            
+        line = ""
+        for word in paragraph.split():
+            candidate = line + " " + word if line else word
+            if line and font.size(candidate)[0] > max_width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+        
+    lines = _layouts[key] = tuple(lines)
+    if len(_layouts) > TEXT_LAYOUT_CACHE_SIZE:
+        _layouts.popitem(last=False)
+    return lines
+
 
 class TextRenderer:
-    def __init__(self):
+    def __init__(self, cache_size=TEXT_CACHE_SIZE, counter_cache_size=COUNTER_CACHE_SIZE):
         self.fonts = {
-            'small': pygame.font.SysFont(None, 24),
-            'medium': pygame.font.SysFont(None, 32),
-            'large': pygame.font.SysFont(None, 48),
-            'title': pygame.font.SysFont(None, 64)
+            'small': get_font(24),
+            'medium': get_font(32),
+            'large': get_font(48),
+            'title': get_font(64)
         }
         
+        # Rendered text surfaces, least recently used first
+        self.cache = OrderedDict()  # (text, size, RGB color) -> surface
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Number glyphs for counters, one atlas per size and RGB color, and
+        # the surfaces of the latest counter values, least recently used first
+        self.atlases = {}  # (size, RGB color) -> NumeralAtlas
+        self.counters = OrderedDict()  # (text, size, RGB color) -> surface
+        self.counter_cache_size = counter_cache_size
+        
+    def get_text_surface(self, text, size, color):
+        """Get the rendered surface for a piece of text
+        
+        Surfaces are cached by text, size and RGB color, so text that is
+        drawn every frame is only rasterized once. An RGBA color reuses the
+        opaque surface and applies its alpha with set_alpha. The surface is
+        shared, so callers should blit it rather than modify it.
+        
+        Args:
+            text: Text string to render
+            size: Font size ('small', 'medium', 'large', 'title')
+            color: RGB or RGBA color tuple
+            
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        if size not in self.fonts:
+            size = 'medium'
+        key = (text, size, tuple(color[:3]))
+        
+        text_surface = self.cache.get(key)
+        if text_surface is not None:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            text_surface = self.fonts[size].render(text, True, key[2])
+            self.cache[key] = text_surface
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+                
+        # The same surface serves every alpha, so set it on each use
+        text_surface.set_alpha(color[3] if len(color) == 4 else 255)
+        return text_surface
+        
+    def get_cache_stats(self):
+        """Get text cache counters
+        
+        Returns:
+            dict: Hits, misses, hit rate and number of cached surfaces
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "entries": len(self.cache)
+        }
+        
+    def reset_cache_stats(self):
+        """Reset the hit and miss counters, keeping the cached surfaces"""
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+    def clear_cache(self):
+        """Drop every cached text and counter surface, and the numeral atlases"""
+        self.cache.clear()
+        self.counters.clear()
+        self.atlases.clear()
+        
     def render_text(self, screen, text, size, color, x, y, align="left"):
         """Render text with specified parameters
         
@@ -24,28 +147,188 @@ class TextRenderer:
             x, y: Position coordinates
             align: Text alignment ('left', 'center', 'right')
         """
-        font = self.fonts.get(size, self.fonts['medium'])
+        text_surface = self.get_text_surface(text, size, color)
+        text_rect = self._align_rect(text_surface.get_size(), x, y, align)
+        screen.blit(text_surface, text_rect)
+        return text_rect
         
-        # Handle RGBA colors
-        if len(color) == 4:
-            # Create a surface with per-pixel alpha
-            text_surface = font.render(text, True, color[:3])
-            alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-            alpha_surface.fill((255, 255, 255, color[3]))
-            text_surface.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        else:
-            text_surface = font.render(text, True, color)
+    def get_text_rect(self, text, size, x, y, align="left"):
+        """Get the area render_text would cover, without drawing
         
+        Args:
+            text: Text string
+            size: Font size ('small', 'medium', 'large', 'title')
+            x, y: Position coordinates
+            align: Text alignment ('left', 'center', 'right')
+            
+        Returns:
+            pygame.Rect: Area covered by the text
+        """
+        return self._align_rect(self.get_text_surface(text, size, BLACK).get_size(), x, y, align)
+        
+    def _align_rect(self, text_size, x, y, align):
+        text_rect = pygame.Rect((0, 0), text_size)
         if align == "center":
-            text_rect = text_surface.get_rect(center=(x, y))
+            text_rect.center = (x, y)
         elif align == "right":
-            text_rect = text_surface.get_rect(right=x, centery=y)
+            text_rect.right = x
+            text_rect.centery = y
         else:  # left align
-            text_rect = text_surface.get_rect(left=x, centery=y)
+            text_rect.left = x
+            text_rect.centery = y
+        return text_rect
+        
+    def get_numeral_atlas(self, size, color):
+        """Get the number glyphs of a font size and color, rendering them the first time
+        
+        Args:
+            size: Font size ('small', 'medium', 'large', 'title')
+            color: RGB color tuple
             
-        screen.blit(text_surface, text_rect)
+        Returns:
+            NumeralAtlas: Glyphs in the color
+        """
+        if size not in self.fonts:
+            size = 'medium'
+        key = (size, tuple(color[:3]))
+        
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = NumeralAtlas(self.fonts[size], key[1])
+        return atlas
+        
+    def get_counter_surface(self, text, size, color):
+        """Get the surface for text with numbers that change often, such as "Coins: 1250"
+        
+        A new value is put together from the glyph atlas with one
+        Surface.blits call, so it never renders text, and the labels come
+        from the text cache. The surfaces of the last few values are kept in
+        a small cache of their own, so a counter that stays the same is one
+        blit a frame, and values that are shown once don't push out the text
+        cache. Looks like the surface from get_text_surface(), give or take
+        a pixel between digits (see NumeralAtlas).
+        
+        Args:
+            text: Text string to render
+            size: Font size ('small', 'medium', 'large', 'title')
+            color: RGB or RGBA color tuple
+            
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        if size not in self.fonts:
+            size = 'medium'
+        key = (text, size, tuple(color[:3]))
+        
+        counter_surface = self.counters.get(key)
+        if counter_surface is not None:
+            self.counters.move_to_end(key)
+        else:
+            counter_surface = self.counters[key] = self._compose_counter(text, size, key[2])
+            if len(self.counters) > self.counter_cache_size:
+                self.counters.popitem(last=False)
+                
+        counter_surface.set_alpha(color[3] if len(color) == 4 else 255)
+        return counter_surface
+        
+    def _compose_counter(self, text, size, color):
+        """Put together the surface of a counter from its labels and the glyph atlas"""
+        atlas = self.get_numeral_atlas(size, color)
+        placed = []  # (surface, x, area) of each label and glyph
+        width = 0
+        height = atlas.height
+        for part, is_number in split_numbers(text):
+            if is_number:
+                width = atlas.place(part, width, placed)
+            else:
+                label_surface = self.get_text_surface(part, size, color)
+                placed.append((label_surface, width, None))
+                width += label_surface.get_width()
+                height = max(height, label_surface.get_height())
+                
+        # The pieces don't overlap and the new surface is clear, so they are
+        # copied in as they are rather than alpha blended
+        counter_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        counter_surface.blits(
+            [(surface, (x, 0), area, pygame.BLEND_RGBA_MAX) for surface, x, area in placed],
+            doreturn=False
+        )
+        return counter_surface
+        
+    def render_counter(self, screen, text, size, color, x, y, align="left"):
+        """Render text with numbers that change often, see get_counter_surface()
+        
+        Args:
+            screen: Pygame surface to render on
+            text: Text string to render
+            size: Font size ('small', 'medium', 'large', 'title')
+            color: RGB or RGBA color tuple
+            x, y: Position coordinates
+            align: Text alignment ('left', 'center', 'right')
+            
+        Returns:
+            pygame.Rect: Area covered by the text
+        """
+        counter_surface = self.get_counter_surface(text, size, color)
+        text_rect = self._align_rect(counter_surface.get_size(), x, y, align)
+        screen.blit(counter_surface, text_rect)
         return text_rect
         
+    def get_counter_rect(self, text, size, x, y, align="left"):
+        """Get the area render_counter would cover, without drawing
+        
+        Args:
+            text: Text string
+            size: Font size ('small', 'medium', 'large', 'title')
+            x, y: Position coordinates
+            align: Text alignment ('left', 'center', 'right')
+            
+        Returns:
+            pygame.Rect: Area covered by the text
+        """
+        return self._align_rect(self.get_counter_surface(text, size, BLACK).get_size(), x, y, align)
+        
+    def wrap_text(self, text, size, max_width=None):
+        """Get the lines text breaks into, see wrap_lines()
+        
+        Args:
+            text: Text string
+            size: Font size ('small', 'medium', 'large', 'title')
+            max_width: Maximum line width in pixels, or None to only break at newlines
+            
+        Returns:
+            tuple: Lines of text
+        """
+        return wrap_lines(text, self.fonts.get(size, self.fonts['medium']), max_width)
+        
+    def render_text_block(self, screen, text, size, color, x, y, max_width=None, line_height=None, align="left"):
+        """Render text over several lines
+        
+        The line breaks come from wrap_text() and each line's surface from
+        the text cache, so a block drawn every frame costs one blit a line.
+        
+        Args:
+            screen: Pygame surface to render on
+            text: Text string to render, with newlines between paragraphs
+            size: Font size ('small', 'medium', 'large', 'title')
+            color: RGB or RGBA color tuple
+            x, y: Position of the first line, as for render_text
+            max_width: Maximum line width in pixels, or None to only break at newlines
+            line_height: Distance between lines, defaults to the font height
+            align: Text alignment ('left', 'center', 'right')
+            
+        Returns:
+            int: y position of the line after the block
+        """
+        if line_height is None:
+            line_height = self.fonts.get(size, self.fonts['medium']).get_height()
+            
+        for line in self.wrap_text(text, size, max_width):
+            if line:
+                self.render_text(screen, line, size, color, x, y, align)
+            y += line_height
+        return y
+        
     def render_multiline(self, screen, text_lines, size, color, x, y, line_spacing=5, align="left"):
         """Render multiple lines of text
         
@@ -59,11 +342,11 @@ class TextRenderer:
             align: Text alignment ('left', 'center', 'right')
         """
         font = self.fonts.get(size, self.fonts['medium'])
-        height = font.get_height() + line_spacing
+        self.render_text_block(
+            screen, "\n".join(text_lines), size, color, x, y,
+            line_height=font.get_height() + line_spacing, align=align
+        )
         
-        for i, line in enumerate(text_lines):
-            self.render_text(screen, line, size, color, x, y + i * height, align)
-            
     def render_wrapped_text(self, screen, text, size, color, x, y, max_width, align="left"):
         """Render text wrapped to fit within a maximum width
         
@@ -76,29 +359,8 @@ class TextRenderer:
             max_width: Maximum width in pixels
             align: Text alignment ('left', 'center', 'right')
         """
-        font = self.fonts.get(size, self.fonts['medium'])
-        words = text.split(' ')
-        lines = []
-        current_line = ""
+        self.render_text_block(screen, text, size, color, x, y, max_width, align=align)
         
-        for word in words:
-            test_line = current_line + word + " "
-            test_width = font.size(test_line)[0]
-            
-            if test_width <= max_width:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word + " "
-                
-        if current_line:
-            lines.append(current_line)
-            
-        line_height = font.get_height()
-        
-        for i, line in enumerate(lines):
-            self.render_text(screen, line, size, color, x, y + i * line_height, align)
-            
     def render_patience_bar(self, screen, x, y, width, height, patience_pct):
         """Render a patience bar with color based on percentage
         
@@ -1,4 +1,5 @@
 import pygame
+from ui.fonts import get_font
 
 class UI:
     def __init__(self, player, customer_system):
@@ -11,8 +12,8 @@ class UI:
         
     def render_main_menu(self, screen):
         # Draw title
-        font_large = pygame.font.SysFont(None, 64)
-        font = pygame.font.SysFont(None, 32)
+        font_large = get_font(64)
+        font = get_font(32)
         
         title = font_large.render("Kusina ni Jai", True, (0, 0, 0))
         screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 200))
@@ -35,7 +36,7 @@ class UI:
         
     def render_game(self, screen):
         # Draw player info
-        font = pygame.font.SysFont(None, 24)
+        font = get_font(24)
         
         # Draw coins
         coins_text = font.render(f"Coins: {self.player.coins}", True, (0, 0, 0))
@@ -70,8 +71,8 @@ class UI:
         screen.fill((240, 240, 240))
         
         # Draw title
-        font_large = pygame.font.SysFont(None, 48)
-        font = pygame.font.SysFont(None, 24)
+        font_large = get_font(48)
+        font = get_font(24)
         
         title = font_large.render("Upgrade Shop", True, (0, 0, 0))
         screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 50))